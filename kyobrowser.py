@@ -1,31 +1,70 @@
 import sys
 import os
 import json
+import random
+import argparse
+import tempfile
+import tracemalloc
+import time
 import shutil
+import re
+import zlib
+import base64
+import queue
+import hashlib
+import functools
+import html
+import threading
+import sqlite3
+import heapq
+import gzip
+import io
+from collections import deque
 from datetime import datetime, timedelta
-from urllib.parse import quote_plus
-
-from PySide6.QtCore import QUrl, QSize, Qt, Signal, QEvent, QProcess, QTimer
-from PySide6.QtGui import QAction, QDesktopServices, QKeySequence, QIcon, QPalette
+from urllib.parse import quote_plus, urlsplit, urlunsplit, parse_qs, urlencode
+from html.parser import HTMLParser
+from urllib.request import pathname2url
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from PySide6.QtCore import (
+    QUrl, QSize, Qt, Signal, QEvent, QProcess, QTimer, QObject, QRunnable, QThreadPool, QPoint, QCoreApplication,
+    QBuffer, QIODevice, QEventLoop, QFile, Slot, QByteArray, QDataStream,
+    QAbstractListModel, QModelIndex, QSortFilterProxyModel
+)
+from PySide6.QtGui import QAction, QDesktopServices, QKeySequence, QIcon, QPalette, QPixmap, QStandardItemModel, QStandardItem
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QLineEdit, QToolBar, QFileDialog,
     QLabel, QTabWidget, QDialog, QTableWidget, QTableWidgetItem,
     QVBoxLayout, QWidget, QHBoxLayout, QPushButton,
     QMenu, QToolButton, QMessageBox, QTabBar, QCheckBox,
     QFormLayout, QDialogButtonBox, QComboBox, QSpinBox, QGroupBox,
-    QAbstractSpinBox
+    QAbstractSpinBox, QListWidget, QListWidgetItem, QListView, QDockWidget, QProgressDialog,
+    QCompleter
 )
 from PySide6.QtWebEngineCore import (
-    QWebEngineProfile, QWebEnginePage, QWebEngineDownloadRequest, QWebEngineUrlRequestInterceptor
+    QWebEngineProfile, QWebEnginePage, QWebEngineDownloadRequest, QWebEngineUrlRequestInterceptor,
+    QWebEngineUrlScheme, QWebEngineUrlSchemeHandler, QWebEngineUrlRequestJob, QWebEngineUrlRequestInfo,
+    QWebEngineScript
 )
 from PySide6.QtWebEngineWidgets import QWebEngineView
+from PySide6.QtWebChannel import QWebChannel
+from PySide6.QtNetwork import QLocalServer, QLocalSocket, QNetworkCookie
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
 
 # 🖼️ 작업표시줄 AppUserModelID (Windows)
 if os.name == "nt":
     import ctypes
     ctypes.windll.shell32.SetCurrentProcessExplicitAppUserModelID("Kyo.Browser")
 
+# 창이 뜰 때까지 걸린 시간(time-to-window)의 기준점
+PROCESS_STARTED_AT = time.perf_counter()
 HOME_URL = "https://www.google.com"
+KYO_SCHEME = b"kyo"
+NEW_TAB_URL = "kyo://newtab"
 APP_VERSION = "1.1"
 
 # ------------------------------------------------------
@@ -42,13 +81,80 @@ BOOKMARK_FILE = os.path.join(USER_DATA_DIR, "bookmarks.json")
 SETTINGS_FILE = os.path.join(USER_DATA_DIR, "settings.json")
 SESSION_FILE = os.path.join(USER_DATA_DIR, "session.json")
 HISTORY_FILE = os.path.join(USER_DATA_DIR, "history.json")
-
-MAX_RECENT_CLOSED = 20
+THUMBNAIL_DIR = os.path.join(USER_DATA_DIR, "thumbnails")
+NAV_TIMING_FILE = os.path.join(USER_DATA_DIR, "nav_timing.json")
+CONTENT_INDEX_DIR = os.path.join(USER_DATA_DIR, "content_index")
+ARCHIVE_DIR = os.path.join(USER_DATA_DIR, "archive")
+CRASH_STATS_FILE = os.path.join(USER_DATA_DIR, "crash_stats.json")
+
+def use_user_data_dir(path):
+    # 벤치마크 등에서 실제 사용자 데이터와 분리된 폴더를 쓰도록 경로를 다시 지정
+    global USER_DATA_DIR, BOOKMARK_FILE, SETTINGS_FILE, SESSION_FILE, HISTORY_FILE, THUMBNAIL_DIR, NAV_TIMING_FILE
+    global CONTENT_INDEX_DIR, ARCHIVE_DIR, CRASH_STATS_FILE
+    os.makedirs(path, exist_ok=True)
+    USER_DATA_DIR = path
+    BOOKMARK_FILE = os.path.join(path, "bookmarks.json")
+    SETTINGS_FILE = os.path.join(path, "settings.json")
+    SESSION_FILE = os.path.join(path, "session.json")
+    HISTORY_FILE = os.path.join(path, "history.json")
+    THUMBNAIL_DIR = os.path.join(path, "thumbnails")
+    NAV_TIMING_FILE = os.path.join(path, "nav_timing.json")
+    CONTENT_INDEX_DIR = os.path.join(path, "content_index")
+    ARCHIVE_DIR = os.path.join(path, "archive")
+    CRASH_STATS_FILE = os.path.join(path, "crash_stats.json")
+
+RECENT_CLOSED_MENU_ITEMS = 15
+MAX_RECENT_CLOSED_KB = 64 * 1024
+PLUS_TAB_MARK = "kyo:plus-tab"
+UI_FRAME_MS = 16
+TAB_TEXT_TIMEOUT_MS = 5000
+DOWNLOAD_PROGRESS_MS = 250
+SESSION_HISTORY_MAX_BYTES = 48 * 1024
+NEW_TAB_TOP_SITES = 8
+NEW_TAB_BOOKMARKS = 24
+INSTANCE_FORWARD_TIMEOUT_MS = 10_000
 DEFAULT_ZOOM = 100
 MIN_ZOOM = 80
 MAX_ZOOM = 200
 ZOOM_STEP = 10
 
+THUMBNAIL_WIDTH = 320
+THUMBNAIL_HEIGHT = 200
+THUMBNAIL_QUALITY = 80
+THUMBNAIL_CACHE_MAX_BYTES = 48 * 1024 * 1024
+THUMBNAIL_SETTLE_MS = 600
+THUMBNAIL_MIN_INTERVAL_MS = 3000
+THUMBNAIL_CAPTURE_BUDGET_MS = 12
+NAV_TIMING_MAX_PER_HOST = 500
+CRASH_RELOAD_BASE_MS = 1000
+CRASH_MAX_RELOADS = 3
+CRASH_RESET_AFTER_S = 300
+CRASH_MAX_EVENTS = 500
+CONTENT_INDEX_SHARDS = 32
+CONTENT_INDEX_MAX_BYTES = 64 * 1024 * 1024
+CONTENT_INDEX_MAX_CHARS = 200_000
+CONTENT_INDEX_MAX_TOKENS = 8000
+CONTENT_INDEX_FLUSH_MS = 30_000
+MAX_HTTP_CACHE_MB = 16 * 1024
+CACHE_TRIM_POLL_MS = 2000
+CACHE_TRIM_MAX_S = 600
+ARCHIVE_CONCURRENCY = 2
+ARCHIVE_TIMEOUT_S = 60
+ARCHIVE_SETTLE_MS = 1500
+MAX_ARCHIVE_MB = 64 * 1024
+ARCHIVE_REFRESH_DELAY_MS = 60_000
+HOVER_PREFETCH_MODES = ("off", "preconnect", "prefetch")
+HOVER_INTENT_MS = {"preconnect": 100, "prefetch": 250}
+# Chromium 은 쓰지 않은 미리 연결 소켓을 10초 뒤 닫고, 프리페치한 문서는 5분 동안 재사용함
+HOVER_WARM_TTL_S = {"preconnect": 10, "prefetch": 300}
+HOVER_PREFETCH_BUDGET_PER_MIN = 12
+OMNIBOX_MAX_ROWS = 8
+HTTP_CACHE_TYPES = {
+    "disk": QWebEngineProfile.HttpCacheType.DiskHttpCache,
+    "memory": QWebEngineProfile.HttpCacheType.MemoryHttpCache,
+    "none": QWebEngineProfile.HttpCacheType.NoCache,
+}
+
 DEFAULT_SETTINGS = {
     "restore_session": False,
     "show_bookmarks_toolbar": True,
@@ -56,6 +162,15 @@ DEFAULT_SETTINGS = {
     "home_url": HOME_URL,
     "default_zoom": DEFAULT_ZOOM,
     "history_retention_days": 90,
+    "perf_monitor": False,
+    "index_page_content": False,
+    "http_cache_type": "disk",
+    "http_cache_max_mb": 0,
+    "archive_max_mb": 1024,
+    "archive_refresh_days": 7,
+    "vertical_tabs": False,
+    "recent_closed_kb": 1024,
+    "hover_prefetch": "preconnect",
 }
 
 LIGHT_STYLE = """
@@ -112,6 +227,268 @@ try:
 except Exception:
     pass
 
+# ------------------------------------------------------
+# 📊 메트릭 레지스트리 (kyo://perf 에서 조회)
+# ------------------------------------------------------
+class MetricsRegistry:
+    # 인터셉터(IO 스레드)와 백그라운드 작업에서도 기록하므로 lock 으로 보호
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.counters = {}
+        self.gauges = {}
+        self.timings = {}
+        self.started_at = time.time()
+        self._collectors = {}
+
+    def incr(self, name, amount=1):
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + amount
+
+    def set_gauge(self, name, value):
+        with self._lock:
+            self.gauges[name] = value
+
+    def observe(self, name, ms):
+        with self._lock:
+            t = self.timings.get(name)
+            if t is None:
+                t = self.timings[name] = {"count": 0, "total_ms": 0.0, "max_ms": 0.0, "last_ms": 0.0}
+            t["count"] += 1
+            t["total_ms"] += ms
+            t["max_ms"] = max(t["max_ms"], ms)
+            t["last_ms"] = ms
+
+    def add_collector(self, name, fn):
+        # 스냅샷 시점에 호출되어 섹션 하나를 채우는 함수 (GUI 스레드에서만 호출)
+        self._collectors[name] = fn
+
+    def snapshot(self):
+        with self._lock:
+            data = {
+                "uptime_s": round(time.time() - self.started_at, 1),
+                "counters": dict(self.counters),
+                "gauges": dict(self.gauges),
+                "timings": {
+                    name: {
+                        "count": t["count"],
+                        "avg_ms": round(t["total_ms"] / t["count"], 3) if t["count"] else 0.0,
+                        "max_ms": round(t["max_ms"], 3),
+                        "last_ms": round(t["last_ms"], 3),
+                    }
+                    for name, t in self.timings.items()
+                },
+            }
+        for name, fn in list(self._collectors.items()):
+            try:
+                data[name] = fn()
+            except Exception as exc:
+                data[name] = {"error": str(exc)}
+        return data
+
+METRICS = MetricsRegistry()
+
+# ------------------------------------------------------
+# 🧵 이벤트 트레이스 (Chrome Trace Event JSON, Perfetto/chrome://tracing 에서 열기)
+# ------------------------------------------------------
+TRACE_BUFFER_EVENTS = 100_000
+
+class _NullSpan:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_exc):
+        return False
+
+_NULL_SPAN = _NullSpan()
+
+class _TraceSpan:
+    __slots__ = ("recorder", "name", "cat", "args", "started")
+
+    def __init__(self, recorder, name, cat, args):
+        self.recorder = recorder
+        self.name = name
+        self.cat = cat
+        self.args = args
+        self.started = 0.0
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, _exc, _tb):
+        self.recorder._complete(self.name, self.cat, self.started, self.args, exc_type)
+        return False
+
+class TraceRecorder:
+    # 꺼져 있으면 모든 호출이 플래그 확인 한 번으로 끝남. 켜면 고정 크기 링 버퍼에 쌓고 오래된 것부터 버림
+    # (deque.append 는 원자적이라 작업 스레드에서 불러도 됨)
+    def __init__(self, capacity=TRACE_BUFFER_EVENTS):
+        self.enabled = False
+        self.events = deque(maxlen=capacity)
+        self.dropped = 0
+        self.threads = {}
+        self.pid = os.getpid()
+
+    def _ts(self, at):
+        return round((at - PROCESS_STARTED_AT) * 1_000_000, 1)
+
+    def _emit(self, event):
+        tid = threading.get_native_id()
+        if tid not in self.threads:
+            self.threads[tid] = threading.current_thread().name
+        event["pid"] = self.pid
+        event["tid"] = tid
+        if len(self.events) == self.events.maxlen:
+            self.dropped += 1
+        self.events.append(event)
+
+    def _event(self, ph, name, cat, args, **extra):
+        event = {"name": name, "cat": cat, "ph": ph, "ts": self._ts(time.perf_counter()), **extra}
+        if args:
+            event["args"] = args
+        self._emit(event)
+
+    def start(self):
+        self.enabled = True
+        self.instant("trace.start", "trace", capacity=self.events.maxlen)
+
+    def stop(self):
+        self.instant("trace.stop", "trace")
+        self.enabled = False
+
+    def clear(self):
+        self.events.clear()
+        self.dropped = 0
+
+    def span(self, name, cat="browser", **args):
+        if not self.enabled:
+            return _NULL_SPAN
+        return _TraceSpan(self, name, cat, args)
+
+    def _complete(self, name, cat, started, args, exc_type):
+        if not self.enabled:
+            return
+        event = {
+            "name": name, "cat": cat, "ph": "X",
+            "ts": self._ts(started), "dur": round((time.perf_counter() - started) * 1_000_000, 1),
+        }
+        if exc_type:
+            args = dict(args, error=exc_type.__name__)
+        if args:
+            event["args"] = args
+        self._emit(event)
+
+    def begin(self, name, cat="browser", **args):
+        if self.enabled:
+            self._event("B", name, cat, args)
+
+    def end(self, name, cat="browser", **args):
+        if self.enabled:
+            self._event("E", name, cat, args)
+
+    def instant(self, name, cat="browser", **args):
+        if self.enabled:
+            self._event("i", name, cat, args, s="t")
+
+    def async_begin(self, name, event_id, cat="browser", **args):
+        # 탭 이동처럼 다른 이벤트와 겹치는 구간은 id 로 짝을 맞춤
+        if self.enabled:
+            self._event("b", name, cat, args, id=str(event_id))
+
+    def async_end(self, name, event_id, cat="browser", **args):
+        if self.enabled:
+            self._event("e", name, cat, args, id=str(event_id))
+
+    def counter(self, name, cat="browser", **values):
+        if self.enabled:
+            self._event("C", name, cat, values)
+
+    def stats(self):
+        return {"enabled": self.enabled, "events": len(self.events), "capacity": self.events.maxlen, "dropped": self.dropped}
+
+    def to_trace(self):
+        meta = [{"name": "process_name", "ph": "M", "pid": self.pid, "tid": 0, "args": {"name": "Kyo Browser"}}]
+        meta += [
+            {"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": name}}
+            for tid, name in list(self.threads.items())
+        ]
+        return {
+            "traceEvents": meta + list(self.events),
+            "displayTimeUnit": "ms",
+            "otherData": {"app_version": APP_VERSION, "exported_at": datetime.now().isoformat(timespec="seconds"), **self.stats()},
+        }
+
+    def export(self, path):
+        tmp_path = path + ".tmp"
+        trace = self.to_trace()
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(trace, f, ensure_ascii=False, separators=(",", ":"))
+        os.replace(tmp_path, path)
+        return len(trace["traceEvents"])
+
+TRACE = TraceRecorder()
+
+def traced(name, cat="browser", **args):
+    # 함수 전체를 span 하나로 기록. 인자 값이 함수면 호출 인자로 계산함 (꺼져 있으면 바로 원래 함수 호출)
+    def decorate(fn):
+        @functools.wraps(fn)
+        def wrapper(*call_args, **call_kwargs):
+            if not TRACE.enabled:
+                return fn(*call_args, **call_kwargs)
+            values = {key: value(*call_args, **call_kwargs) if callable(value) else value for key, value in args.items()}
+            with TRACE.span(name, cat, **values):
+                return fn(*call_args, **call_kwargs)
+        return wrapper
+    return decorate
+
+def _trace_file_arg(path, *_args, **_kwargs):
+    return os.path.basename(path)
+
+def process_rss_bytes(pid):
+    if not pid:
+        return None
+    if os.name == "nt":
+        return _windows_rss_bytes(pid)
+    try:
+        with open(f"/proc/{pid}/status", "r", encoding="ascii", errors="ignore") as f:
+            for line in f:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return None
+
+def _windows_rss_bytes(pid):
+    from ctypes import wintypes
+
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [
+            ("cb", wintypes.DWORD),
+            ("PageFaultCount", wintypes.DWORD),
+            ("PeakWorkingSetSize", ctypes.c_size_t),
+            ("WorkingSetSize", ctypes.c_size_t),
+            ("QuotaPeakPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaPeakNonPagedPoolUsage", ctypes.c_size_t),
+            ("QuotaNonPagedPoolUsage", ctypes.c_size_t),
+            ("PagefileUsage", ctypes.c_size_t),
+            ("PeakPagefileUsage", ctypes.c_size_t),
+        ]
+
+    handle = ctypes.windll.kernel32.OpenProcess(0x1000 | 0x0010, False, pid)
+    if not handle:
+        return None
+    try:
+        counters = PROCESS_MEMORY_COUNTERS()
+        counters.cb = ctypes.sizeof(counters)
+        if ctypes.windll.psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+            return counters.WorkingSetSize
+    finally:
+        ctypes.windll.kernel32.CloseHandle(handle)
+    return None
+
 def resource_path(name: str) -> str:
     base = getattr(sys, "_MEIPASS", os.path.abspath("."))
     return os.path.join(base, name)
@@ -123,6 +500,7 @@ def _copy_default(default):
         return list(default)
     return default
 
+@traced("persist.read", "io", file=_trace_file_arg)
 def load_json_file(path, default):
     if os.path.exists(path):
         try:
@@ -138,9 +516,14 @@ def load_json_file(path, default):
             pass
     return _copy_default(default)
 
+@traced("persist.write", "io", file=_trace_file_arg)
 def save_json_file(path, data):
+    started = time.perf_counter()
     with open(path, "w", encoding="utf-8") as f:
         json.dump(data, f, ensure_ascii=False, indent=2)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+    METRICS.incr("persist.writes")
+    METRICS.observe("persist.write." + os.path.basename(path), elapsed_ms)
 
 def now_iso():
     return datetime.now().isoformat(timespec="seconds")
@@ -157,6 +540,81 @@ def to_int(value, default):
     except Exception:
         return default
 
+def percentile(values, pct):
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+def directory_size(path):
+    total = 0
+    for current, _dirs, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(current, name))
+            except OSError:
+                pass
+    return total
+
+def serialize_page_history(page, max_bytes=SESSION_HISTORY_MAX_BYTES):
+    # QWebEngineHistory 를 QDataStream 으로 직렬화 → zlib → base64 (세션 JSON 에 저장)
+    data = QByteArray()
+    stream = QDataStream(data, QIODevice.WriteOnly)
+    try:
+        stream << page.history()
+    except TypeError:
+        return None
+    if stream.status() != QDataStream.Status.Ok:
+        return None
+    blob = zlib.compress(bytes(data), 6)
+    if len(blob) > max_bytes:
+        return None
+    return base64.b64encode(blob).decode("ascii")
+
+def restore_page_history(page, encoded):
+    try:
+        data = QByteArray(zlib.decompress(base64.b64decode(encoded)))
+    except (ValueError, TypeError, zlib.error):
+        return False
+    stream = QDataStream(data, QIODevice.ReadOnly)
+    try:
+        stream >> page.history()
+    except TypeError:
+        return False
+    return stream.status() == QDataStream.Status.Ok and page.history().count() > 0
+
+def is_internal_url(url):
+    return normalize_url(url).startswith(KYO_SCHEME.decode() + ":")
+
+def frecency_top_sites(history, limit):
+    # 사이트(호스트) 단위로 방문 빈도 x 최근성 점수를 합산
+    now = datetime.now()
+    buckets = ((4, 100), (14, 70), (31, 50), (90, 30))
+    sites = {}
+    for item in history:
+        url = item.get("url", "")
+        host = urlsplit(url).hostname
+        if not host or is_internal_url(url):
+            continue
+        try:
+            age_days = (now - datetime.fromisoformat(item.get("visited_at", ""))).days
+        except Exception:
+            continue
+        weight = next((w for days, w in buckets if age_days < days), 10)
+        site = sites.setdefault(host, {"score": 0, "urls": {}})
+        site["score"] += weight
+        entry = site["urls"].setdefault(url, {"score": 0, "title": item.get("title") or url})
+        entry["score"] += weight
+
+    top = []
+    for host, site in sorted(sites.items(), key=lambda kv: kv[1]["score"], reverse=True)[:limit]:
+        url, entry = max(site["urls"].items(), key=lambda kv: kv[1]["score"])
+        top.append({"host": host, "url": url, "title": entry["title"], "score": site["score"]})
+    return top
+
 def configure_chromium_flags():
     flags = os.environ.get("QTWEBENGINE_CHROMIUM_FLAGS", "")
     disable_features = "CompressionDictionaryTransport,CompressionDictionaryTransportBackend"
@@ -164,21 +622,66 @@ def configure_chromium_flags():
     if disable_features not in flags:
         os.environ["QTWEBENGINE_CHROMIUM_FLAGS"] = f"{flags} {flag}".strip()
 
+BROWSER_USER_AGENT = (
+    "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+    "AppleWebKit/537.36 (KHTML, like Gecko) "
+    "Chrome/126.0.0.0 Safari/537.36"
+)
+
+def create_browser_profile(storage_path, interceptor, off_the_record=False):
+    # 브라우저 창과 일괄 렌더링이 같은 프로필 설정(쿠키/캐시/저장소 경로, UA)을 씀
+    if off_the_record:
+        profile = QWebEngineProfile()
+    else:
+        profile = QWebEngineProfile("KyoProfile")
+        profile.setPersistentCookiesPolicy(QWebEngineProfile.ForcePersistentCookies)
+        profile.setCachePath(os.path.join(storage_path, "cache"))
+        profile.setPersistentStoragePath(os.path.join(storage_path, "storage"))
+    profile.setHttpUserAgent(BROWSER_USER_AGENT)
+    profile.setUrlRequestInterceptor(interceptor)
+    return profile
+
+def register_kyo_scheme():
+    # QApplication 생성 전에 호출해야 함
+    scheme = QWebEngineUrlScheme(KYO_SCHEME)
+    scheme.setSyntax(QWebEngineUrlScheme.Syntax.Host)
+    scheme.setFlags(
+        QWebEngineUrlScheme.Flag.SecureScheme
+        | QWebEngineUrlScheme.Flag.LocalScheme
+        | QWebEngineUrlScheme.Flag.LocalAccessAllowed
+    )
+    QWebEngineUrlScheme.registerScheme(scheme)
+
 # ------------------------------------------------------
 # 🖱️ 가운데 클릭으로 탭 닫기 지원 탭바
 # ------------------------------------------------------
 class CloseOnMiddleClickTabBar(QTabBar):
     middleClickClose = Signal(int)
     plusTabClicked = Signal(int)
+    tabHovered = Signal(int, QPoint)
+    hoverLeft = Signal()
 
     def __init__(self, parent=None):
         super().__init__(parent)
         self._suppress_next_left_release = False
 
+    def event(self, e):
+        # 기본 툴팁 대신 썸네일 미리보기를 띄우도록 신호로 넘김
+        if e.type() == QEvent.ToolTip:
+            idx = self.tabAt(e.pos())
+            if idx != -1 and self.tabData(idx) != PLUS_TAB_MARK:
+                self.tabHovered.emit(idx, e.globalPos())
+            else:
+                self.hoverLeft.emit()
+            return True
+        if e.type() == QEvent.Leave:
+            self.hoverLeft.emit()
+        return super().event(e)
+
     def mousePressEvent(self, e):
         if e.button() == Qt.LeftButton:
             idx = self.tabAt(e.pos())
-            if idx != -1 and self.tabText(idx) == "+":
+            if idx != -1 and self.tabData(idx) == PLUS_TAB_MARK:
                 self._suppress_next_left_release = True
                 self.plusTabClicked.emit(idx)
                 e.accept()
@@ -198,12 +701,1535 @@ class CloseOnMiddleClickTabBar(QTabBar):
                 return
         super().mouseReleaseEvent(e)
 
+# ------------------------------------------------------
+# 🗂️ 탭 레지스트리 (위젯 → 위치/ID 를 O(1) 로 조회)
+# ------------------------------------------------------
+class TabRegistry(QObject):
+    # QTabWidget 의 탭 순서를 그대로 따라가며, 행(row)은 + 탭을 뺀 실제 탭 순서
+    viewInserted = Signal(int)
+    viewRemoved = Signal(int)
+    viewChanged = Signal(int)
+    viewsReordered = Signal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.plus_widget = QWidget()
+        self._order = []  # 탭 위젯(+ 탭 포함), QTabWidget 순서
+        self._positions = {}  # 위젯 -> 탭 인덱스
+        self._views = []  # 실제 탭 순서
+        self._ids = {}  # 뷰 -> 고정 ID
+        self._by_id = {}
+        self._next_id = 1
+
+    def __len__(self):
+        return len(self._views)
+
+    def views(self):
+        return self._views
+
+    def contains(self, view):
+        return view in self._ids
+
+    def index_of(self, widget):
+        return self._positions.get(widget, -1)
+
+    def row_of(self, view):
+        index = self._positions.get(view, -1)
+        if index == -1 or view is self.plus_widget:
+            return -1
+        return self._row_for_index(index)
+
+    def _row_for_index(self, index):
+        plus = self._positions.get(self.plus_widget, -1)
+        return index - 1 if 0 <= plus < index else index
+
+    def id_of(self, view):
+        return self._ids.get(view)
+
+    def view_for_id(self, tab_id):
+        return self._by_id.get(tab_id)
+
+    def _renumber(self, start, stop=None):
+        # 바뀐 구간만 다시 번호를 매기므로 끝(+ 탭 앞)에 추가/삭제하는 흔한 경우는 O(1)
+        for index in range(start, len(self._order) if stop is None else stop):
+            self._positions[self._order[index]] = index
+
+    def inserted(self, index, widget):
+        self._order.insert(index, widget)
+        self._renumber(index)
+        if widget is self.plus_widget:
+            return
+        tab_id = self._next_id
+        self._next_id += 1
+        self._ids[widget] = tab_id
+        self._by_id[tab_id] = widget
+        row = self.row_of(widget)
+        self._views.insert(row, widget)
+        self.viewInserted.emit(row)
+
+    def removed(self, index):
+        widget = self._order.pop(index)
+        del self._positions[widget]
+        row = -1
+        if widget is not self.plus_widget:
+            # + 탭 위치는 아직 이전 번호이므로 지운 탭의 행을 그대로 계산할 수 있음
+            row = self._row_for_index(index)
+            self._views.pop(row)
+            self._by_id.pop(self._ids.pop(widget), None)
+        self._renumber(index)
+        if row != -1:
+            self.viewRemoved.emit(row)
+
+    def moved(self, from_index, to_index):
+        self._order.insert(to_index, self._order.pop(from_index))
+        self._renumber(min(from_index, to_index), max(from_index, to_index) + 1)
+        self._views = [widget for widget in self._order if widget is not self.plus_widget]
+        self.viewsReordered.emit()
+
+    def changed(self, view):
+        row = self.row_of(view)
+        if row != -1:
+            self.viewChanged.emit(row)
+
+class BrowserTabWidget(QTabWidget):
+    # 탭이 바뀌기 직전(떠나는 탭이 아직 보일 때) 알림. 탭바 클릭과 코드에서의 setCurrentIndex 만 해당
+    aboutToSwitch = Signal(int)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.registry = TabRegistry(self)
+
+    def setTabBar(self, tab_bar):
+        super().setTabBar(tab_bar)
+        tab_bar.tabMoved.connect(self.registry.moved)
+        tab_bar.tabBarClicked.connect(self._on_tab_bar_clicked)
+
+    def _on_tab_bar_clicked(self, index):
+        if index != -1 and index != self.currentIndex():
+            self.aboutToSwitch.emit(index)
+
+    def setCurrentIndex(self, index):
+        if index != self.currentIndex():
+            self.aboutToSwitch.emit(index)
+        super().setCurrentIndex(index)
+
+    def tabInserted(self, index):
+        super().tabInserted(index)
+        self.registry.inserted(index, self.widget(index))
+
+    def tabRemoved(self, index):
+        super().tabRemoved(index)
+        self.registry.removed(index)
+
+# ------------------------------------------------------
+# 📑 세로 탭 사이드바 (가상화 목록 + 제목/URL 필터)
+# ------------------------------------------------------
+class TabListModel(QAbstractListModel):
+    FilterRole = Qt.UserRole + 1
+
+    def __init__(self, registry, parent=None):
+        super().__init__(parent)
+        self.registry = registry
+        registry.viewInserted.connect(self._on_inserted)
+        registry.viewRemoved.connect(self._on_removed)
+        registry.viewChanged.connect(self._on_changed)
+        registry.viewsReordered.connect(self._on_reordered)
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.registry)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if not index.isValid() or index.row() >= len(self.registry):
+            return None
+        view = self.registry.views()[index.row()]
+        if role == Qt.DisplayRole:
+            return view.title() or view.url().toString() or "New Tab"
+        if role == Qt.DecorationRole:
+            return view.icon()
+        if role == Qt.ToolTipRole:
+            return view.url().toString()
+        if role == self.FilterRole:
+            return f"{view.title()}\n{view.url().toString()}"
+        if role == Qt.UserRole:
+            return self.registry.id_of(view)
+        return None
+
+    # 레지스트리는 탭 위젯이 바뀐 뒤에 알려 주므로 시작/끝 알림을 연달아 보냄
+    def _on_inserted(self, row):
+        self.beginInsertRows(QModelIndex(), row, row)
+        self.endInsertRows()
+
+    def _on_removed(self, row):
+        self.beginRemoveRows(QModelIndex(), row, row)
+        self.endRemoveRows()
+
+    def _on_changed(self, row):
+        index = self.index(row)
+        self.dataChanged.emit(index, index, [Qt.DisplayRole, Qt.DecorationRole, Qt.ToolTipRole, self.FilterRole])
+
+    def _on_reordered(self):
+        self.beginResetModel()
+        self.endResetModel()
+
+class VerticalTabSidebar(QDockWidget):
+    def __init__(self, browser, parent=None):
+        super().__init__("탭", parent)
+        self.browser = browser
+        self.setObjectName("verticalTabs")
+        self.setFeatures(QDockWidget.DockWidgetMovable)
+        self.model = TabListModel(browser.tab_registry, self)
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setFilterRole(TabListModel.FilterRole)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseInsensitive)
+
+        body = QWidget(self)
+        layout = QVBoxLayout(body)
+        layout.setContentsMargins(4, 4, 4, 4)
+        top_row = QHBoxLayout()
+        self.filter_edit = QLineEdit(body)
+        self.filter_edit.setPlaceholderText("탭 검색 (제목/URL)")
+        self.filter_edit.setClearButtonEnabled(True)
+        self.filter_edit.textChanged.connect(self.proxy.setFilterFixedString)
+        btn_new = QToolButton(body)
+        btn_new.setText("+")
+        btn_new.setToolTip("새 탭")
+        btn_new.clicked.connect(lambda: browser.create_new_tab(browser.get_home_url()))
+        top_row.addWidget(self.filter_edit, 1)
+        top_row.addWidget(btn_new)
+        layout.addLayout(top_row)
+
+        # 균일한 행 높이 → 보이는 행만 배치/그리기
+        self.list_view = QListView(body)
+        self.list_view.setModel(self.proxy)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setIconSize(QSize(16, 16))
+        self.list_view.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.list_view.customContextMenuRequested.connect(self._show_context_menu)
+        self.list_view.clicked.connect(self._activate)
+        self.list_view.activated.connect(self._activate)
+        layout.addWidget(self.list_view)
+        self.setWidget(body)
+
+    def _view_at(self, proxy_index):
+        if not proxy_index.isValid():
+            return None
+        return self.browser.tab_registry.view_for_id(self.proxy.data(proxy_index, Qt.UserRole))
+
+    def _activate(self, proxy_index):
+        view = self._view_at(proxy_index)
+        if view:
+            self.browser.tabs.setCurrentIndex(self.browser.tab_registry.index_of(view))
+
+    def _show_context_menu(self, pos):
+        view = self._view_at(self.list_view.indexAt(pos))
+        if not view:
+            return
+        menu = QMenu(self)
+        act_close = QAction("탭 닫기", self)
+        act_close.triggered.connect(lambda _=False, v=view: self.browser.close_tab(self.browser.tab_registry.index_of(v)))
+        menu.addAction(act_close)
+        menu.exec(self.list_view.viewport().mapToGlobal(pos))
+
+    def select_view(self, view):
+        row = self.browser.tab_registry.row_of(view) if view else -1
+        if row == -1:
+            self.list_view.clearSelection()
+            return
+        proxy_index = self.proxy.mapFromSource(self.model.index(row))
+        if proxy_index.isValid():
+            self.list_view.setCurrentIndex(proxy_index)
+            self.list_view.scrollTo(proxy_index)
+
+# ------------------------------------------------------
+# ⏲️ 탭 UI 갱신 묶음 (한 프레임에 한 번 적용)
+# ------------------------------------------------------
+class UiUpdateBatcher(QObject):
+    # 제목/아이콘/URL 변경을 뷰별로 모아 두었다가 타이머 하나로 한 번에 반영
+    def __init__(self, apply, is_alive, interval_ms=UI_FRAME_MS, parent=None):
+        super().__init__(parent)
+        self.apply = apply
+        self.is_alive = is_alive
+        self._pending = {}  # 뷰 -> {필드: 값}, 같은 필드는 마지막 값만 남김
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.flush)
+
+    def mark(self, view, field, value=None):
+        METRICS.incr("ui.batch.requested")
+        fields = self._pending.setdefault(view, {})
+        if field in fields:
+            METRICS.incr("ui.batch.coalesced")
+        fields[field] = value
+        if not self._timer.isActive():
+            self._timer.start()
+
+    def flush(self):
+        self._timer.stop()
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+        started = time.perf_counter()
+        applied = dropped = 0
+        with TRACE.span("ui.batch.flush", "ui", views=len(pending)):
+            for view, fields in pending.items():
+                if not self.is_alive(view):
+                    dropped += len(fields)
+                    continue
+                self.apply(view, fields)
+                applied += len(fields)
+        METRICS.incr("ui.batch.flushes")
+        METRICS.incr("ui.batch.applied", applied)
+        if dropped:
+            METRICS.incr("ui.batch.dropped", dropped)
+        METRICS.observe("ui.batch.flush", (time.perf_counter() - started) * 1000)
+
 # ------------------------------------------------------
 # 🌐 요청 인터셉터 (Accept-Language)
 # ------------------------------------------------------
 class MyInterceptor(QWebEngineUrlRequestInterceptor):
     def interceptRequest(self, info):
         info.setHttpHeader(b"Accept-Language", b"ko-KR,ko;q=0.9,en-US;q=0.8,en;q=0.7")
+        METRICS.incr("interceptor.requests")
+        if info.resourceType() == QWebEngineUrlRequestInfo.ResourceType.ResourceTypeMainFrame:
+            METRICS.incr("interceptor.main_frame")
+
+# ------------------------------------------------------
+# 🧵 백그라운드 작업 (QThreadPool)
+# ------------------------------------------------------
+class _TaskSignals(QObject):
+    finished = Signal(object)
+    failed = Signal(str)
+
+class BackgroundTask(QRunnable):
+    # 결과는 시그널로 GUI 스레드의 QObject 슬롯에 전달된다
+    def __init__(self, fn, *args):
+        super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = _TaskSignals()
+
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as exc:
+            self.signals.failed.emit(str(exc))
+            return
+        self.signals.finished.emit(result)
+
+class ReadyFuture:
+    # 백그라운드에서 읽는 값. 소비자는 then() 으로 등록하고, 이미 준비됐으면 즉시 호출됨 (GUI 스레드 전용)
+    # 읽기에 실패하면 error 가 남고 등록된 on_error 가 호출됨 (is_ready() 는 계속 False)
+    def __init__(self):
+        self._ready = False
+        self._value = None
+        self.error = None
+        self._callbacks = []
+
+    def is_ready(self):
+        return self._ready
+
+    def is_done(self):
+        return self._ready or self.error is not None
+
+    def then(self, callback, on_error=None):
+        if self._ready:
+            callback(self._value)
+        elif self.error is not None:
+            if on_error:
+                on_error(self.error)
+        else:
+            self._callbacks.append((callback, on_error))
+
+    def set_result(self, value):
+        self._ready = True
+        self._value = value
+        callbacks, self._callbacks = self._callbacks, []
+        for callback, _on_error in callbacks:
+            callback(value)
+
+    def set_error(self, message):
+        self.error = message or "알 수 없는 오류"
+        callbacks, self._callbacks = self._callbacks, []
+        for _callback, on_error in callbacks:
+            if on_error:
+                on_error(self.error)
+
+def prune_history_items(history, retention_days):
+    cutoff = datetime.now() - timedelta(days=retention_days)
+    kept = []
+    for item in history:
+        try:
+            visited_at = datetime.fromisoformat(item.get("visited_at", ""))
+        except Exception:
+            continue
+        if visited_at >= cutoff:
+            kept.append(item)
+    return kept
+
+@traced("persist.read", "io", file=_trace_file_arg)
+def read_list_store(path):
+    # load_json_file 과 달리 손상/읽기 실패를 빈 목록으로 바꾸지 않고 예외로 올림
+    # (빈 목록으로 시작해 저장하면 원본 파일을 덮어쓰게 되므로). 파일이 없을 때만 빈 목록
+    if not os.path.exists(path):
+        return []
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    if not isinstance(data, list):
+        raise ValueError(f"{os.path.basename(path)}: 목록 형식이 아닙니다")
+    return data
+
+def load_history_store(path, retention_days):
+    # 가장 큰 저장소라 창을 띄운 뒤 작업 스레드에서 읽고 보존 기간 정리까지 마침
+    started = time.perf_counter()
+    history = read_list_store(path)
+    kept = prune_history_items(history, retention_days)
+    return {"items": kept, "pruned": len(history) - len(kept), "ms": (time.perf_counter() - started) * 1000}
+
+def load_bookmark_store(path):
+    started = time.perf_counter()
+    bookmarks = read_list_store(path)
+    return {"items": bookmarks, "ms": (time.perf_counter() - started) * 1000}
+
+# ------------------------------------------------------
+# 🖼️ 탭 썸네일 캐시 (디스크, LRU)
+# ------------------------------------------------------
+def _encode_thumbnail(url, image, path):
+    # 같은 URL 을 동시에 저장해도 서로의 임시 파일을 덮지 않도록 임시 이름을 따로 받음
+    fd, tmp_path = tempfile.mkstemp(suffix=".tmp", dir=os.path.dirname(path))
+    os.close(fd)
+    try:
+        if not image.save(tmp_path, "JPG", THUMBNAIL_QUALITY):
+            raise OSError(f"thumbnail encode failed: {path}")
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+    return url, path, os.path.getsize(path)
+
+class ThumbnailCache(QObject):
+    thumbnailSaved = Signal(str, str)
+
+    def __init__(self, directory, max_bytes, parent=None):
+        super().__init__(parent)
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(directory, "index.json")
+        os.makedirs(directory, exist_ok=True)
+        self._tasks = set()
+        self._entries = {}  # key -> {"url", "size"}, 삽입 순서 = LRU 순서(오래된 것 먼저)
+        self.total_bytes = 0
+        for entry in load_json_file(self.index_path, []):
+            key = entry.get("key") if isinstance(entry, dict) else None
+            if key and os.path.exists(self._path_for_key(key)):
+                self._entries[key] = {"url": entry.get("url", ""), "size": to_int(entry.get("size", 0), 0)}
+                self.total_bytes += self._entries[key]["size"]
+
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(2000)
+        self._save_timer.timeout.connect(self.flush)
+
+    @staticmethod
+    def key_for(url):
+        return hashlib.sha1(normalize_url(url).encode("utf-8")).hexdigest()
+
+    def _path_for_key(self, key):
+        return os.path.join(self.directory, key + ".jpg")
+
+    def path_for(self, url):
+        key = self.key_for(url)
+        if key not in self._entries:
+            return None
+        # 조회도 사용으로 간주해 LRU 맨 뒤로 이동
+        self._entries[key] = self._entries.pop(key)
+        self._save_timer.start()
+        return self._path_for_key(key)
+
+    def store(self, url, image):
+        key = self.key_for(url)
+        task = BackgroundTask(_encode_thumbnail, url, image, self._path_for_key(key))
+        task.signals.finished.connect(self._on_encoded)
+        task.signals.failed.connect(self._on_failed)
+        self._tasks.add(task)
+        QThreadPool.globalInstance().start(task)
+
+    def _on_encoded(self, result):
+        self._tasks = {t for t in self._tasks if t.signals is not self.sender()}
+        url, path, size = result
+        key = self.key_for(url)
+        old = self._entries.pop(key, None)
+        if old:
+            self.total_bytes -= old["size"]
+        self._entries[key] = {"url": url, "size": size}
+        self.total_bytes += size
+        self._evict()
+        self._save_timer.start()
+        self.thumbnailSaved.emit(url, path)
+
+    def _on_failed(self, message):
+        self._tasks = {t for t in self._tasks if t.signals is not self.sender()}
+        # 썸네일은 없어도 되는 캐시이므로 사용자에게 알리지 않고 kyo://perf 에서 확인
+        METRICS.incr("thumbnail.store_failed")
+
+    def _evict(self):
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            key = next(iter(self._entries))
+            entry = self._entries.pop(key)
+            self.total_bytes -= entry["size"]
+            try:
+                os.remove(self._path_for_key(key))
+            except OSError:
+                pass
+
+    def __len__(self):
+        return len(self._entries)
+
+    def has(self, url):
+        return self.key_for(url) in self._entries
+
+    def file_for_key(self, key):
+        return self._path_for_key(key) if key in self._entries else None
+
+    def flush(self):
+        self._save_timer.stop()
+        save_json_file(self.index_path, [
+            {"key": key, "url": entry["url"], "size": entry["size"]}
+            for key, entry in self._entries.items()
+        ])
+
+# ------------------------------------------------------
+# ⏱️ 내비게이션 타이밍 (사이트별 시계열)
+# ------------------------------------------------------
+NAV_TIMING_JS = """
+(function () {
+  var nav = performance.getEntriesByType("navigation")[0];
+  if (!nav) { return null; }
+  var fcp = performance.getEntriesByName("first-contentful-paint")[0];
+  return JSON.stringify({
+    ttfb: nav.responseStart - nav.startTime,
+    dcl: nav.domContentLoadedEventEnd - nav.startTime,
+    load: (nav.loadEventEnd || nav.loadEventStart) - nav.startTime,
+    fcp: fcp ? fcp.startTime : null
+  });
+})();
+"""
+
+# 한 표본: [epoch 초, 전체(loadStarted→loadFinished), TTFB, DOMContentLoaded, load, FCP] (ms, 정수 또는 None)
+NAV_FIELDS = ("ts", "total", "ttfb", "dcl", "load", "fcp")
+
+class NavTimingStore(QObject):
+    def __init__(self, path, retention_days, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.retention_days = retention_days
+        data = load_json_file(path, {"hosts": {}})
+        self.hosts = data.get("hosts", {}) if isinstance(data.get("hosts"), dict) else {}
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(5000)
+        self._save_timer.timeout.connect(self.flush)
+        self._dirty = False
+        self.prune()
+
+    def add(self, host, total_ms, page_timing):
+        def ms(value):
+            return int(round(value)) if isinstance(value, (int, float)) and value >= 0 else None
+
+        sample = [int(time.time()), ms(total_ms)] + [ms(page_timing.get(key)) for key in NAV_FIELDS[2:]]
+        series = self.hosts.setdefault(host, [])
+        series.append(sample)
+        if len(series) > NAV_TIMING_MAX_PER_HOST:
+            del series[:len(series) - NAV_TIMING_MAX_PER_HOST]
+        self._dirty = True
+        self._save_timer.start()
+
+    def prune(self):
+        cutoff = time.time() - self.retention_days * 86400
+        for host in list(self.hosts):
+            kept = [sample for sample in self.hosts[host] if isinstance(sample, list) and sample and sample[0] >= cutoff]
+            if len(kept) != len(self.hosts[host]):
+                self._dirty = True
+            if kept:
+                self.hosts[host] = kept
+            else:
+                del self.hosts[host]
+
+    def summarize(self, samples):
+        def p(field, pct):
+            idx = NAV_FIELDS.index(field)
+            values = [s[idx] for s in samples if s[idx] is not None]
+            value = percentile(values, pct)
+            return None if value is None else int(round(value))
+
+        return {
+            "count": len(samples),
+            "total_p50": p("total", 50),
+            "total_p90": p("total", 90),
+            "ttfb_p50": p("ttfb", 50),
+            "dcl_p50": p("dcl", 50),
+            "load_p50": p("load", 50),
+            "fcp_p50": p("fcp", 50),
+        }
+
+    def host_rows(self):
+        rows = []
+        for host, samples in self.hosts.items():
+            row = self.summarize(samples)
+            row["host"] = host
+            rows.append(row)
+        return sorted(rows, key=lambda r: r["count"], reverse=True)
+
+    def daily_rows(self, host):
+        days = {}
+        for sample in self.hosts.get(host, []):
+            day = datetime.fromtimestamp(sample[0]).strftime("%Y-%m-%d")
+            days.setdefault(day, []).append(sample)
+        rows = []
+        for day, samples in sorted(days.items(), reverse=True):
+            row = self.summarize(samples)
+            row["day"] = day
+            rows.append(row)
+        return rows
+
+    def clear(self):
+        self.hosts = {}
+        self._dirty = True
+        self.flush()
+
+    def flush(self):
+        self._save_timer.stop()
+        if self._dirty:
+            save_json_file(self.path, {"hosts": self.hosts})
+            self._dirty = False
+
+# ------------------------------------------------------
+# 💥 렌더러 종료 통계 (사이트별 / 사유별)
+# ------------------------------------------------------
+RENDER_TERMINATION_REASONS = {
+    QWebEnginePage.RenderProcessTerminationStatus.NormalTerminationStatus: "normal",
+    QWebEnginePage.RenderProcessTerminationStatus.AbnormalTerminationStatus: "abnormal",
+    QWebEnginePage.RenderProcessTerminationStatus.CrashedTerminationStatus: "crashed",
+    QWebEnginePage.RenderProcessTerminationStatus.KilledTerminationStatus: "killed",
+}
+
+class CrashStatsStore(QObject):
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+        data = load_json_file(path, {"sites": {}, "events": []})
+        self.sites = data.get("sites", {}) if isinstance(data.get("sites"), dict) else {}
+        self.events = data.get("events", []) if isinstance(data.get("events"), list) else []
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(2000)
+        self._save_timer.timeout.connect(self.flush)
+        self._dirty = False
+
+    def record(self, url, reason, exit_code, attempt, action):
+        host = urlsplit(url).hostname or "(알 수 없음)"
+        site = self.sites.setdefault(host, {"total": 0, "reasons": {}, "last_at": None, "last_exit_code": None})
+        site["total"] += 1
+        site["reasons"][reason] = site["reasons"].get(reason, 0) + 1
+        site["last_at"] = now_iso()
+        site["last_exit_code"] = exit_code
+        self.events.append({
+            "at": site["last_at"], "host": host, "url": url, "reason": reason,
+            "exit_code": exit_code, "attempt": attempt, "action": action,
+        })
+        if len(self.events) > CRASH_MAX_EVENTS:
+            del self.events[:len(self.events) - CRASH_MAX_EVENTS]
+        METRICS.incr(f"renderer.terminated.{reason}")
+        self._dirty = True
+        self._save_timer.start()
+
+    def reason_totals(self):
+        totals = {}
+        for site in self.sites.values():
+            for reason, count in site["reasons"].items():
+                totals[reason] = totals.get(reason, 0) + count
+        return totals
+
+    def site_rows(self):
+        rows = [dict(site, host=host) for host, site in self.sites.items()]
+        return sorted(rows, key=lambda r: r["total"], reverse=True)
+
+    def export(self, path):
+        # .csv 는 사이트별 요약, 그 밖에는 요약 + 개별 이벤트 전체를 JSON 으로
+        if path.lower().endswith(".csv"):
+            reasons = sorted(set(RENDER_TERMINATION_REASONS.values()) | set(self.reason_totals()))
+            lines = [",".join(["host", "total"] + reasons + ["last_at", "last_exit_code"])]
+            for row in self.site_rows():
+                cells = [row["host"], str(row["total"])] + [str(row["reasons"].get(r, 0)) for r in reasons]
+                cells += [row["last_at"] or "", "" if row["last_exit_code"] is None else str(row["last_exit_code"])]
+                lines.append(",".join('"' + cell.replace('"', '""') + '"' for cell in cells))
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                f.write("\n".join(lines) + "\n")
+            return
+        save_json_file(path, {
+            "exported_at": now_iso(),
+            "app_version": APP_VERSION,
+            "reasons": self.reason_totals(),
+            "sites": self.site_rows(),
+            "events": self.events,
+        })
+
+    def clear(self):
+        self.sites = {}
+        self.events = []
+        self._dirty = True
+        self.flush()
+
+    def flush(self):
+        self._save_timer.stop()
+        if self._dirty:
+            save_json_file(self.path, {"sites": self.sites, "events": self.events})
+            self._dirty = False
+
+# ------------------------------------------------------
+# 🐢 페이지 런타임 성능 모니터 (QWebChannel)
+# ------------------------------------------------------
+LONG_TASK_THRESHOLD_MS = 50
+PERF_MONITOR_FLUSH_MS = 5000
+PERF_MONITOR_SCRIPT_NAME = "kyo-perf-monitor"
+
+PERF_MONITOR_JS = """
+(function () {
+  if (window.__kyoPerfMonitor || typeof qt === "undefined" || !qt.webChannelTransport) { return; }
+  window.__kyoPerfMonitor = true;
+  var batch = { longtasks: [], shift: 0, events: [] };
+  function observe(type, onEntry, extra) {
+    try {
+      var options = { type: type, buffered: true };
+      for (var key in (extra || {})) { options[key] = extra[key]; }
+      new PerformanceObserver(function (list) { list.getEntries().forEach(onEntry); }).observe(options);
+    } catch (e) {}
+  }
+  observe("longtask", function (e) { if (batch.longtasks.length < 500) { batch.longtasks.push(Math.round(e.duration)); } });
+  observe("layout-shift", function (e) { if (!e.hadRecentInput) { batch.shift += e.value; } });
+  observe("event", function (e) { if (batch.events.length < 200) { batch.events.push(Math.round(e.duration)); } },
+          { durationThreshold: 40 });
+  new QWebChannel(qt.webChannelTransport, function (channel) {
+    var bridge = channel.objects.kyoPerf;
+    function flush() {
+      if (!batch.longtasks.length && !batch.shift && !batch.events.length) { return; }
+      var payload = JSON.stringify(batch);
+      batch = { longtasks: [], shift: 0, events: [] };
+      bridge.report(payload);
+    }
+    setInterval(flush, %d);
+    addEventListener("pagehide", flush);
+  });
+})();
+""" % PERF_MONITOR_FLUSH_MS
+
+def build_perf_monitor_script():
+    source = QFile(":/qtwebchannel/qwebchannel.js")
+    if not source.open(QIODevice.ReadOnly):
+        METRICS.incr("perf_monitor.unavailable")
+        return None
+    webchannel_js = bytes(source.readAll()).decode("utf-8")
+    source.close()
+
+    script = QWebEngineScript()
+    script.setName(PERF_MONITOR_SCRIPT_NAME)
+    script.setSourceCode(webchannel_js + "\n" + PERF_MONITOR_JS)
+    script.setInjectionPoint(QWebEngineScript.DocumentCreation)
+    script.setWorldId(QWebEngineScript.ApplicationWorld)
+    script.setRunsOnSubFrames(False)
+    return script
+
+class PerfBridge(QObject):
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.reset()
+
+    def reset(self):
+        self.stats = {
+            "batches": 0,
+            "long_tasks": 0,
+            "blocked_ms": 0,
+            "longest_task_ms": 0,
+            "layout_shift": 0.0,
+            "slow_events": 0,
+            "max_event_ms": 0,
+        }
+
+    @Slot(str)
+    def report(self, payload):
+        try:
+            data = json.loads(payload)
+            longtasks = [int(v) for v in data.get("longtasks", [])]
+            events = [int(v) for v in data.get("events", [])]
+            shift = float(data.get("shift", 0) or 0)
+        except (ValueError, TypeError, AttributeError):
+            return
+        stats = self.stats
+        stats["batches"] += 1
+        stats["long_tasks"] += len(longtasks)
+        stats["blocked_ms"] += sum(max(0, d - LONG_TASK_THRESHOLD_MS) for d in longtasks)
+        stats["longest_task_ms"] = max([stats["longest_task_ms"]] + longtasks)
+        stats["layout_shift"] += shift
+        stats["slow_events"] += len(events)
+        stats["max_event_ms"] = max([stats["max_event_ms"]] + events)
+        METRICS.incr("perf_monitor.batches")
+
+    def summary(self):
+        stats = self.stats
+        return f"차단 시간 {stats['blocked_ms']:,} ms · 롱태스크 {stats['long_tasks']}개 · CLS {stats['layout_shift']:.3f}"
+
+# ------------------------------------------------------
+# 🔤 탭 본문 텍스트 캐시 (모든 탭에서 찾기)
+# ------------------------------------------------------
+class TabTextCache(QObject):
+    textReady = Signal(object)
+    progress = Signal(int, int)
+
+    def __init__(self, browser, parent=None):
+        super().__init__(parent or browser)
+        self.browser = browser
+        self._entries = {}  # view -> {"url", "generation", "text"}
+        self._queue = []
+        self._in_flight = None
+        self._request_seq = 0
+        self._total = 0
+        # 닫혀 삭제된 탭 등으로 toPlainText 응답이 오지 않아도 다음 탭으로 넘어가도록 요청마다 제한 시간을 둠
+        self._timeout = QTimer(self)
+        self._timeout.setSingleShot(True)
+        self._timeout.setInterval(TAB_TEXT_TIMEOUT_MS)
+        self._timeout.timeout.connect(self._on_timeout)
+
+    def is_fresh(self, view):
+        entry = self._entries.get(view)
+        return bool(entry) and entry["url"] == view.url().toString() and entry["generation"] == view.load_generation
+
+    def text_for(self, view):
+        entry = self._entries.get(view)
+        return entry["text"] if entry else None
+
+    def refresh(self, views):
+        live = set(views)
+        for view in list(self._entries):
+            if view not in live:
+                del self._entries[view]
+        # 보이는 탭부터 추출하고(나머지는 탭 순서), 이미 최신인 탭은 건너뜀
+        self._queue = sorted(
+            (view for view in views
+             if not self.is_fresh(view) and view.page().lifecycleState() != QWebEnginePage.LifecycleState.Discarded),
+            key=lambda view: not view.isVisible(),
+        )
+        self._total = len(self._queue)
+        self.progress.emit(0, self._total)
+        if self._in_flight is None:
+            self._next()
+
+    def _next(self):
+        if not self._queue:
+            self._in_flight = None
+            self.progress.emit(self._total, self._total)
+            return
+        view = self._queue.pop(0)
+        if not self.browser.tab_registry.contains(view):
+            QTimer.singleShot(0, self._next)
+            return
+        self._in_flight = view
+        self._request_seq += 1
+        seq = self._request_seq
+        url, generation = view.url().toString(), view.load_generation
+        started = time.perf_counter()
+
+        def on_text(text, view=view, url=url, generation=generation):
+            if seq != self._request_seq:
+                return  # 제한 시간이 지나 이미 다음 탭으로 넘어감
+            self._timeout.stop()
+            METRICS.observe("find.text_extract", (time.perf_counter() - started) * 1000)
+            self._entries[view] = {"url": url, "generation": generation, "text": text or ""}
+            self.progress.emit(self._total - len(self._queue), self._total)
+            self.textReady.emit(view)
+            # 한 탭씩 이벤트 루프에 양보하며 처리해 UI가 멈추지 않도록 함
+            QTimer.singleShot(0, self._next)
+
+        self._timeout.start()
+        view.page().toPlainText(on_text)
+
+    def _on_timeout(self):
+        METRICS.incr("find.text_extract_timeouts")
+        self._request_seq += 1
+        self._next()
+
+    @staticmethod
+    def search(text, query, case_sensitive, context=40):
+        haystack = text if case_sensitive else text.lower()
+        needle = query if case_sensitive else query.lower()
+        count = haystack.count(needle) if needle else 0
+        if not count:
+            return 0, ""
+        pos = haystack.find(needle)
+        start, end = max(0, pos - context), min(len(text), pos + len(needle) + context)
+        snippet = " ".join(text[start:end].split())
+        return count, ("…" if start else "") + snippet + ("…" if end < len(text) else "")
+
+# ------------------------------------------------------
+# 📚 방문 페이지 본문 색인 (역색인, 압축 샤드)
+# ------------------------------------------------------
+_TOKEN_RE = re.compile(r"([0-9a-z]{2,40})|([가-힣]+)")
+
+def tokenize_text(text, limit=CONTENT_INDEX_MAX_TOKENS, query=False):
+    # 영문/숫자는 단어 단위, 한글은 띄어쓰기·조사와 무관하게 찾히도록 2-gram 으로 분해.
+    # 한 글자 검색도 되도록 문서는 음절(1-gram)도 색인하고, 검색어는 한 글자 덩어리만 1-gram 으로 찾음
+    tokens = {}
+    for word, run in _TOKEN_RE.findall(text.lower()):
+        if word:
+            tokens[word] = None
+            continue
+        if len(run) > 1:
+            tokens.update(dict.fromkeys(run[i:i + 2] for i in range(len(run) - 1)))
+        if len(run) == 1 or not query:
+            tokens.update(dict.fromkeys(run))
+        if len(tokens) >= limit:
+            break
+    return set(list(tokens)[:limit])
+
+class ContentIndex:
+    # 작업 스레드 하나에서만 사용 (ContentIndexer 참고)
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        os.makedirs(directory, exist_ok=True)
+        meta = self._read(os.path.join(directory, "docs.z"), {})
+        self.docs = meta.get("docs", {})  # url -> {"id", "title", "ts", "hash", "shards"}
+        self.next_id = to_int(meta.get("next_id", 1), 1)
+        self.urls_by_id = {doc["id"]: url for url, doc in self.docs.items()}
+        self._shards = {}
+        self._dirty = set()
+        self._removed_ids = set()
+        self._meta_dirty = False
+
+    @staticmethod
+    def _read(path, default):
+        try:
+            with open(path, "rb") as f:
+                return json.loads(zlib.decompress(f.read()).decode("utf-8"))
+        except (OSError, ValueError, zlib.error):
+            return default
+
+    @staticmethod
+    def _write(path, data):
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(zlib.compress(json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8"), 6))
+        os.replace(tmp_path, path)
+
+    def _shard_path(self, shard):
+        return os.path.join(self.directory, f"shard_{shard:02d}.z")
+
+    def _shard(self, shard):
+        if shard not in self._shards:
+            self._shards[shard] = self._read(self._shard_path(shard), {})
+        return self._shards[shard]
+
+    @staticmethod
+    def shard_of(token):
+        return zlib.crc32(token.encode("utf-8")) % CONTENT_INDEX_SHARDS
+
+    def add(self, url, title, text, ts):
+        text = text[:CONTENT_INDEX_MAX_CHARS]
+        digest = hashlib.sha1(text.encode("utf-8")).hexdigest()
+        doc = self.docs.get(url)
+        if doc and doc["hash"] == digest:
+            # 내용이 같으면 시각/제목만 갱신하고 역색인은 건드리지 않음
+            doc["ts"], doc["title"] = ts, title
+            self._meta_dirty = True
+            return
+        if doc:
+            self.remove(url)
+        tokens = tokenize_text(title + " " + text)
+        doc_id = self.next_id
+        self.next_id += 1
+        shards = set()
+        for token in tokens:
+            shard = self.shard_of(token)
+            self._shard(shard).setdefault(token, []).append(doc_id)
+            shards.add(shard)
+        self._dirty |= shards
+        self.docs[url] = {"id": doc_id, "title": title, "ts": ts, "hash": digest, "shards": sorted(shards)}
+        self.urls_by_id[doc_id] = url
+        self._meta_dirty = True
+
+    def remove(self, url):
+        doc = self.docs.pop(url, None)
+        if not doc:
+            return
+        # 역색인은 바로 훑지 않고 flush 때 샤드마다 한 번에 정리 (그 전까지 검색은 urls_by_id 로 걸러짐)
+        self.urls_by_id.pop(doc["id"], None)
+        self._removed_ids.add(doc["id"])
+        self._dirty.update(doc["shards"])
+        self._meta_dirty = True
+
+    def expire(self, cutoff_ts):
+        for url in [url for url, doc in self.docs.items() if doc["ts"] < cutoff_ts]:
+            self.remove(url)
+
+    def search(self, query, limit=500):
+        tokens = tokenize_text(query, query=True)
+        if not tokens:
+            return []
+        result = None
+        for token in sorted(tokens, key=len, reverse=True):
+            ids = set(self._shard(self.shard_of(token)).get(token, ()))
+            result = ids if result is None else result & ids
+            if not result:
+                return []
+        urls = [self.urls_by_id[i] for i in result if i in self.urls_by_id]
+        urls.sort(key=lambda u: self.docs[u]["ts"], reverse=True)
+        return urls[:limit]
+
+    def disk_bytes(self):
+        total = 0
+        for name in os.listdir(self.directory):
+            try:
+                total += os.path.getsize(os.path.join(self.directory, name))
+            except OSError:
+                pass
+        return total
+
+    def _write_dirty_shards(self):
+        removed, self._removed_ids = self._removed_ids, set()
+        for shard in sorted(self._dirty):
+            postings = self._shard(shard)
+            if removed:
+                for token in list(postings):
+                    ids = [i for i in postings[token] if i not in removed]
+                    if ids:
+                        postings[token] = ids
+                    else:
+                        del postings[token]
+            self._write(self._shard_path(shard), postings)
+        self._dirty.clear()
+
+    def flush(self):
+        self._write_dirty_shards()
+        if self._meta_dirty:
+            self._write(os.path.join(self.directory, "docs.z"), {"next_id": self.next_id, "docs": self.docs})
+            self._meta_dirty = False
+        # 상한을 넘으면 오래된 문서부터 10%씩 제거
+        while self.docs and self.disk_bytes() > self.max_bytes:
+            oldest = sorted(self.docs, key=lambda u: self.docs[u]["ts"])
+            for url in oldest[:max(1, len(oldest) // 10)]:
+                self.remove(url)
+            self._write_dirty_shards()
+            self._write(os.path.join(self.directory, "docs.z"), {"next_id": self.next_id, "docs": self.docs})
+            self._meta_dirty = False
+
+    def clear(self):
+        self.docs, self.urls_by_id, self._shards = {}, {}, {}
+        self._dirty.clear()
+        self._removed_ids.clear()
+        self._meta_dirty = False
+        for name in os.listdir(self.directory):
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except OSError:
+                pass
+
+    def stats(self):
+        return {"documents": len(self.docs), "disk_bytes": self.disk_bytes(), "max_bytes": self.max_bytes}
+
+class ContentIndexer(QObject):
+    statsChanged = Signal(dict)
+    searchFinished = Signal(int, list)
+    failed = Signal(str)
+
+    def __init__(self, directory, max_bytes, parent=None):
+        super().__init__(parent)
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._queue = queue.Queue()
+        self._pending_flush = False
+        self._search_seq = 0
+        self.last_stats = {"documents": 0, "disk_bytes": 0, "max_bytes": max_bytes}
+        self._thread = threading.Thread(target=self._run, name="kyo-content-index", daemon=True)
+        self._thread.start()
+        self.statsChanged.connect(self._remember_stats)
+
+        self._flush_timer = QTimer(self)
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.setInterval(CONTENT_INDEX_FLUSH_MS)
+        self._flush_timer.timeout.connect(self.flush)
+
+    def _run(self):
+        index = ContentIndex(self._directory, self._max_bytes)
+        self.statsChanged.emit(index.stats())
+        while True:
+            job = self._queue.get()
+            if job is None:
+                index.flush()
+                return
+            try:
+                job(index)
+            except Exception as exc:
+                # 작업 스레드이므로 시그널로 GUI 스레드에 넘겨 상태바에 표시
+                METRICS.incr("content_index.errors")
+                self.failed.emit(str(exc))
+
+    def _remember_stats(self, stats):
+        self.last_stats = stats
+
+    def submit(self, url, title, text):
+        ts = int(time.time())
+        self._queue.put(lambda index: index.add(url, title or url, text or "", ts))
+        METRICS.incr("content_index.submitted")
+        # 문서마다 쓰지 않고 모아서 한 번에 기록
+        if not self._flush_timer.isActive():
+            self._flush_timer.start()
+
+    def expire(self, retention_days):
+        cutoff = int(time.time()) - retention_days * 86400
+        self._queue.put(lambda index: index.expire(cutoff))
+        self.flush()
+
+    def flush(self):
+        def job(index):
+            started = time.perf_counter()
+            index.flush()
+            METRICS.observe("content_index.flush", (time.perf_counter() - started) * 1000)
+            self.statsChanged.emit(index.stats())
+
+        self._queue.put(job)
+
+    def search(self, query):
+        self._search_seq += 1
+        seq = self._search_seq
+        self._queue.put(lambda index: self.searchFinished.emit(seq, index.search(query)))
+        return seq
+
+    def clear(self):
+        def job(index):
+            index.clear()
+            self.statsChanged.emit(index.stats())
+
+        self._queue.put(job)
+
+    def close(self):
+        self._flush_timer.stop()
+        self._queue.put(None)
+        self._thread.join(timeout=5)
+
+# ------------------------------------------------------
+# 📦 즐겨찾기 오프라인 보관 (MHTML, 내용 주소 저장소)
+# ------------------------------------------------------
+def _ingest_archive(url, title, tmp_path, blob_dir):
+    # 내용 해시를 파일 이름으로 써서 같은 스냅샷은 한 번만 저장하고, 쓰다 만 파일은 보이지 않게 함
+    digest = hashlib.sha256()
+    with open(tmp_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    sha = digest.hexdigest()
+    size = os.path.getsize(tmp_path)
+    path = os.path.join(blob_dir, sha[:2], sha + ".mhtml")
+    if os.path.exists(path):
+        os.remove(tmp_path)
+    else:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        os.replace(tmp_path, path)
+    return url, title, sha, size
+
+class ArchiveStore:
+    def __init__(self, directory):
+        self.directory = directory
+        self.blob_dir = os.path.join(directory, "blobs")
+        self.tmp_dir = os.path.join(directory, "tmp")
+        self.index_path = os.path.join(directory, "index.json")
+        os.makedirs(self.blob_dir, exist_ok=True)
+        # 이전 실행에서 끝나지 못한 임시 파일 정리
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+        os.makedirs(self.tmp_dir, exist_ok=True)
+        self.entries = {}  # url -> {"sha", "size", "title", "archived_at", "opened_at"}
+        for url, entry in load_json_file(self.index_path, {}).items():
+            if isinstance(entry, dict) and os.path.exists(self._blob_path(entry.get("sha", ""))):
+                self.entries[url] = entry
+
+    def _blob_path(self, sha):
+        return os.path.join(self.blob_dir, sha[:2], sha + ".mhtml")
+
+    def entry(self, url):
+        return self.entries.get(url)
+
+    def path_for(self, url):
+        entry = self.entries.get(url)
+        if not entry:
+            return None
+        entry["opened_at"] = time.time()
+        self.save()
+        return self._blob_path(entry["sha"])
+
+    def total_bytes(self):
+        return sum({entry["sha"]: entry["size"] for entry in self.entries.values()}.values())
+
+    def record(self, url, title, sha, size):
+        old = self.entries.get(url)
+        self.entries[url] = {"sha": sha, "size": size, "title": title, "archived_at": time.time(), "opened_at": 0}
+        if old and old["sha"] != sha:
+            self._release(old["sha"])
+
+    def remove(self, url):
+        entry = self.entries.pop(url, None)
+        if entry:
+            self._release(entry["sha"])
+            self.save()
+
+    def _release(self, sha):
+        if any(entry["sha"] == sha for entry in self.entries.values()):
+            return
+        try:
+            os.remove(self._blob_path(sha))
+        except OSError:
+            pass
+
+    def enforce(self, max_bytes):
+        # 최근에 보관하거나 열어 본 적이 없는 것부터 지움
+        evicted = 0
+        while self.entries and self.total_bytes() > max_bytes:
+            url = min(self.entries, key=lambda u: max(self.entries[u]["archived_at"], self.entries[u]["opened_at"]))
+            entry = self.entries.pop(url)
+            self._release(entry["sha"])
+            evicted += 1
+        return evicted
+
+    def stale_urls(self, urls, max_age_days):
+        cutoff = time.time() - max_age_days * 86400
+        return [url for url in urls if url in self.entries and self.entries[url]["archived_at"] < cutoff]
+
+    def clear(self):
+        self.entries = {}
+        shutil.rmtree(self.blob_dir, ignore_errors=True)
+        os.makedirs(self.blob_dir, exist_ok=True)
+        self.save()
+
+    def save(self):
+        save_json_file(self.index_path, self.entries)
+
+class OfflineArchiver(QObject):
+    # 숨은 페이지로 불러와 QWebEnginePage.save(MHTML) 로 저장, 동시에 ARCHIVE_CONCURRENCY 개까지
+    changed = Signal()
+
+    def __init__(self, profile, store, max_bytes, parent=None):
+        super().__init__(parent)
+        self.profile = profile
+        self.store = store
+        self.max_bytes = max_bytes
+        self.pending = []  # [(url, title)]
+        self.active = {}  # page -> {"url", "title", "state", "timer", "tmp_path"}
+        self.failures = {}  # url -> 사유
+        self._tasks = set()
+
+    def is_busy(self, url):
+        return any(u == url for u, _t in self.pending) or any(job["url"] == url for job in self.active.values())
+
+    def enqueue(self, items):
+        added = 0
+        for url, title in items:
+            if urlsplit(url).scheme not in {"http", "https"} or self.is_busy(url):
+                continue
+            self.pending.append((url, title))
+            self.failures.pop(url, None)
+            added += 1
+        self._pump()
+        self.changed.emit()
+        return added
+
+    def _pump(self):
+        while self.pending and len(self.active) < ARCHIVE_CONCURRENCY:
+            url, title = self.pending.pop(0)
+            page = QWebEnginePage(self.profile, self)
+            page.setAudioMuted(True)
+            timer = QTimer(self)
+            timer.setSingleShot(True)
+            timer.timeout.connect(lambda p=page: self._finish(p, "시간 초과"))
+            self.active[page] = {"url": url, "title": title, "state": "loading", "timer": timer, "tmp_path": None}
+            page.loadFinished.connect(lambda ok, p=page: self._on_loaded(p, ok))
+            timer.start(ARCHIVE_TIMEOUT_S * 1000)
+            page.load(QUrl(url))
+
+    def _on_loaded(self, page, ok):
+        job = self.active.get(page)
+        if not job or job["state"] != "loading":
+            return
+        if not ok:
+            self._finish(page, "불러오기 실패")
+            return
+        job["state"] = "settling"
+        # 늦게 붙는 이미지/스크립트 결과까지 담기도록 잠시 기다렸다가 저장
+        QTimer.singleShot(ARCHIVE_SETTLE_MS, lambda p=page: self._save(p))
+
+    def _save(self, page):
+        job = self.active.get(page)
+        if not job or job["state"] != "settling":
+            return
+        job["state"] = "saving"
+        name = f"{hashlib.sha1(job['url'].encode('utf-8')).hexdigest()}-{time.time_ns()}.mhtml"
+        job["tmp_path"] = os.path.join(self.store.tmp_dir, name)
+        page.save(job["tmp_path"], QWebEngineDownloadRequest.SavePageFormat.MimeHtmlSaveFormat)
+
+    def claim_download(self, item):
+        # page.save() 도 profile.downloadRequested 로 들어오므로 저장 대화상자보다 먼저 가로챔
+        page = item.page()
+        job = self.active.get(page)
+        if not job or job["state"] != "saving":
+            return False
+        item.setDownloadDirectory(os.path.dirname(job["tmp_path"]))
+        item.setDownloadFileName(os.path.basename(job["tmp_path"]))
+        item.isFinishedChanged.connect(lambda i=item, p=page: self._on_download_finished(p, i))
+        item.accept()
+        return True
+
+    def _on_download_finished(self, page, item):
+        job = self.active.get(page)
+        if not job or not item.isFinished():
+            return
+        if item.state() != QWebEngineDownloadRequest.DownloadState.DownloadCompleted:
+            self._finish(page, "저장 실패")
+            return
+        task = BackgroundTask(_ingest_archive, job["url"], job["title"], job["tmp_path"], self.store.blob_dir)
+        task.signals.finished.connect(self._on_ingested)
+        task.signals.failed.connect(self._on_ingest_failed)
+        self._tasks.add(task)
+        QThreadPool.globalInstance().start(task)
+        self._finish(page)
+
+    def _on_ingested(self, result):
+        self._tasks = {t for t in self._tasks if t.signals is not self.sender()}
+        url, title, sha, size = result
+        self.store.record(url, title, sha, size)
+        self.store.enforce(self.max_bytes)
+        self.store.save()
+        METRICS.incr("archive.saved")
+        self.changed.emit()
+
+    def _on_ingest_failed(self, message):
+        # 다른 보관 실패와 같이 즐겨찾기 관리자의 오프라인 열에 사유를 남김
+        task = next((t for t in self._tasks if t.signals is self.sender()), None)
+        self._tasks.discard(task)
+        if task:
+            self.failures[task.args[0]] = f"저장 실패: {message}"
+        METRICS.incr("archive.failed")
+        self.changed.emit()
+
+    def _finish(self, page, error=None):
+        job = self.active.pop(page, None)
+        if not job:
+            return
+        job["timer"].stop()
+        job["timer"].deleteLater()
+        page.deleteLater()
+        if error:
+            self.failures[job["url"]] = error
+            METRICS.incr("archive.failed")
+        self._pump()
+        self.changed.emit()
+
+    def status_text(self):
+        waiting = len(self.pending) + len(self.active)
+        size = f"{self.store.total_bytes() / 1048576:,.1f} MB / {self.max_bytes / 1048576:,.0f} MB"
+        return f"보관본 {len(self.store.entries)}개 · {size}" + (f" · 보관 중 {waiting}개" if waiting else "")
+
+# ------------------------------------------------------
+# 🏠 kyo:// 내부 페이지 (새 탭 등)
+# ------------------------------------------------------
+INTERNAL_PAGE_STYLE = """
+:root { color-scheme: light dark; --bg: #f6f7f9; --fg: #202124; --card: #ffffff; --line: #dadce0; --muted: #5f6368; }
+@media (prefers-color-scheme: dark) {
+  :root { --bg: #1f2329; --fg: #e8eaed; --card: #262b33; --line: #343a45; --muted: #9aa0a6; }
+}
+body { margin: 0; padding: 32px; background: var(--bg); color: var(--fg); font-family: "Malgun Gothic", "Segoe UI", sans-serif; }
+a { color: inherit; text-decoration: none; }
+h2 { font-size: 15px; color: var(--muted); font-weight: 600; margin: 28px 0 12px; }
+"""
+
+NEW_TAB_STYLE = """
+form { display: flex; justify-content: center; margin: 24px 0 8px; }
+input[type=search] { width: min(640px, 90%); padding: 12px 16px; font-size: 16px; border-radius: 24px;
+  border: 1px solid var(--line); background: var(--card); color: var(--fg); outline: none; }
+.tiles { display: grid; grid-template-columns: repeat(auto-fill, minmax(200px, 1fr)); gap: 14px; }
+.tile { background: var(--card); border: 1px solid var(--line); border-radius: 8px; overflow: hidden; }
+.tile .thumb { height: 125px; background: var(--line) center top / cover no-repeat; }
+.tile .label { padding: 8px 10px; font-size: 13px; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+.bookmarks { display: flex; flex-wrap: wrap; gap: 8px; }
+.bookmarks a { background: var(--card); border: 1px solid var(--line); border-radius: 16px; padding: 6px 12px;
+  font-size: 13px; max-width: 220px; white-space: nowrap; overflow: hidden; text-overflow: ellipsis; }
+"""
+
+PERF_PAGE_STYLE = """
+h1 { font-size: 20px; margin: 0 0 4px; }
+.hint { color: var(--muted); font-size: 12px; margin: 0; }
+table { border-collapse: collapse; width: 100%; background: var(--card); font-size: 12px; }
+th, td { border: 1px solid var(--line); padding: 4px 8px; text-align: left; }
+th { color: var(--muted); font-weight: 600; }
+"""
+
+CRASHED_PAGE_STYLE = """
+body { max-width: 640px; margin: 10vh auto; }
+h1 { font-size: 20px; }
+.hint { color: var(--muted); font-size: 13px; }
+.button { display: inline-block; background: #4f7cff; color: #ffffff; border-radius: 6px; padding: 8px 16px; }
+"""
+
+class KyoSchemeHandler(QWebEngineUrlSchemeHandler):
+    def __init__(self, browser, parent=None):
+        super().__init__(parent)
+        self.browser = browser
+        # 호스트 -> (url) -> (mime, bytes) | None
+        self.routes = {
+            "newtab": self._newtab_page,
+            "thumb": self._thumbnail,
+            "perf": self._perf_page,
+            "crashed": self._crashed_page,
+        }
+
+    def requestStarted(self, job):
+        url = job.requestUrl()
+        route = self.routes.get(url.host())
+        if route is None:
+            job.fail(QWebEngineUrlRequestJob.UrlNotFound)
+            return
+        try:
+            result = route(url)
+        except Exception as exc:
+            METRICS.incr("kyo_scheme.errors")
+            self.browser.status_label.setText(f"내부 페이지 오류 ({url.toString()}): {exc}")
+            job.fail(QWebEngineUrlRequestJob.RequestFailed)
+            return
+        if result is None:
+            job.fail(QWebEngineUrlRequestJob.UrlNotFound)
+            return
+        mime, body = result
+        buf = QBuffer(job)
+        buf.setData(body)
+        buf.open(QIODevice.ReadOnly)
+        job.reply(mime, buf)
+
+    def _thumbnail(self, url):
+        key = url.path().strip("/")
+        path = self.browser.thumbnails.file_for_key(key)
+        if not path or not os.path.exists(path):
+            return None
+        with open(path, "rb") as f:
+            return b"image/jpeg", f.read()
+
+    def _newtab_page(self, _url):
+        esc = html.escape
+        tiles = []
+        for site in self.browser.top_sites(NEW_TAB_TOP_SITES):
+            thumb = ""
+            if self.browser.thumbnails.has(site["url"]):
+                thumb = f" style=\"background-image:url('kyo://thumb/{ThumbnailCache.key_for(site['url'])}')\""
+            tiles.append(
+                f'<a class="tile" href="{esc(site["url"])}" title="{esc(site["url"])}">'
+                f'<div class="thumb"{thumb}></div><div class="label">{esc(site["title"])}</div></a>'
+            )
+        bookmarks = []
+        for bm in self.browser.bookmarks[:NEW_TAB_BOOKMARKS]:
+            url = bm.get("url", "")
+            if url:
+                title = bm.get("title") or url
+                bookmarks.append(f'<a href="{esc(url)}" title="{esc(url)}">{esc(title)}</a>')
+
+        sections = []
+        if tiles:
+            sections.append(f'<h2>자주 방문한 사이트</h2><div class="tiles">{"".join(tiles)}</div>')
+        if bookmarks:
+            sections.append(f'<h2>즐겨찾기</h2><div class="bookmarks">{"".join(bookmarks)}</div>')
+        page = (
+            '<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>새 탭</title>'
+            f'<style>{INTERNAL_PAGE_STYLE}{NEW_TAB_STYLE}</style></head><body>'
+            '<form action="https://www.google.com/search" method="get">'
+            '<input type="search" name="q" placeholder="검색어 또는 URL 입력" autofocus></form>'
+            f'{"".join(sections)}</body></html>'
+        )
+        return b"text/html", page.encode("utf-8")
+
+    def _crashed_page(self, url):
+        esc = html.escape
+        query = parse_qs(url.query())
+        target = query.get("url", [""])[0]
+        reason = query.get("reason", [""])[0]
+        retry = f'<p><a class="button" href="{esc(target)}">다시 불러오기</a></p>' if target else ""
+        page = (
+            '<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>탭이 멈췄습니다</title>'
+            f'<style>{INTERNAL_PAGE_STYLE}{CRASHED_PAGE_STYLE}</style></head><body>'
+            '<h1>이 탭의 렌더러가 반복해서 종료되었습니다</h1>'
+            f'<p>{esc(target)}</p><p class="hint">사유: {esc(reason)} · 자동으로 {CRASH_MAX_RELOADS}번 다시 불러왔지만 '
+            '계속 종료되어 메모리를 아끼기 위해 멈춰 두었습니다.</p>'
+            f'{retry}</body></html>'
+        )
+        return b"text/html", page.encode("utf-8")
+
+    def _perf_page(self, url):
+        if url.path().rstrip("/") == "/trace":
+            return b"application/json", json.dumps(TRACE.to_trace(), ensure_ascii=False).encode("utf-8")
+        snapshot = METRICS.snapshot()
+        if url.path().rstrip("/") == "/json":
+            return b"application/json", json.dumps(snapshot, ensure_ascii=False, indent=2).encode("utf-8")
+
+        esc = html.escape
+
+        def table(headers, rows):
+            head = "".join(f"<th>{esc(str(h))}</th>" for h in headers)
+            body = "".join(
+                "<tr>" + "".join(f"<td>{esc('' if v is None else str(v))}</td>" for v in row) + "</tr>"
+                for row in rows
+            )
+            return f"<table><tr>{head}</tr>{body}</table>"
+
+        def mb(value):
+            return f"{value / 1048576:.1f} MB" if isinstance(value, (int, float)) else "-"
+
+        sections = []
+        tabs = snapshot.get("tabs", [])
+        sections.append(f"<h2>탭 ({len(tabs)})</h2>" + table(
+            ["제목", "상태", "렌더러 PID", "메모리", "URL"],
+            [(t["title"][:40], t["lifecycle"], t["pid"], mb(t["rss_bytes"]), t["url"][:80]) for t in tabs],
+        ))
+        process = snapshot.get("process", {})
+        sections.append("<h2>프로세스</h2>" + table(
+            ["항목", "값"],
+            [("브라우저 PID", process.get("pid")), ("브라우저 메모리", mb(process.get("rss_bytes"))),
+             ("렌더러 메모리 합계", mb(process.get("renderer_rss_bytes"))), ("가동 시간", f"{snapshot['uptime_s']} s")],
+        ))
+        stores = snapshot.get("stores", {})
+        sections.append("<h2>저장소</h2>" + table(
+            ["이름", "항목 수", "파일 크기"],
+            [(name, info.get("items"), mb(info.get("file_bytes"))) for name, info in stores.items()],
+        ))
+        sections.append("<h2>타이밍</h2>" + table(
+            ["이름", "횟수", "평균(ms)", "최대(ms)", "최근(ms)"],
+            [(name, t["count"], t["avg_ms"], t["max_ms"], t["last_ms"]) for name, t in sorted(snapshot["timings"].items())],
+        ))
+        sections.append("<h2>카운터</h2>" + table(
+            ["이름", "값"],
+            sorted(snapshot["counters"].items()) + sorted(snapshot["gauges"].items()),
+        ))
+        downloads = snapshot.get("downloads", [])
+        if downloads:
+            sections.append("<h2>다운로드</h2>" + table(
+                ["파일", "상태", "받은 크기", "전체 크기", "평균 속도"],
+                [(d["filename"], d["state"], mb(d["received_bytes"]), mb(d["total_bytes"]),
+                  f"{d['avg_bytes_per_s'] / 1024:.0f} KB/s" if d["avg_bytes_per_s"] is not None else "-")
+                 for d in downloads],
+            ))
+        page = (
+            '<!DOCTYPE html><html lang="ko"><head><meta charset="utf-8"><title>Kyo 성능 진단</title>'
+            '<meta http-equiv="refresh" content="2">'
+            f'<style>{INTERNAL_PAGE_STYLE}{PERF_PAGE_STYLE}</style></head><body>'
+            '<h1>Kyo 성능 진단</h1><p class="hint">2초마다 갱신 · JSON: '
+            '<a href="kyo://perf/json">kyo://perf/json</a></p>'
+            f'{"".join(sections)}</body></html>'
+        )
+        return b"text/html", page.encode("utf-8")
 
 # ------------------------------------------------------
 # 📥 다운로드 관리자
@@ -220,6 +2246,12 @@ class DownloadManager(QDialog):
         layout.addWidget(self.table)
 
         self.downloads = []
+        # receivedBytesChanged 는 아주 잦으므로 진행률 표시는 모아서 한 번에 갱신
+        self._dirty_progress = {}
+        self._progress_timer = QTimer(self)
+        self._progress_timer.setSingleShot(True)
+        self._progress_timer.setInterval(DOWNLOAD_PROGRESS_MS)
+        self._progress_timer.timeout.connect(self._flush_progress)
 
         self.table.setAlternatingRowColors(True)
         self.table.setSelectionBehavior(QTableWidget.SelectRows)
@@ -263,23 +2295,41 @@ class DownloadManager(QDialog):
             "btn_cancel": btn_cancel,
             "btn_open": btn_open,
             "btn_folder": btn_folder,
+            "started_at": time.monotonic(),
+            "last_bytes": 0,
         }
         self.downloads.append(info)
+        METRICS.incr("downloads.started")
 
         btn_cancel.clicked.connect(lambda: self.cancel_download(info))
         btn_open.clicked.connect(lambda: self.open_download(info))
         btn_folder.clicked.connect(lambda: self.open_download_folder(info))
 
-        download_item.receivedBytesChanged.connect(lambda: self.update_progress(info))
+        download_item.receivedBytesChanged.connect(lambda: self._queue_progress(info))
         download_item.stateChanged.connect(lambda s: self.on_state_changed(info, s))
 
         if not self.isVisible():
             self.show()
 
+    def _queue_progress(self, info):
+        self._dirty_progress[id(info)] = info
+        if not self._progress_timer.isActive():
+            self._progress_timer.start()
+
+    def _flush_progress(self):
+        dirty, self._dirty_progress = self._dirty_progress, {}
+        with TRACE.span("downloads.progress_batch", "downloads", items=len(dirty)):
+            for info in dirty.values():
+                if info in self.downloads:
+                    self.update_progress(info)
+
     def update_progress(self, info):
         item = info["item"]
         rcv = item.receivedBytes()
         tot = item.totalBytes()
+        if rcv > info["last_bytes"]:
+            METRICS.incr("downloads.bytes", rcv - info["last_bytes"])
+            info["last_bytes"] = rcv
 
         if tot > 0:
             pct = int((rcv / tot) * 100)
@@ -289,7 +2339,28 @@ class DownloadManager(QDialog):
             self.table.setItem(info["row"], 1, QTableWidgetItem(f"{rcv:,} bytes"))
             self.table.setItem(info["row"], 2, QTableWidgetItem("진행 중…"))
 
+    def metrics_snapshot(self):
+        now = time.monotonic()
+        rows = []
+        for info in self.downloads:
+            item = info["item"]
+            elapsed = max(0.001, now - info["started_at"])
+            rows.append({
+                "filename": info["filename"],
+                "state": item.state().name,
+                "received_bytes": item.receivedBytes(),
+                "total_bytes": item.totalBytes(),
+                "avg_bytes_per_s": int(item.receivedBytes() / elapsed) if not item.isFinished() else None,
+            })
+        return rows
+
     def on_state_changed(self, info, state):
+        if state in (
+            QWebEngineDownloadRequest.DownloadCompleted,
+            QWebEngineDownloadRequest.DownloadCancelled,
+            QWebEngineDownloadRequest.DownloadInterrupted,
+        ):
+            METRICS.incr("downloads." + state.name.replace("Download", "").lower())
         if state == QWebEngineDownloadRequest.DownloadCompleted:
             fp = self._download_path(info)
             if os.path.exists(fp):
@@ -360,50 +2431,1071 @@ class DownloadManager(QDialog):
         return os.path.join(item.downloadDirectory(), filename)
 
 # ------------------------------------------------------
-# ⭐ 즐겨찾기 관리자 (별도 다이얼로그)
+# 📚 즐겨찾기 가져오기/내보내기 (Netscape HTML, Chromium JSON)
 # ------------------------------------------------------
-class BookmarkManager(QDialog):
-    def __init__(self, browser, parent=None):
-        super().__init__(parent)
-        self.browser = browser
-        self.setWindowTitle("즐겨찾기 관리자")
-        self.resize(720, 320)
-
-        layout = QVBoxLayout(self)
-        self.table = QTableWidget(0, 3, self)
-        self.table.setHorizontalHeaderLabels(["제목", "URL", "액션"])
-        layout.addWidget(self.table)
+# Chromium 시각: 1601-01-01 UTC 부터의 마이크로초
+WEBKIT_EPOCH_OFFSET_US = 11_644_473_600 * 1_000_000
+BOOKMARK_IMPORT_SCHEMES = {"http", "https", "file", "ftp"}
 
-        self.refresh()
+def webkit_to_iso(value):
+    us = to_int(value, 0)
+    if us <= WEBKIT_EPOCH_OFFSET_US:
+        return None
+    return datetime.fromtimestamp((us - WEBKIT_EPOCH_OFFSET_US) / 1_000_000).isoformat(timespec="seconds")
 
-    def refresh(self):
-        self.table.setRowCount(0)
-        for idx, bm in enumerate(self.browser.bookmarks):
-            row = self.table.rowCount()
-            self.table.insertRow(row)
+def iso_to_webkit(text):
+    try:
+        return int(datetime.fromisoformat(str(text)).timestamp() * 1_000_000) + WEBKIT_EPOCH_OFFSET_US
+    except (TypeError, ValueError):
+        return 0
 
-            self.table.setItem(row, 0, QTableWidgetItem(bm.get("title", "")))
-            self.table.setItem(row, 1, QTableWidgetItem(bm.get("url", "")))
+def canonical_url(url):
+    # 중복 판단용: 스킴/호스트 소문자, 기본 포트와 #조각 제거, 빈 경로는 "/"
+    parts = urlsplit(str(url or "").strip())
+    scheme = parts.scheme.lower()
+    try:
+        port = parts.port
+    except ValueError:
+        port = None
+    netloc = (parts.hostname or "").lower()
+    if port and (scheme, port) not in {("http", 80), ("https", 443)}:
+        netloc += f":{port}"
+    return urlunsplit((scheme, netloc, parts.path or "/", parts.query, ""))
+
+class NetscapeBookmarkParser(HTMLParser):
+    # <DT><H3>폴더</H3><DL> … </DL> 구조를 조각 단위로 받아 즐겨찾기마다 콜백
+    def __init__(self, on_bookmark):
+        super().__init__(convert_charrefs=True)
+        self.on_bookmark = on_bookmark
+        self.stack = []  # 열린 <DL> 마다 폴더 이름 (최상위/툴바 폴더는 빈 값)
+        self.pending_folder = None
+        self.folders = 0
+        self._tag = None
+        self._attrs = {}
+        self._text = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag in {"h3", "a"}:
+            self._tag, self._attrs, self._text = tag, dict(attrs), []
+        elif tag == "dl":
+            self.stack.append(self.pending_folder)
+            self.pending_folder = None
+
+    def handle_data(self, data):
+        if self._tag:
+            self._text.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == "dl":
+            if self.stack:
+                self.stack.pop()
+            return
+        if tag != self._tag:
+            return
+        text = " ".join("".join(self._text).split())
+        if tag == "h3":
+            self.folders += 1
+            # 다른 브라우저의 툴바 폴더는 Kyo 즐겨찾기 툴바(최상위)로
+            toolbar = str(self._attrs.get("personal_toolbar_folder", "")).lower() == "true"
+            self.pending_folder = "" if toolbar else (text or "이름 없는 폴더")
+        elif self._attrs.get("href"):
+            added = to_int(self._attrs.get("add_date"), 0)
+            added_at = datetime.fromtimestamp(added).isoformat(timespec="seconds") if added > 0 else None
+            self.on_bookmark(self._attrs["href"], text, [name for name in self.stack if name], added_at)
+        self._tag = None
+
+def iter_chromium_bookmarks(data):
+    # 재귀 없이 폴더 순서대로 (url, 제목, 폴더 경로, 추가 시각) 를 내보냄
+    roots = data.get("roots", {}) if isinstance(data, dict) else {}
+    stack = []
+    for key, node in reversed(list(roots.items())):
+        if isinstance(node, dict):
+            stack.append((iter(node.get("children", [])), [] if key == "bookmark_bar" else [node.get("name") or key]))
+    while stack:
+        children, path = stack[-1]
+        node = next(children, None)
+        if node is None:
+            stack.pop()
+            continue
+        if not isinstance(node, dict):
+            continue
+        if node.get("type") == "folder":
+            stack.append((iter(node.get("children", [])), path + [node.get("name") or "이름 없는 폴더"]))
+        elif node.get("type") == "url":
+            yield node.get("url", ""), node.get("name", ""), path, webkit_to_iso(node.get("date_added"))
+
+def sniff_bookmark_format(path):
+    with open(path, "r", encoding="utf-8-sig", errors="replace") as f:
+        head = f.read(512).lstrip()
+    return "chromium" if head.startswith("{") else "netscape"
+
+def import_bookmarks_file(path, existing_keys):
+    # 작업 스레드에서 실행: 파일 → 새 즐겨찾기 목록 (기존/파일 안의 중복은 정규화 URL 로 제거)
+    seen = set(existing_keys)
+    items = []
+    folders = set()
+    stats = {"total": 0, "duplicates": 0, "skipped": 0}
+
+    def add(url, title, folder, added_at):
+        stats["total"] += 1
+        url = str(url or "").strip()
+        if urlsplit(url).scheme.lower() not in BOOKMARK_IMPORT_SCHEMES:
+            stats["skipped"] += 1  # javascript: 북마클릿, place: 등
+            return
+        key = canonical_url(url)
+        if key in seen:
+            stats["duplicates"] += 1
+            return
+        seen.add(key)
+        entry = {"title": title or url, "url": url}
+        if folder:
+            entry["folder"] = list(folder)
+            folders.add(tuple(folder))
+        if added_at:
+            entry["added_at"] = added_at
+        items.append(entry)
+
+    fmt = sniff_bookmark_format(path)
+    if fmt == "chromium":
+        # Chromium Bookmarks 는 한 덩어리 JSON 이라 파싱은 한 번에, 순회는 스트리밍으로
+        with open(path, "r", encoding="utf-8-sig") as f:
+            data = json.load(f)
+        for url, title, folder, added_at in iter_chromium_bookmarks(data):
+            add(url, title, folder, added_at)
+    else:
+        parser = NetscapeBookmarkParser(add)
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            for chunk in iter(lambda: f.read(64 * 1024), ""):
+                parser.feed(chunk)
+        parser.close()
+    return dict(stats, path=path, format=fmt, items=items, folders=len(folders))
+
+def _bookmark_tree(bookmarks):
+    root = {"folders": {}, "items": []}
+    for bm in bookmarks:
+        node = root
+        for name in bm.get("folder") or []:
+            node = node["folders"].setdefault(name, {"folders": {}, "items": []})
+        node["items"].append(bm)
+    return root
+
+def _write_netscape_folder(f, node, depth):
+    esc = html.escape
+    pad = "    " * depth
+    for name, child in node["folders"].items():
+        f.write(f"{pad}<DT><H3>{esc(name)}</H3>\n{pad}<DL><p>\n")
+        _write_netscape_folder(f, child, depth + 1)
+        f.write(f"{pad}</DL><p>\n")
+    for bm in node["items"]:
+        added = iso_to_webkit(bm.get("added_at"))
+        add_date = f' ADD_DATE="{(added - WEBKIT_EPOCH_OFFSET_US) // 1_000_000}"' if added else ""
+        f.write(f'{pad}<DT><A HREF="{esc(bm.get("url", ""))}"{add_date}>{esc(bm.get("title") or bm.get("url", ""))}</A>\n')
+
+def _write_chromium_folder(f, name, node, ids):
+    f.write('{"children": [')
+    first = True
+    for child_name, child in node["folders"].items():
+        f.write("" if first else ", ")
+        _write_chromium_folder(f, child_name, child, ids)
+        first = False
+    for bm in node["items"]:
+        f.write("" if first else ", ")
+        f.write(json.dumps({
+            "date_added": str(iso_to_webkit(bm.get("added_at"))), "id": str(next(ids)),
+            "name": bm.get("title") or bm.get("url", ""), "type": "url", "url": bm.get("url", ""),
+        }, ensure_ascii=False))
+        first = False
+    f.write(f'], "date_added": "0", "date_modified": "0", "id": "{next(ids)}", '
+            f'"name": {json.dumps(name, ensure_ascii=False)}, "type": "folder"}}')
+
+def export_bookmarks_file(path, bookmarks, fmt):
+    # 파일에 바로바로 써 나가고, 다 쓴 뒤에 바꿔치기해서 중간 실패 시 기존 파일을 보존
+    tree = _bookmark_tree(bookmarks)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8", newline="\n") as f:
+        if fmt == "chromium":
+            ids = iter(range(1, 10 ** 9))
+            f.write('{"roots": {"bookmark_bar": ')
+            _write_chromium_folder(f, "북마크바", tree, ids)
+            f.write(', "other": ')
+            _write_chromium_folder(f, "기타 북마크", {"folders": {}, "items": []}, ids)
+            f.write(', "synced": ')
+            _write_chromium_folder(f, "모바일 북마크", {"folders": {}, "items": []}, ids)
+            f.write('}, "version": 1}\n')
+        else:
+            f.write(
+                "<!DOCTYPE NETSCAPE-Bookmark-file-1>\n"
+                '<META HTTP-EQUIV="Content-Type" CONTENT="text/html; charset=UTF-8">\n'
+                "<TITLE>Bookmarks</TITLE>\n<H1>Bookmarks</H1>\n<DL><p>\n"
+                '    <DT><H3 PERSONAL_TOOLBAR_FOLDER="true">즐겨찾기 툴바</H3>\n    <DL><p>\n'
+            )
+            _write_netscape_folder(f, tree, 2)
+            f.write("    </DL><p>\n</DL><p>\n")
+    os.replace(tmp_path, path)
+    return {"path": path, "format": fmt, "count": len(bookmarks)}
 
-            btn_open = QPushButton("열기")
-            btn_edit = QPushButton("편집")
-            btn_delete = QPushButton("삭제")
+# ------------------------------------------------------
+# 🕘 Chromium 방문 기록 가져오기 (History SQLite)
+# ------------------------------------------------------
+HISTORY_IMPORT_CHUNK = 5000
+HISTORY_IMPORT_MAX_VISITS = 200_000
+HISTORY_DIALOG_AUTOSIZE_ROWS = 2000
+
+def default_chromium_history_path():
+    base = os.environ.get("LOCALAPPDATA") or os.path.expanduser("~/.config")
+    for parts in (("Google", "Chrome", "User Data"), ("Microsoft", "Edge", "User Data"), ("google-chrome",), ("chromium",)):
+        path = os.path.join(base, *parts, "Default", "History")
+        if os.path.exists(path):
+            return path
+    return ""
+
+class ChromiumHistoryImporter(QObject):
+    # 실행 중인 Chrome 이 잠근 파일을 건드리지 않도록 복사본을 읽기 전용으로 열고 묶음 단위로 읽음.
+    # 읽은 묶음은 chunk 로 바로 넘기므로 작업 스레드가 전체 목록을 들고 있지 않음
+    progress = Signal(int, int, int)
+    chunk = Signal(list)
+    finished = Signal(object)
+    failed = Signal(str)
+
+    def __init__(self, path, retention_days, existing_keys, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.retention_days = retention_days
+        self.existing_keys = existing_keys
+        self._cancel = threading.Event()
+        self._thread = None
 
-            action_widget = QWidget()
-            h = QHBoxLayout(action_widget)
-            h.setContentsMargins(0, 0, 0, 0)
-            h.addWidget(btn_open)
-            h.addWidget(btn_edit)
-            h.addWidget(btn_delete)
-            self.table.setCellWidget(row, 2, action_widget)
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name="kyo-history-import", daemon=True)
+        self._thread.start()
 
-            btn_open.clicked.connect(lambda _=False, url=bm["url"]: self.browser.create_new_tab(url))
-            btn_edit.clicked.connect(lambda _=False, i=idx: self.edit_bookmark(i))
-            btn_delete.clicked.connect(lambda _=False, i=idx: self.delete_bookmark(i))
+    def cancel(self):
+        self._cancel.set()
 
-    def delete_bookmark(self, index: int):
-        self.browser.delete_bookmark(index)
-        self.refresh()
+    def _run(self):
+        tmp_dir = tempfile.mkdtemp(prefix="kyo-history-")
+        try:
+            self.finished.emit(self._import(tmp_dir))
+        except Exception as exc:
+            # 어떤 예외든 알려야 진행 창이 닫히고 다음 가져오기를 시작할 수 있음
+            self.failed.emit(str(exc))
+        finally:
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    def _connect(self, copy_path):
+        uri = "file:" + pathname2url(copy_path)
+        try:
+            conn = sqlite3.connect(uri + "?mode=ro", uri=True)
+            conn.execute("SELECT 1 FROM visits LIMIT 1")
+            return conn
+        except sqlite3.OperationalError:
+            # WAL 을 읽지 못하는 환경이면 본 파일만 변경 불가로 열기
+            return sqlite3.connect(uri + "?mode=ro&immutable=1", uri=True)
+
+    def _import(self, tmp_dir):
+        copy_path = os.path.join(tmp_dir, "History")
+        shutil.copyfile(self.path, copy_path)
+        if os.path.exists(self.path + "-wal"):
+            shutil.copyfile(self.path + "-wal", copy_path + "-wal")
+        cutoff = datetime.now() - timedelta(days=self.retention_days)
+        cutoff_webkit = int(cutoff.timestamp() * 1_000_000) + WEBKIT_EPOCH_OFFSET_US
+
+        conn = self._connect(copy_path)
+        try:
+            available = conn.execute("SELECT COUNT(*) FROM visits WHERE visit_time >= ?", (cutoff_webkit,)).fetchone()[0]
+            # 기록 전체를 메모리에 두는 구조라 최근 것부터 상한까지만 가져오고, 넘친 수는 결과로 알림
+            total = min(available, HISTORY_IMPORT_MAX_VISITS)
+            self.progress.emit(0, total, available)
+            cursor = conn.execute(
+                "SELECT urls.url, urls.title, visits.visit_time FROM visits JOIN urls ON urls.id = visits.url "
+                "WHERE visits.visit_time >= ? ORDER BY visits.visit_time DESC",
+                (cutoff_webkit,),
+            )
+            read = imported = duplicates = skipped = 0
+            cancelled = False
+            while read < total:
+                if self._cancel.is_set():
+                    cancelled = True
+                    break
+                rows = cursor.fetchmany(HISTORY_IMPORT_CHUNK)
+                if not rows:
+                    break
+                items = []
+                for url, title, visit_time in rows[:total - read]:
+                    try:
+                        scheme = urlsplit(url or "").scheme.lower()
+                        visited_at = webkit_to_iso(visit_time)
+                    except (ValueError, OverflowError, OSError):
+                        # 잘못된 호스트([..]) 나 범위를 벗어난 visit_time 인 행
+                        skipped += 1
+                        continue
+                    if scheme not in BOOKMARK_IMPORT_SCHEMES:
+                        skipped += 1
+                        continue
+                    if not visited_at or (url, visited_at) in self.existing_keys:
+                        duplicates += 1
+                        continue
+                    items.append({"url": url, "title": title or url, "visited_at": visited_at})
+                if items:
+                    imported += len(items)
+                    self.chunk.emit(items)
+                read += len(rows)
+                self.progress.emit(min(read, total), total, available)
+        finally:
+            conn.close()
+        return {
+            "cancelled": cancelled, "imported": imported, "read": min(read, total), "available": available,
+            "capped": available - total, "duplicates": duplicates, "skipped": skipped,
+        }
+
+def merge_history_items(history, items):
+    # 둘 다 최신순으로 맞춘 뒤 병합만 하면 전체 정렬이 필요 없음
+    items = sorted(items, key=lambda item: item.get("visited_at", ""), reverse=True)
+    return list(heapq.merge(history, items, key=lambda item: item.get("visited_at", ""), reverse=True))
+
+# ------------------------------------------------------
+# 📦 사용자 데이터 백업/이전 (압축 NDJSON 스트림)
+# ------------------------------------------------------
+BACKUP_SCHEMA_VERSION = 1
+BACKUP_KINDS = ("settings", "bookmarks", "history", "session")
+BACKUP_KIND_LABELS = {"settings": "환경설정", "bookmarks": "즐겨찾기", "history": "방문 기록", "session": "세션(열린 탭)"}
+BACKUP_FILE_FILTER = "Kyo 백업 (*.ndjson.gz *.ndjson.zst);;gzip (*.ndjson.gz);;zstd (*.ndjson.zst)"
+
+def backup_format_for(path):
+    return "zstd" if path.lower().endswith((".zst", ".zstd")) else "gzip"
+
+def open_backup_stream(path, mode, fmt):
+    # 백업 파일은 한 줄씩 읽고 씀. 가져오기 검증 단계는 파일 크기와 상관없이 메모리가 일정하지만,
+    # 즐겨찾기/방문 기록 저장소 자체가 JSON 배열이라 내보내기·병합할 때는 저장소 전체를 올림
+    if fmt == "zstd":
+        if zstandard is None:
+            raise OSError("zstd 압축을 쓰려면 zstandard 패키지가 필요합니다 (pip install zstandard)")
+        raw = open(path, mode + "b")
+        if mode == "w":
+            stream = zstandard.ZstdCompressor(level=10).stream_writer(raw)
+        else:
+            stream = zstandard.ZstdDecompressor().stream_reader(raw)
+        return io.TextIOWrapper(stream, encoding="utf-8", newline="\n")
+    return gzip.open(path, mode + "t", compresslevel=6, encoding="utf-8", newline="\n")
+
+def validate_backup_record(kind, data):
+    # 올바르면 None, 아니면 이유를 돌려줌
+    if not isinstance(data, dict):
+        return "객체가 아닙니다"
+    if kind in ("bookmarks", "history"):
+        url = data.get("url")
+        if not isinstance(url, str) or not url.strip():
+            return "url 이 없습니다"
+        if not isinstance(data.get("title", ""), str):
+            return "title 이 문자열이 아닙니다"
+    if kind == "history":
+        try:
+            datetime.fromisoformat(data.get("visited_at"))
+        except (TypeError, ValueError):
+            return "visited_at 형식이 잘못되었습니다"
+    elif kind == "bookmarks":
+        folder = data.get("folder", [])
+        if not isinstance(folder, list) or not all(isinstance(name, str) for name in folder):
+            return "folder 는 문자열 목록이어야 합니다"
+    elif kind == "session":
+        if not isinstance(data.get("tabs", []), list) or not isinstance(data.get("recent_closed", []), list):
+            return "tabs/recent_closed 는 목록이어야 합니다"
+    return None
+
+def export_user_data(path, sources):
+    # sources: {종류: 레코드 iterable}. 임시 파일에 끝까지 쓴 뒤 교체하므로 중간에 실패해도 기존 파일은 그대로
+    fmt = backup_format_for(path)
+    tmp_path = path + ".tmp"
+    counts = {kind: 0 for kind in sources}
+    started = time.perf_counter()
+    try:
+        with open_backup_stream(tmp_path, "w", fmt) as out:
+            header = {"kind": "header", "schema": BACKUP_SCHEMA_VERSION, "app": "kyobrowser",
+                      "created_at": now_iso(), "kinds": list(sources)}
+            out.write(json.dumps(header, ensure_ascii=False) + "\n")
+            for kind, records in sources.items():
+                for data in records:
+                    out.write(json.dumps({"kind": kind, "data": data}, ensure_ascii=False, separators=(",", ":")) + "\n")
+                    counts[kind] += 1
+            out.write(json.dumps({"kind": "footer", "counts": counts}) + "\n")
+        os.replace(tmp_path, path)
+    except Exception:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    METRICS.observe("backup.export", (time.perf_counter() - started) * 1000)
+    return {"path": path, "format": fmt, "counts": counts, "bytes": os.path.getsize(path)}
+
+def iter_backup_records(path):
+    # 헤더 → 레코드 → 푸터 순서와 레코드 수를 확인하면서 한 줄씩 돌려줌
+    header = footer = None
+    counts = {}
+    try:
+        with open_backup_stream(path, "r", backup_format_for(path)) as stream:
+            for line_no, line in enumerate(stream, 1):
+                if not line.strip():
+                    continue
+                if footer is not None:
+                    raise ValueError(f"{line_no}행: 푸터 뒤에 데이터가 있습니다")
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    raise ValueError(f"{line_no}행: JSON 형식이 아닙니다") from None
+                kind = record.get("kind") if isinstance(record, dict) else None
+                if header is None:
+                    if kind != "header":
+                        raise ValueError("Kyo Browser 백업 파일이 아닙니다 (헤더 없음)")
+                    if not 1 <= to_int(record.get("schema"), 0) <= BACKUP_SCHEMA_VERSION:
+                        raise ValueError(f"지원하지 않는 스키마 버전입니다: {record.get('schema')}")
+                    header = record
+                    continue
+                if kind == "footer":
+                    footer = record
+                    continue
+                if kind not in BACKUP_KINDS:
+                    raise ValueError(f"{line_no}행: 알 수 없는 레코드 종류 {kind!r}")
+                error = validate_backup_record(kind, record.get("data"))
+                if error:
+                    raise ValueError(f"{line_no}행 ({kind}): {error}")
+                counts[kind] = counts.get(kind, 0) + 1
+                yield kind, record["data"]
+    except EOFError:
+        raise ValueError("파일이 중간에 잘렸습니다") from None
+    except Exception as exc:
+        # 손상된 .zst 는 zstandard.ZstdError 로 오므로 다른 형식 오류와 같이 ValueError 로 알림
+        if zstandard is not None and isinstance(exc, zstandard.ZstdError):
+            raise ValueError(f"zstd 압축을 풀 수 없습니다: {exc}") from None
+        raise
+    if header is None:
+        raise ValueError("빈 백업 파일입니다")
+    if footer is None:
+        raise ValueError("파일이 중간에 잘렸습니다 (푸터 없음)")
+    expected = footer.get("counts") if isinstance(footer.get("counts"), dict) else {}
+    if {kind: to_int(n, 0) for kind, n in expected.items() if to_int(n, 0)} != counts:
+        raise ValueError("레코드 수가 푸터와 다릅니다")
+
+def read_user_data(path, kinds, history_keys, bookmark_keys):
+    # 먼저 끝까지 검증한 뒤(메모리 일정) 다시 읽으며 필요한 종류만 모으므로 잘못된 파일은 아무것도 바꾸지 않음
+    started = time.perf_counter()
+    counts = {}
+    for kind, _data in iter_backup_records(path):
+        counts[kind] = counts.get(kind, 0) + 1
+    result = {"counts": counts, "settings": None, "session": None, "bookmarks": [], "history": [], "duplicates": 0}
+    history_keys = set(history_keys)
+    bookmark_keys = set(bookmark_keys)
+    for kind, data in iter_backup_records(path):
+        if kind not in kinds:
+            continue
+        if kind in ("settings", "session"):
+            result[kind] = data
+        elif kind == "history":
+            key = (data["url"], data["visited_at"])
+            if key in history_keys:
+                result["duplicates"] += 1
+                continue
+            history_keys.add(key)
+            result["history"].append({"url": data["url"], "title": data.get("title") or data["url"], "visited_at": data["visited_at"]})
+        else:
+            key = canonical_url(data["url"])
+            if key in bookmark_keys:
+                result["duplicates"] += 1
+                continue
+            bookmark_keys.add(key)
+            result["bookmarks"].append(data)
+    METRICS.observe("backup.import", (time.perf_counter() - started) * 1000)
+    return result
+
+def _data_kinds_arg(text):
+    kinds = [part.strip() for part in str(text).split(",") if part.strip()]
+    unknown = [kind for kind in kinds if kind not in BACKUP_KINDS]
+    if unknown:
+        raise argparse.ArgumentTypeError(f"알 수 없는 종류: {', '.join(unknown)} (가능: {', '.join(BACKUP_KINDS)})")
+    return kinds
+
+def _instance_running(timeout_ms=200):
+    socket = QLocalSocket()
+    socket.connectToServer(single_instance_name())
+    running = socket.waitForConnected(timeout_ms)
+    socket.disconnectFromServer()
+    return running
+
+def run_data_command(args):
+    # 창을 띄우지 않고 파일끼리 내보내기/가져오기 (여러 PC 로 옮길 때 스크립트에서 사용)
+    if args.data_dir:
+        use_user_data_dir(args.data_dir)
+    kinds = args.data_kinds
+    if args.export_data:
+        sources = {
+            "settings": lambda: [load_json_file(SETTINGS_FILE, DEFAULT_SETTINGS)],
+            "bookmarks": lambda: read_list_store(BOOKMARK_FILE),
+            "history": lambda: read_list_store(HISTORY_FILE),
+            "session": lambda: [load_json_file(SESSION_FILE, {"tabs": [], "current_index": 0, "recent_closed": []})],
+        }
+        try:
+            result = export_user_data(args.export_data, {kind: sources[kind]() for kind in kinds})
+        except (OSError, ValueError) as exc:
+            print(f"내보내기 실패: {exc}")
+            return 1
+        print(json.dumps(result, ensure_ascii=False))
+        return 0
+
+    # 실행 중인 브라우저가 종료하면서 파일을 덮어쓰지 않도록 먼저 확인
+    if QCoreApplication.instance() is None:
+        QCoreApplication([sys.argv[0]])
+    if _instance_running():
+        print("실행 중인 Kyo Browser 를 닫은 뒤 가져오세요.")
+        return 1
+    try:
+        # 손상된 저장소를 빈 목록으로 읽으면 병합 결과로 원본을 덮어쓰게 됨
+        history = read_list_store(HISTORY_FILE)
+        bookmarks = read_list_store(BOOKMARK_FILE)
+        result = read_user_data(
+            args.import_data, set(kinds),
+            {(item.get("url"), item.get("visited_at")) for item in history},
+            {canonical_url(bm.get("url", "")) for bm in bookmarks},
+        )
+    except (OSError, ValueError) as exc:
+        print(f"가져오기 실패: {exc}")
+        return 1
+    settings = load_json_file(SETTINGS_FILE, DEFAULT_SETTINGS)
+    if result["settings"]:
+        settings.update({key: value for key, value in result["settings"].items() if key in DEFAULT_SETTINGS})
+        save_json_file(SETTINGS_FILE, settings)
+    if result["session"]:
+        save_json_file(SESSION_FILE, result["session"])
+    if result["bookmarks"]:
+        save_json_file(BOOKMARK_FILE, bookmarks + result["bookmarks"])
+    if result["history"]:
+        cutoff = (datetime.now() - timedelta(days=max(1, to_int(settings.get("history_retention_days", 90), 90)))).isoformat(timespec="seconds")
+        merged = merge_history_items(history, result["history"])
+        save_json_file(HISTORY_FILE, [item for item in merged if item.get("visited_at", "") >= cutoff])
+    print(json.dumps({
+        "counts": result["counts"], "bookmarks": len(result["bookmarks"]), "history": len(result["history"]),
+        "duplicates": result["duplicates"], "settings": bool(result["settings"]), "session": bool(result["session"]),
+    }, ensure_ascii=False))
+    return 0
+
+# ------------------------------------------------------
+# 🪄 호버 의도 미리 연결/프리페치
+# ------------------------------------------------------
+def url_origin(url):
+    split = urlsplit(url or "")
+    if split.scheme not in ("http", "https") or not split.hostname:
+        return None
+    return f"{split.scheme}://{split.netloc}"
+
+class HoverPrefetcher(QObject):
+    # 포인터가 잠시 머문 링크만 숨은 페이지로 미리 연결(또는 문서 프리페치)한다.
+    # 숨은 문서의 origin 을 대상 origin 으로 두어 실제 이동과 같은 캐시/소켓 파티션을 쓰게 함
+    def __init__(self, profile, mode="preconnect", parent=None):
+        super().__init__(parent)
+        self.profile = profile
+        self.mode = mode
+        self.page = None
+        self._pending = None
+        self._warmed = {}  # origin -> {"at", "url", "source"}
+        self._issued_at = deque()
+        self.counts = {"hovers": 0, "issued": 0, "cancelled": 0, "budget_skipped": 0, "hits": 0, "misses": 0}
+        self.ttfb = {"hit": deque(maxlen=200), "miss": deque(maxlen=200)}
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._fire)
+
+    def set_mode(self, mode):
+        self.mode = mode if mode in HOVER_PREFETCH_MODES else "preconnect"
+        self.leave()
+        self._warmed.clear()
+        if self.mode == "off" and self.page:
+            self.page.deleteLater()
+            self.page = None
+
+    def hover(self, url, source):
+        if self.mode == "off" or not url_origin(url):
+            return
+        if self._pending and self._pending[0] == url and self._timer.isActive():
+            return
+        self.counts["hovers"] += 1
+        self._pending = (url, source)
+        self._timer.start(HOVER_INTENT_MS[self.mode])
+
+    def leave(self):
+        # 머문 시간이 짧으면 요청을 아예 보내지 않음 (이미 보낸 프리페치는 Chromium 이 끝까지 받음)
+        if self._timer.isActive():
+            self._timer.stop()
+            self.counts["cancelled"] += 1
+            METRICS.incr("prefetch.cancelled")
+        self._pending = None
+
+    def _expire(self, now):
+        ttl = HOVER_WARM_TTL_S.get(self.mode, 0)
+        for origin in [o for o, entry in self._warmed.items() if now - entry["at"] > ttl]:
+            del self._warmed[origin]
+
+    def _fire(self):
+        if not self._pending:
+            return
+        url, source = self._pending
+        self._pending = None
+        origin = url_origin(url)
+        now = time.monotonic()
+        self._expire(now)
+        warmed = self._warmed.get(origin)
+        if warmed and (self.mode == "preconnect" or warmed["url"] == url):
+            return
+        while self._issued_at and now - self._issued_at[0] > 60:
+            self._issued_at.popleft()
+        if len(self._issued_at) >= HOVER_PREFETCH_BUDGET_PER_MIN:
+            self.counts["budget_skipped"] += 1
+            METRICS.incr("prefetch.budget_skipped")
+            return
+        self._issued_at.append(now)
+        self._warmed[origin] = {"at": now, "url": url, "source": source}
+        self.counts["issued"] += 1
+        METRICS.incr(f"prefetch.issued.{source}")
+        if self.page is None:
+            self.page = QWebEnginePage(self.profile, self)
+        links = [
+            f'<link rel="dns-prefetch" href="{html.escape(origin)}">',
+            f'<link rel="preconnect" href="{html.escape(origin)}">',
+        ]
+        if self.mode == "prefetch":
+            links.append(f'<link rel="prefetch" as="document" href="{html.escape(url)}">')
+        self.page.setHtml("<!doctype html><head>" + "".join(links) + "</head>", QUrl(origin + "/"))
+
+    def note_click(self, url):
+        # 추적 대상(즐겨찾기/자동 완성)에서 연 링크가 미리 데운 origin 이었는지
+        if self.mode == "off" or not url_origin(url):
+            return None
+        if self._pending and self._pending[0] == url:
+            self._timer.stop()
+            self._pending = None
+        now = time.monotonic()
+        self._expire(now)
+        warmed = self._warmed.get(url_origin(url))
+        if warmed and (self.mode == "preconnect" or warmed["url"] == url):
+            self.counts["hits"] += 1
+            METRICS.incr("prefetch.hit")
+            METRICS.observe("prefetch.lead", (now - warmed["at"]) * 1000)
+            return "hit"
+        self.counts["misses"] += 1
+        METRICS.incr("prefetch.miss")
+        return "miss"
+
+    def record_ttfb(self, outcome, ttfb_ms):
+        self.ttfb[outcome].append(ttfb_ms)
+        METRICS.observe(f"prefetch.ttfb.{outcome}", ttfb_ms)
+
+    def eventFilter(self, obj, event):
+        # 즐겨찾기 툴바 버튼(prefetch_url 속성)과 자동 완성 목록에 설치
+        if event.type() == QEvent.Enter and obj.property("prefetch_url"):
+            self.hover(obj.property("prefetch_url"), obj.property("prefetch_source") or "toolbar")
+        elif event.type() in (QEvent.Leave, QEvent.Hide):
+            self.leave()
+        return False
+
+    def metrics_snapshot(self):
+        clicks = self.counts["hits"] + self.counts["misses"]
+        hit_p50 = percentile(list(self.ttfb["hit"]), 50)
+        miss_p50 = percentile(list(self.ttfb["miss"]), 50)
+        return {
+            "mode": self.mode,
+            **self.counts,
+            "warm_origins": len(self._warmed),
+            "hit_rate": round(self.counts["hits"] / clicks, 3) if clicks else None,
+            "waste_rate": round(1 - self.counts["hits"] / self.counts["issued"], 3) if self.counts["issued"] else None,
+            "ttfb_p50_hit_ms": hit_p50,
+            "ttfb_p50_miss_ms": miss_p50,
+            "saved_ms_p50": round(miss_p50 - hit_p50, 1) if hit_p50 is not None and miss_p50 is not None else None,
+        }
+
+# ------------------------------------------------------
+# 🔎 주소창 자동 완성 (방문 기록 + 즐겨찾기)
+# ------------------------------------------------------
+def _omnibox_key(url):
+    text = url.lower().split("://", 1)[-1]
+    return text[4:] if text.startswith("www.") else text
+
+def build_omnibox_index(history, bookmarks):
+    # URL 단위로 묶어 방문 횟수(즐겨찾기는 가산점)로 정렬해 두고 입력마다 이 목록만 훑음
+    entries = {}
+    for bm in bookmarks:
+        url = bm.get("url", "")
+        if url_origin(url):
+            entries[url] = {"url": url, "title": bm.get("title") or url, "score": 5}
+    for item in history:
+        url = item.get("url", "")
+        if not url_origin(url):
+            continue
+        entry = entries.get(url)
+        if entry is None:
+            entry = entries[url] = {"url": url, "title": item.get("title") or url, "score": 0}
+        entry["score"] += 1
+    ranked = sorted(entries.values(), key=lambda e: e["score"], reverse=True)
+    return [(_omnibox_key(e["url"]), e["title"].lower(), e) for e in ranked]
+
+def omnibox_suggestions(index, text, limit=OMNIBOX_MAX_ROWS):
+    needle = _omnibox_key(text.strip())
+    if not needle:
+        return []
+    prefix, other = [], []
+    for key, title, entry in index:
+        if key.startswith(needle):
+            prefix.append(entry)
+            if len(prefix) >= limit:
+                break
+        elif len(other) < limit and (needle in key or needle in title):
+            other.append(entry)
+    return (prefix + other)[:limit]
+
+class OmniboxCompleter(QCompleter):
+    # 모델은 입력할 때마다 직접 채우고(필터링 없음) 선택 시 URL 을 넣음
+    def __init__(self, browser, line_edit):
+        super().__init__(line_edit)
+        self.browser = browser
+        self.line_edit = line_edit
+        self.model = QStandardItemModel(self)
+        self.setModel(self.model)
+        self.setWidget(line_edit)
+        self.setCompletionMode(QCompleter.UnfilteredPopupCompletion)
+        self.setCompletionRole(Qt.UserRole)
+        self.setMaxVisibleItems(OMNIBOX_MAX_ROWS)
+        popup = self.popup()
+        popup.setMouseTracking(True)
+        popup.entered.connect(self._on_entered)
+        popup.selectionModel().currentChanged.connect(self._on_entered)
+        popup.viewport().installEventFilter(browser.hover_prefetcher)
+        popup.installEventFilter(browser.hover_prefetcher)
+        line_edit.textEdited.connect(self._update)
+
+    def _update(self, text):
+        rows = omnibox_suggestions(self.browser.omnibox_index(), text)
+        self.model.clear()
+        for entry in rows:
+            item = QStandardItem(f"{entry['title'][:60]}  —  {entry['url']}")
+            item.setData(entry["url"], Qt.UserRole)
+            item.setToolTip(entry["url"])
+            self.model.appendRow(item)
+        if rows:
+            self.complete()
+        else:
+            self.popup().hide()
+
+    def _on_entered(self, index):
+        url = index.data(Qt.UserRole) if index.isValid() else None
+        if url:
+            self.browser.hover_prefetcher.hover(url, "omnibox")
+
+# ------------------------------------------------------
+# 🍪 사이트별 쿠키 색인 / 선택 삭제
+# ------------------------------------------------------
+SITE_STORAGE_CLEAR_TIMEOUT_MS = 5000
+SITE_STORAGE_DONE_TITLE = "kyo-storage-cleared"
+# localStorage/sessionStorage/IndexedDB/Cache Storage/서비스 워커 (지원되는 것만)
+CLEAR_SITE_STORAGE_JS = """
+(async () => {
+  const tasks = [];
+  try { localStorage.clear(); } catch (e) {}
+  try { sessionStorage.clear(); } catch (e) {}
+  try {
+    if (indexedDB.databases) {
+      for (const db of await indexedDB.databases()) {
+        if (db.name) tasks.push(new Promise(r => { const q = indexedDB.deleteDatabase(db.name); q.onsuccess = q.onerror = q.onblocked = r; }));
+      }
+    }
+  } catch (e) {}
+  try { if (self.caches) for (const key of await caches.keys()) tasks.push(caches.delete(key)); } catch (e) {}
+  try {
+    if (navigator.serviceWorker) for (const reg of await navigator.serviceWorker.getRegistrations()) tasks.push(reg.unregister());
+  } catch (e) {}
+  try { await Promise.allSettled(tasks); } catch (e) {}
+  document.title = "%s";
+})();
+""" % SITE_STORAGE_DONE_TITLE
+
+def cookie_site(cookie):
+    return cookie.domain().lstrip(".").lower()
+
+def cookie_key(cookie):
+    return bytes(cookie.name()), cookie.domain(), cookie.path()
+
+class SiteDataIndex(QObject):
+    # 쿠키 저장소의 추가/삭제 알림으로 도메인별 쿠키 목록을 메모리에 유지
+    changed = Signal()
+
+    def __init__(self, cookie_store, parent=None):
+        super().__init__(parent)
+        self.cookie_store = cookie_store
+        self.sites = {}  # 도메인 -> {(이름, 도메인, 경로): QNetworkCookie}
+        self._notify_timer = QTimer(self)
+        self._notify_timer.setSingleShot(True)
+        self._notify_timer.setInterval(200)
+        self._notify_timer.timeout.connect(self.changed.emit)
+        cookie_store.cookieAdded.connect(self._on_cookie_added)
+        cookie_store.cookieRemoved.connect(self._on_cookie_removed)
+        # 저장된 쿠키도 cookieAdded 로 한 번씩 흘러 들어옴
+        cookie_store.loadAllCookies()
+
+    def _on_cookie_added(self, cookie):
+        self.sites.setdefault(cookie_site(cookie), {})[cookie_key(cookie)] = QNetworkCookie(cookie)
+        self._notify_timer.start()
+
+    def _on_cookie_removed(self, cookie):
+        site = cookie_site(cookie)
+        cookies = self.sites.get(site)
+        if cookies is None:
+            return
+        cookies.pop(cookie_key(cookie), None)
+        if not cookies:
+            del self.sites[site]
+        self._notify_timer.start()
+
+    def cookie_count(self):
+        return sum(len(cookies) for cookies in self.sites.values())
+
+    def site_rows(self):
+        rows = []
+        for site, cookies in self.sites.items():
+            expiries = [c.expirationDate() for c in cookies.values() if not c.isSessionCookie()]
+            rows.append({
+                "site": site,
+                "cookies": len(cookies),
+                "session": sum(1 for c in cookies.values() if c.isSessionCookie()),
+                "secure": sum(1 for c in cookies.values() if c.isSecure()),
+                "expires": max(expiries).toString("yyyy-MM-dd") if expiries else "",
+            })
+        return sorted(rows, key=lambda r: r["cookies"], reverse=True)
+
+    def delete_site(self, site):
+        # 지운 쿠키는 cookieRemoved 로도 들어오지만 목록이 바로 바뀌도록 먼저 뺌
+        cookies = self.sites.pop(site, {})
+        for cookie in cookies.values():
+            self.cookie_store.deleteCookie(cookie)
+        self._notify_timer.start()
+        return len(cookies)
+
+    def clear(self):
+        self.sites.clear()
+        self._notify_timer.start()
+
+class SiteStorageCleaner(QObject):
+    # 숨은 페이지를 대상 origin 문서로 열어 그 origin 의 저장소만 비움 (한 번에 하나씩)
+    def __init__(self, profile, parent=None):
+        super().__init__(parent)
+        self.profile = profile
+        self.page = None
+        self.queue = deque()
+        self.current = None
+        self._timeout = QTimer(self)
+        self._timeout.setSingleShot(True)
+        self._timeout.setInterval(SITE_STORAGE_CLEAR_TIMEOUT_MS)
+        self._timeout.timeout.connect(self._next)
+
+    def enqueue(self, origins):
+        self.queue.extend(origin for origin in origins if origin not in self.queue and origin != self.current)
+        if self.current is None:
+            self._next()
+
+    def _next(self):
+        self.current = self.queue.popleft() if self.queue else None
+        if self.current is None:
+            self._timeout.stop()
+            return
+        if self.page is None:
+            self.page = QWebEnginePage(self.profile, self)
+            self.page.loadFinished.connect(self._on_load_finished)
+            self.page.titleChanged.connect(self._on_title_changed)
+        self._timeout.start()
+        self.page.setHtml("<!doctype html><title></title>", QUrl(self.current + "/"))
+
+    def _on_load_finished(self, ok):
+        if self.current and ok:
+            self.page.runJavaScript(CLEAR_SITE_STORAGE_JS, QWebEngineScript.ApplicationWorld)
+
+    def _on_title_changed(self, title):
+        if self.current and title == SITE_STORAGE_DONE_TITLE:
+            METRICS.incr("site_data.storage_cleared")
+            self._next()
+
+# ------------------------------------------------------
+# ⭐ 즐겨찾기 관리자 (별도 다이얼로그)
+# ------------------------------------------------------
+class BookmarkManager(QDialog):
+    def __init__(self, browser, parent=None):
+        super().__init__(parent)
+        self.browser = browser
+        self.setWindowTitle("즐겨찾기 관리자")
+        self.resize(900, 360)
+
+        layout = QVBoxLayout(self)
+        top_row = QHBoxLayout()
+        self.archive_status = QLabel("")
+        btn_archive_all = QPushButton("모두 오프라인 보관")
+        btn_archive_all.clicked.connect(lambda: self.browser.archive_bookmarks(range(len(self.browser.bookmarks))))
+        btn_import = QPushButton("가져오기…")
+        btn_import.setToolTip("다른 브라우저에서 내보낸 HTML 또는 Chromium Bookmarks 파일")
+        btn_import.clicked.connect(self._import)
+        btn_export = QPushButton("내보내기…")
+        btn_export.clicked.connect(self._export)
+        top_row.addWidget(self.archive_status, 1)
+        top_row.addWidget(btn_import)
+        top_row.addWidget(btn_export)
+        top_row.addWidget(btn_archive_all)
+        layout.addLayout(top_row)
+
+        self.table = QTableWidget(0, 4, self)
+        self.table.setHorizontalHeaderLabels(["제목", "URL", "폴더", "오프라인"])
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setSelectionMode(QTableWidget.SingleSelection)
+        self.table.cellDoubleClicked.connect(lambda _r, _c: self.open_selected())
+        self.table.setContextMenuPolicy(Qt.CustomContextMenu)
+        self.table.customContextMenuRequested.connect(self._show_context_menu)
+        layout.addWidget(self.table)
+
+        # 행마다 버튼 위젯을 만들면 수만 개 즐겨찾기에서 UI 가 멈추므로 선택한 행에 대한 버튼/메뉴 하나로 처리
+        button_row = QHBoxLayout()
+        btn_open = QPushButton("열기")
+        btn_offline = QPushButton("보관본")
+        btn_archive = QPushButton("보관")
+        btn_archive.setToolTip("지금 페이지를 불러와 오프라인 사본(MHTML)으로 저장")
+        btn_edit = QPushButton("편집")
+        btn_delete = QPushButton("삭제")
+        btn_open.clicked.connect(self.open_selected)
+        btn_offline.clicked.connect(self.open_selected_archive)
+        btn_archive.clicked.connect(self.archive_selected)
+        btn_edit.clicked.connect(self.edit_selected)
+        btn_delete.clicked.connect(self.delete_selected)
+        button_row.addWidget(btn_open)
+        button_row.addWidget(btn_offline)
+        button_row.addWidget(btn_archive)
+        button_row.addWidget(btn_edit)
+        button_row.addWidget(btn_delete)
+        button_row.addStretch(1)
+        layout.addLayout(button_row)
+
+        self._stale = True
+        self.refresh()
+
+    def _archive_text(self, url):
+        archiver = getattr(self.browser, "archiver", None)
+        if archiver and archiver.is_busy(url):
+            return "보관 중…"
+        if archiver and url in archiver.failures:
+            return "실패: " + archiver.failures[url]
+        entry = self.browser.archive_store.entry(url)
+        if not entry:
+            return ""
+        return f"{datetime.fromtimestamp(entry['archived_at']):%Y-%m-%d %H:%M} · {entry['size'] / 1024:,.0f} KB"
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if self._stale:
+            self._populate()
+
+    def refresh(self):
+        # 숨겨져 있으면 다시 열 때 한 번만 그림 (가져오기/보관 진행 중 매번 전체를 다시 만들지 않도록)
+        if not self.isVisible():
+            self._stale = True
+            return
+        self._populate()
+
+    @traced("dialog.refresh", "ui", dialog="bookmarks")
+    def _populate(self):
+        self._stale = False
+        if getattr(self.browser, "archiver", None):
+            self.archive_status.setText(self.browser.archiver.status_text())
+        current = self.table.currentRow()
+        self.table.setUpdatesEnabled(False)
+        self.table.setRowCount(len(self.browser.bookmarks))
+        for row, bm in enumerate(self.browser.bookmarks):
+            title = QTableWidgetItem(bm.get("title", ""))
+            title.setData(Qt.UserRole, row)
+            self.table.setItem(row, 0, title)
+            self.table.setItem(row, 1, QTableWidgetItem(bm.get("url", "")))
+            self.table.setItem(row, 2, QTableWidgetItem(" / ".join(bm.get("folder") or [])))
+            self.table.setItem(row, 3, QTableWidgetItem(self._archive_text(bm.get("url", ""))))
+        if 0 <= current < self.table.rowCount():
+            self.table.selectRow(current)
+        self.table.setUpdatesEnabled(True)
+
+    def _selected_index(self):
+        row = self.table.currentRow()
+        if row < 0:
+            return None
+        item = self.table.item(row, 0)
+        idx = item.data(Qt.UserRole) if item else None
+        return idx if idx is not None and 0 <= idx < len(self.browser.bookmarks) else None
+
+    def _show_context_menu(self, pos):
+        row = self.table.rowAt(pos.y())
+        if row < 0:
+            return
+        self.table.selectRow(row)
+        idx = self._selected_index()
+        if idx is None:
+            return
+        has_archive = self.browser.archive_store.entry(self.browser.bookmarks[idx].get("url", "")) is not None
+        menu = QMenu(self)
+        for text, slot, enabled in (
+            ("열기", self.open_selected, True),
+            ("보관본 열기", self.open_selected_archive, has_archive),
+            ("오프라인 보관", self.archive_selected, True),
+            ("편집", self.edit_selected, True),
+            ("삭제", self.delete_selected, True),
+        ):
+            act = QAction(text, self)
+            act.setEnabled(enabled)
+            act.triggered.connect(slot)
+            menu.addAction(act)
+        menu.exec(self.table.viewport().mapToGlobal(pos))
+
+    def open_selected(self):
+        idx = self._selected_index()
+        if idx is not None:
+            self.browser.create_new_tab(self.browser.bookmarks[idx]["url"])
+
+    def open_selected_archive(self):
+        idx = self._selected_index()
+        if idx is not None:
+            self.browser.open_archived(self.browser.bookmarks[idx]["url"])
+
+    def archive_selected(self):
+        idx = self._selected_index()
+        if idx is not None:
+            self.browser.archive_bookmarks([idx])
+
+    def edit_selected(self):
+        idx = self._selected_index()
+        if idx is not None:
+            self.edit_bookmark(idx)
+
+    def delete_selected(self):
+        idx = self._selected_index()
+        if idx is not None:
+            self.delete_bookmark(idx)
+
+    def delete_bookmark(self, index: int):
+        self.browser.delete_bookmark(index)
+        self.refresh()
+
+    def _import(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "즐겨찾기 가져오기", "",
+            "즐겨찾기 파일 (*.html *.htm *.json Bookmarks);;모든 파일 (*)",
+        )
+        if path:
+            self.browser.import_bookmarks(path)
+
+    def _export(self):
+        path, selected = QFileDialog.getSaveFileName(
+            self, "즐겨찾기 내보내기", "kyo_bookmarks.html",
+            "Netscape 북마크 HTML (*.html);;Chromium Bookmarks JSON (*.json)",
+        )
+        if path:
+            fmt = "chromium" if path.lower().endswith(".json") or "JSON" in selected else "netscape"
+            self.browser.export_bookmarks(path, fmt)
 
     def edit_bookmark(self, index: int):
         self.browser.edit_bookmark(index)
@@ -416,11 +3508,195 @@ class WebView(QWebEngineView):
     def __init__(self, profile, browser, parent=None):
         super().__init__(parent)
         self.browser = browser
+        self.thumbnail_captured_at = 0.0
+        self.load_started_at = None
+        self.load_generation = 0
+        self.pending_scroll = None
+        self.perf_bridge = None
+        self.crash_count = 0
+        self.last_crash_at = 0.0
+        self.prefetch_outcome = None
         self.setPage(QWebEnginePage(profile, self))
 
     def createWindow(self, _type):
         return self.browser.create_new_tab(self.browser.get_home_url())
 
+# ------------------------------------------------------
+# ♻️ 최근 닫은 탭 (전체 상태, 압축, 바이트 예산)
+# ------------------------------------------------------
+class RecentlyClosedRing:
+    # 닫은 탭의 뒤로/앞으로 기록·확대율·스크롤을 압축해 보관, 개수 대신 바이트 예산으로 제한
+    def __init__(self, max_bytes, items=()):
+        self.max_bytes = max_bytes
+        self._entries = {}  # url -> 항목, 삽입 순서 = 오래된 것 먼저
+        self.total_bytes = 0
+        # 세션에는 최근 것부터 저장되어 있음
+        for item in reversed(list(items)):
+            if isinstance(item, dict) and item.get("url"):
+                self._add({key: item.get(key) for key in ("url", "title", "closed_at", "state")})
+        self._evict()
+
+    def __len__(self):
+        return len(self._entries)
+
+    @staticmethod
+    def pack(state):
+        raw = json.dumps(state, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+        return base64.b64encode(zlib.compress(raw, 6)).decode("ascii")
+
+    @staticmethod
+    def unpack(blob):
+        try:
+            state = json.loads(zlib.decompress(base64.b64decode(blob)).decode("utf-8"))
+        except (ValueError, TypeError, zlib.error):
+            return {}
+        return state if isinstance(state, dict) else {}
+
+    def push(self, state):
+        url = state.get("url")
+        if not url:
+            return
+        self._add({"url": url, "title": state.get("title") or url, "closed_at": now_iso(), "state": self.pack(state)})
+        self._evict()
+
+    def _add(self, entry):
+        # 같은 URL 은 최신 상태 하나만 유지 (dict 라 중복 제거가 O(1))
+        old = self._entries.pop(entry["url"], None)
+        if old:
+            self.total_bytes -= old["size"]
+        entry["size"] = len(entry["url"]) + len(entry.get("title") or "") + len(entry.get("state") or "") + 64
+        self._entries[entry["url"]] = entry
+        self.total_bytes += entry["size"]
+
+    def _evict(self):
+        while self.total_bytes > self.max_bytes and len(self._entries) > 1:
+            self.total_bytes -= self._entries.pop(next(iter(self._entries)))["size"]
+
+    def set_max_bytes(self, max_bytes):
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def pop(self, url=None):
+        if not self._entries:
+            return None
+        if url is None:
+            url = next(reversed(self._entries))
+        entry = self._entries.pop(url, None)
+        if not entry:
+            return None
+        self.total_bytes -= entry["size"]
+        state = self.unpack(entry["state"]) if entry.get("state") else {}
+        state.setdefault("url", entry["url"])
+        state.setdefault("title", entry.get("title") or entry["url"])
+        return state
+
+    def newest(self, limit):
+        result = []
+        for url in reversed(self._entries):
+            if len(result) >= limit:
+                break
+            result.append(self._entries[url])
+        return result
+
+    def clear(self):
+        self._entries = {}
+        self.total_bytes = 0
+
+    def to_list(self):
+        return [
+            {key: entry[key] for key in ("url", "title", "closed_at", "state") if entry.get(key)}
+            for entry in reversed(self._entries.values())
+        ]
+
+# ------------------------------------------------------
+# 🔎 탭 미리보기 팝업 & 탭 한눈에 보기
+# ------------------------------------------------------
+class TabPreviewPopup(QWidget):
+    def __init__(self, parent=None):
+        super().__init__(parent, Qt.ToolTip)
+        self.setStyleSheet("TabPreviewPopup { background: palette(base); border: 1px solid palette(mid); }")
+        self.setAttribute(Qt.WA_StyledBackground, True)
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(6, 6, 6, 6)
+        self.title_label = QLabel(self)
+        self.title_label.setWordWrap(True)
+        self.title_label.setFixedWidth(THUMBNAIL_WIDTH)
+        self.image_label = QLabel(self)
+        self.image_label.setFixedSize(THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT)
+        self.image_label.setAlignment(Qt.AlignCenter)
+        self.detail_label = QLabel(self)
+        self.detail_label.setWordWrap(True)
+        self.detail_label.setFixedWidth(THUMBNAIL_WIDTH)
+        layout.addWidget(self.title_label)
+        layout.addWidget(self.image_label)
+        layout.addWidget(self.detail_label)
+
+    def show_preview(self, pos, title, thumbnail_path=None, details=""):
+        pixmap = QPixmap(thumbnail_path) if thumbnail_path else QPixmap()
+        self.title_label.setText(title)
+        self.detail_label.setText(details)
+        self.detail_label.setVisible(bool(details))
+        self.image_label.setPixmap(pixmap)
+        self.image_label.setVisible(not pixmap.isNull())
+        self.adjustSize()
+        self.move(pos + QPoint(8, 16))
+        self.show()
+
+class TabOverviewDialog(QDialog):
+    def __init__(self, browser, parent=None):
+        super().__init__(parent)
+        self.browser = browser
+        self.setWindowTitle("탭 한눈에 보기")
+        self.resize(1040, 680)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+
+        layout = QVBoxLayout(self)
+        self.grid = QListWidget(self)
+        self.grid.setViewMode(QListWidget.IconMode)
+        self.grid.setIconSize(QSize(THUMBNAIL_WIDTH * 3 // 4, THUMBNAIL_HEIGHT * 3 // 4))
+        self.grid.setGridSize(QSize(THUMBNAIL_WIDTH * 3 // 4 + 24, THUMBNAIL_HEIGHT * 3 // 4 + 48))
+        self.grid.setResizeMode(QListWidget.Adjust)
+        self.grid.setMovement(QListWidget.Static)
+        self.grid.setWordWrap(True)
+        self.grid.itemActivated.connect(self.activate_item)
+        self.grid.itemClicked.connect(self.activate_item)
+        layout.addWidget(self.grid)
+
+        browser.thumbnails.thumbnailSaved.connect(self._on_thumbnail_saved)
+        self.refresh()
+
+    @traced("dialog.refresh", "ui", dialog="tab_overview")
+    def refresh(self):
+        self.grid.clear()
+        for _idx, view in self.browser._actual_tab_views():
+            url = view.url().toString()
+            path = self.browser.thumbnails.path_for(url) if url else None
+            pixmap = QPixmap(path) if path else QPixmap()
+            icon = QIcon(pixmap) if not pixmap.isNull() else view.icon()
+            item = QListWidgetItem(icon, (view.title() or url or "New Tab")[:40])
+            item.setToolTip(url)
+            item.setData(Qt.UserRole, view)
+            self.grid.addItem(item)
+            if view == self.browser.current_view():
+                self.grid.setCurrentItem(item)
+
+    def _on_thumbnail_saved(self, url, path):
+        pixmap = QPixmap(path)
+        if pixmap.isNull():
+            return
+        for row in range(self.grid.count()):
+            item = self.grid.item(row)
+            if item.toolTip() == url:
+                item.setIcon(QIcon(pixmap))
+
+    def activate_item(self, item):
+        view = item.data(Qt.UserRole)
+        index = self.browser.tab_registry.index_of(view)
+        if index != -1:
+            self.browser.tabs.setCurrentIndex(index)
+        self.accept()
+
 # ------------------------------------------------------
 # ℹ️ About 다이얼로그
 # ------------------------------------------------------
@@ -478,10 +3754,12 @@ class ShortcutsDialog(QDialog):
             ("현재 탭 닫기", "Ctrl + W"),
             ("즐겨찾기 추가", "Ctrl + D"),
             ("찾기 열기", "Ctrl + F"),
+            ("모든 탭에서 찾기", "Ctrl + Shift + F"),
             ("최근 닫은 탭 다시 열기", "Ctrl + Shift + T"),
             ("확대", "Ctrl + +"),
             ("축소", "Ctrl + -"),
             ("확대율 초기화", "Ctrl + 0"),
+            ("탭 한눈에 보기", "Ctrl + Shift + A"),
             ("찾기: 다음 결과", "Enter (검색창 포커스 중)"),
             ("찾기: 이전 결과", "Shift + Enter (검색창 포커스 중)"),
             ("찾기 닫기", "Esc (검색창 포커스 중)"),
@@ -510,6 +3788,22 @@ class HistoryDialog(QDialog):
         self.resize(860, 420)
 
         layout = QVBoxLayout(self)
+        self.search_edit = QLineEdit(self)
+        self.search_edit.setClearButtonEnabled(True)
+        self.search_edit.setPlaceholderText(
+            "제목·URL·본문 검색" if browser.content_indexer else "제목·URL 검색 (본문 검색은 환경설정에서 켜기)"
+        )
+        self.search_edit.textChanged.connect(lambda _t: self._search_timer.start())
+        layout.addWidget(self.search_edit)
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(250)
+        self._search_timer.timeout.connect(self.refresh)
+        self._content_urls = set()
+        self._content_seq = None
+        if browser.content_indexer:
+            browser.content_indexer.searchFinished.connect(self._on_content_results)
+
         self.table = QTableWidget(0, 3, self)
         self.table.setHorizontalHeaderLabels(["방문 시각", "제목", "URL"])
         self.table.horizontalHeader().setStretchLastSection(True)
@@ -524,14 +3818,17 @@ class HistoryDialog(QDialog):
         btn_open = QPushButton("열기")
         btn_delete = QPushButton("삭제")
         btn_clear = QPushButton("전체 삭제")
+        btn_import = QPushButton("Chrome/Edge에서 가져오기…")
         btn_close = QPushButton("닫기")
         btn_open.clicked.connect(self.open_selected)
         btn_delete.clicked.connect(self.delete_selected)
         btn_clear.clicked.connect(self.clear_all)
+        btn_import.clicked.connect(self._import)
         btn_close.clicked.connect(self.accept)
         button_row.addWidget(btn_open)
         button_row.addWidget(btn_delete)
         button_row.addWidget(btn_clear)
+        button_row.addWidget(btn_import)
         button_row.addStretch(1)
         button_row.addWidget(btn_close)
         layout.addLayout(button_row)
@@ -539,19 +3836,49 @@ class HistoryDialog(QDialog):
         self.refresh()
 
     def refresh(self):
-        self.table.setRowCount(0)
-        self.browser._prune_history(save=True)
-        for idx, item in enumerate(self.browser.history):
-            row = self.table.rowCount()
-            self.table.insertRow(row)
+        query = self.search_edit.text().strip()
+        indexer = self.browser.content_indexer
+        if query and indexer:
+            # 본문 검색 결과는 작업 스레드에서 도착하면 다시 그림
+            self._content_seq = indexer.search(query)
+        else:
+            self._content_urls = set()
+        self._populate(query)
 
+    def _on_content_results(self, seq, urls):
+        if seq != self._content_seq:
+            return
+        self._content_urls = set(urls)
+        self._populate(self.search_edit.text().strip())
+
+    @traced("dialog.refresh", "ui", dialog="history")
+    def _populate(self, query):
+        if self.browser.history_ready.is_ready():
+            self.setWindowTitle("방문 기록")
+        elif self.browser.history_ready.error:
+            self.setWindowTitle("방문 기록 (읽지 못함)")
+        else:
+            self.setWindowTitle("방문 기록 (불러오는 중…)")
+        self.browser._prune_history(save=True)
+        needle = query.lower()
+        matches = [
+            (idx, item) for idx, item in enumerate(self.browser.history)
+            if not needle or needle in item.get("title", "").lower() or needle in item.get("url", "").lower()
+            or item.get("url") in self._content_urls
+        ]
+        # 가져오기 뒤 수십만 행이 될 수 있으므로 행을 한 번에 만들고 그리는 동안 갱신을 멈춤
+        self.table.setUpdatesEnabled(False)
+        self.table.setRowCount(0)
+        self.table.setRowCount(len(matches))
+        for row, (idx, item) in enumerate(matches):
             visited = QTableWidgetItem(item.get("visited_at", ""))
             visited.setData(Qt.UserRole, idx)
             self.table.setItem(row, 0, visited)
             self.table.setItem(row, 1, QTableWidgetItem(item.get("title", "")))
             self.table.setItem(row, 2, QTableWidgetItem(item.get("url", "")))
-
-        self.table.resizeColumnsToContents()
+        if len(matches) <= HISTORY_DIALOG_AUTOSIZE_ROWS:
+            self.table.resizeColumnsToContents()
+        self.table.setUpdatesEnabled(True)
 
     def _selected_index(self):
         row = self.table.currentRow()
@@ -580,12 +3907,425 @@ class HistoryDialog(QDialog):
             self.browser.clear_history()
             self.refresh()
 
+    def _import(self):
+        path, _ = QFileDialog.getOpenFileName(
+            self, "Chromium 방문 기록 가져오기", default_chromium_history_path(), "History (History);;모든 파일 (*)"
+        )
+        if path:
+            self.browser.import_chromium_history(path)
+
+class BackupKindsDialog(QDialog):
+    def __init__(self, parent, title, kinds=BACKUP_KINDS):
+        super().__init__(parent)
+        self.setWindowTitle(title)
+        layout = QVBoxLayout(self)
+        self.checks = {}
+        for kind in BACKUP_KINDS:
+            check = QCheckBox(BACKUP_KIND_LABELS[kind])
+            check.setChecked(kind in kinds)
+            check.setEnabled(kind in kinds)
+            self.checks[kind] = check
+            layout.addWidget(check)
+        buttons = QDialogButtonBox(QDialogButtonBox.Ok | QDialogButtonBox.Cancel)
+        buttons.accepted.connect(self.accept)
+        buttons.rejected.connect(self.reject)
+        layout.addWidget(buttons)
+
+    def kinds(self):
+        return [kind for kind, check in self.checks.items() if check.isChecked()]
+
+class NavTimingDialog(QDialog):
+    COLUMNS = [
+        ("count", "횟수"),
+        ("total_p50", "전체 p50"),
+        ("total_p90", "전체 p90"),
+        ("ttfb_p50", "TTFB p50"),
+        ("dcl_p50", "DCL p50"),
+        ("load_p50", "load p50"),
+        ("fcp_p50", "FCP p50"),
+    ]
+
+    def __init__(self, browser, parent=None):
+        super().__init__(parent)
+        self.browser = browser
+        self.setWindowTitle("사이트별 로딩 성능 (ms)")
+        self.resize(900, 560)
+
+        layout = QVBoxLayout(self)
+        self.host_table = self._make_table("사이트")
+        self.host_table.itemSelectionChanged.connect(self._show_days)
+        self.day_table = self._make_table("날짜")
+        layout.addWidget(QLabel("사이트 (행을 선택하면 날짜별 추이를 표시)"))
+        layout.addWidget(self.host_table, 3)
+        layout.addWidget(QLabel("날짜별"))
+        layout.addWidget(self.day_table, 2)
+
+        button_row = QHBoxLayout()
+        btn_clear = QPushButton("기록 삭제")
+        btn_close = QPushButton("닫기")
+        btn_clear.clicked.connect(self._clear)
+        btn_close.clicked.connect(self.accept)
+        button_row.addWidget(btn_clear)
+        button_row.addStretch(1)
+        button_row.addWidget(btn_close)
+        layout.addLayout(button_row)
+
+        self.refresh()
+
+    def _make_table(self, first_header):
+        table = QTableWidget(0, len(self.COLUMNS) + 1, self)
+        table.setHorizontalHeaderLabels([first_header] + [label for _key, label in self.COLUMNS])
+        table.verticalHeader().setVisible(False)
+        table.setEditTriggers(QTableWidget.NoEditTriggers)
+        table.setSelectionBehavior(QTableWidget.SelectRows)
+        table.setSelectionMode(QTableWidget.SingleSelection)
+        return table
+
+    def _fill(self, table, rows, first_key):
+        table.setRowCount(0)
+        for data in rows:
+            row = table.rowCount()
+            table.insertRow(row)
+            table.setItem(row, 0, QTableWidgetItem(data[first_key]))
+            for col, (key, _label) in enumerate(self.COLUMNS, start=1):
+                value = data.get(key)
+                item = QTableWidgetItem()
+                item.setData(Qt.DisplayRole, value if value is not None else "-")
+                table.setItem(row, col, item)
+        table.resizeColumnsToContents()
+
+    @traced("dialog.refresh", "ui", dialog="nav_timing")
+    def refresh(self):
+        self._fill(self.host_table, self.browser.nav_timing.host_rows(), "host")
+        self.day_table.setRowCount(0)
+
+    def _show_days(self):
+        row = self.host_table.currentRow()
+        item = self.host_table.item(row, 0) if row >= 0 else None
+        if item:
+            self._fill(self.day_table, self.browser.nav_timing.daily_rows(item.text()), "day")
+
+    def _clear(self):
+        if QMessageBox.question(self, "로딩 성능", "사이트별 로딩 성능 기록을 모두 삭제할까요?") == QMessageBox.Yes:
+            self.browser.nav_timing.clear()
+            self.refresh()
+
+class TabPerfDialog(QDialog):
+    COLUMNS = [
+        ("blocked_ms", "차단 시간(ms)"),
+        ("long_tasks", "롱태스크"),
+        ("longest_task_ms", "최장(ms)"),
+        ("layout_shift", "CLS"),
+        ("slow_events", "느린 입력"),
+        ("max_event_ms", "최대 입력 지연(ms)"),
+    ]
+
+    def __init__(self, browser, parent=None):
+        super().__init__(parent)
+        self.browser = browser
+        self.setWindowTitle("탭 성능")
+        self.resize(860, 400)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+
+        layout = QVBoxLayout(self)
+        self.notice = QLabel("환경설정 > 고급에서 성능 모니터를 켜면 측정이 시작됩니다.")
+        layout.addWidget(self.notice)
+        self.table = QTableWidget(0, len(self.COLUMNS) + 1, self)
+        self.table.setHorizontalHeaderLabels(["탭"] + [label for _key, label in self.COLUMNS])
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setSortingEnabled(True)
+        layout.addWidget(self.table)
+
+        button_row = QHBoxLayout()
+        btn_reset = QPushButton("초기화")
+        btn_close = QPushButton("닫기")
+        btn_reset.clicked.connect(self._reset)
+        btn_close.clicked.connect(self.accept)
+        button_row.addWidget(btn_reset)
+        button_row.addStretch(1)
+        button_row.addWidget(btn_close)
+        layout.addLayout(button_row)
+
+        self._timer = QTimer(self)
+        self._timer.setInterval(PERF_MONITOR_FLUSH_MS)
+        self._timer.timeout.connect(self.refresh)
+        self._timer.start()
+        self.refresh()
+
+    @traced("dialog.refresh", "ui", dialog="tab_perf")
+    def refresh(self):
+        self.notice.setVisible(not self.browser.settings.get("perf_monitor", False))
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(0)
+        for _idx, view in self.browser._actual_tab_views():
+            if not view.perf_bridge:
+                continue
+            row = self.table.rowCount()
+            self.table.insertRow(row)
+            self.table.setItem(row, 0, QTableWidgetItem(view.title() or view.url().toString()))
+            for col, (key, _label) in enumerate(self.COLUMNS, start=1):
+                value = view.perf_bridge.stats[key]
+                item = QTableWidgetItem()
+                item.setData(Qt.DisplayRole, round(value, 3) if isinstance(value, float) else value)
+                self.table.setItem(row, col, item)
+        self.table.setSortingEnabled(True)
+        self.table.resizeColumnsToContents()
+
+    def _reset(self):
+        for _idx, view in self.browser._actual_tab_views():
+            if view.perf_bridge:
+                view.perf_bridge.reset()
+        self.refresh()
+
+class SiteDataDialog(QDialog):
+    def __init__(self, browser, parent=None):
+        super().__init__(parent)
+        self.browser = browser
+        self.setWindowTitle("사이트 데이터")
+        self.resize(720, 460)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+
+        layout = QVBoxLayout(self)
+        self.summary = QLabel("")
+        layout.addWidget(self.summary)
+        self.search = QLineEdit(self)
+        self.search.setPlaceholderText("사이트 검색")
+        self.search.textChanged.connect(lambda _t: self.refresh())
+        layout.addWidget(self.search)
+        self.table = QTableWidget(0, 5, self)
+        self.table.setHorizontalHeaderLabels(["사이트", "쿠키", "세션 쿠키", "보안 쿠키", "가장 늦은 만료"])
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setSelectionMode(QTableWidget.ExtendedSelection)
+        self.table.setSortingEnabled(True)
+        layout.addWidget(self.table)
+
+        self.include_storage = QCheckBox("저장소도 삭제 (localStorage, IndexedDB, Cache Storage, 서비스 워커)")
+        self.include_storage.setChecked(True)
+        layout.addWidget(self.include_storage)
+
+        button_row = QHBoxLayout()
+        btn_clear = QPushButton("선택한 사이트 삭제")
+        btn_close = QPushButton("닫기")
+        btn_clear.clicked.connect(self._clear_selected)
+        btn_close.clicked.connect(self.accept)
+        button_row.addWidget(btn_clear)
+        button_row.addStretch(1)
+        button_row.addWidget(btn_close)
+        layout.addLayout(button_row)
+        browser.site_data.changed.connect(self.refresh)
+        self.refresh()
+
+    @traced("dialog.refresh", "ui", dialog="site_data")
+    def refresh(self):
+        index = self.browser.site_data
+        self.summary.setText(f"사이트 {len(index.sites):,}곳 · 쿠키 {index.cookie_count():,}개")
+        needle = self.search.text().strip().lower()
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(0)
+        for site in index.site_rows():
+            if needle and needle not in site["site"]:
+                continue
+            row = self.table.rowCount()
+            self.table.insertRow(row)
+            for col, value in enumerate((site["site"], site["cookies"], site["session"], site["secure"], site["expires"])):
+                item = QTableWidgetItem()
+                item.setData(Qt.DisplayRole, value)
+                self.table.setItem(row, col, item)
+        self.table.setSortingEnabled(True)
+        self.table.resizeColumnsToContents()
+
+    def _clear_selected(self):
+        rows = sorted({index.row() for index in self.table.selectedIndexes()})
+        sites = [self.table.item(row, 0).text() for row in rows]
+        if not sites:
+            return
+        names = ", ".join(sites[:5]) + (f" 외 {len(sites) - 5}곳" if len(sites) > 5 else "")
+        if QMessageBox.question(self, "사이트 데이터", f"{names}의 데이터를 삭제할까요?\n다른 사이트의 로그인과 캐시는 유지됩니다.") != QMessageBox.Yes:
+            return
+        self.browser.clear_site_data(sites, self.include_storage.isChecked())
+
+class CrashStatsDialog(QDialog):
+    def __init__(self, browser, parent=None):
+        super().__init__(parent)
+        self.browser = browser
+        self.setWindowTitle("렌더러 충돌 통계")
+        self.resize(820, 380)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+
+        layout = QVBoxLayout(self)
+        self.summary = QLabel("")
+        layout.addWidget(self.summary)
+        self.reasons = sorted(set(RENDER_TERMINATION_REASONS.values()))
+        self.table = QTableWidget(0, len(self.reasons) + 4, self)
+        self.table.setHorizontalHeaderLabels(["사이트", "합계"] + self.reasons + ["마지막", "종료 코드"])
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setSortingEnabled(True)
+        layout.addWidget(self.table)
+
+        button_row = QHBoxLayout()
+        btn_export = QPushButton("내보내기")
+        btn_clear = QPushButton("초기화")
+        btn_close = QPushButton("닫기")
+        btn_export.clicked.connect(self._export)
+        btn_clear.clicked.connect(self._clear)
+        btn_close.clicked.connect(self.accept)
+        button_row.addWidget(btn_export)
+        button_row.addWidget(btn_clear)
+        button_row.addStretch(1)
+        button_row.addWidget(btn_close)
+        layout.addLayout(button_row)
+        self.refresh()
+
+    @traced("dialog.refresh", "ui", dialog="crash_stats")
+    def refresh(self):
+        stats = self.browser.crash_stats
+        totals = stats.reason_totals()
+        self.summary.setText(
+            f"사이트 {len(stats.sites)}곳 · 종료 {sum(totals.values())}회"
+            + "".join(f" · {reason} {count}" for reason, count in sorted(totals.items()))
+        )
+        self.table.setSortingEnabled(False)
+        self.table.setRowCount(0)
+        for site in stats.site_rows():
+            row = self.table.rowCount()
+            self.table.insertRow(row)
+            values = [site["host"], site["total"]] + [site["reasons"].get(r, 0) for r in self.reasons]
+            values += [site["last_at"] or "", "" if site["last_exit_code"] is None else site["last_exit_code"]]
+            for col, value in enumerate(values):
+                item = QTableWidgetItem()
+                item.setData(Qt.DisplayRole, value)
+                self.table.setItem(row, col, item)
+        self.table.setSortingEnabled(True)
+        self.table.resizeColumnsToContents()
+
+    def _export(self):
+        path, _ = QFileDialog.getSaveFileName(self, "충돌 통계 내보내기", "kyo_crash_stats.json", "JSON (*.json);;CSV (*.csv)")
+        if not path:
+            return
+        try:
+            self.browser.crash_stats.export(path)
+        except OSError as exc:
+            QMessageBox.warning(self, "내보내기", f"파일을 저장하지 못했습니다.\n{exc}")
+
+    def _clear(self):
+        if QMessageBox.question(self, "렌더러 충돌 통계", "통계를 모두 지울까요?") == QMessageBox.Yes:
+            self.browser.crash_stats.clear()
+            self.refresh()
+
+class CrossTabFindDialog(QDialog):
+    def __init__(self, browser, text="", case_sensitive=False, parent=None):
+        super().__init__(parent)
+        self.browser = browser
+        self.cache = browser.tab_text
+        self.setWindowTitle("모든 탭에서 찾기")
+        self.resize(820, 460)
+        self.setAttribute(Qt.WA_DeleteOnClose)
+        self._rows = {}  # view -> row
+
+        layout = QVBoxLayout(self)
+        search_row = QHBoxLayout()
+        self.query = QLineEdit(text)
+        self.query.setPlaceholderText("검색어 입력 후 Enter…")
+        self.query.returnPressed.connect(self.start_search)
+        self.chk_case = QCheckBox("Aa")
+        self.chk_case.setToolTip("대소문자 구분")
+        self.chk_case.setChecked(case_sensitive)
+        btn_search = QPushButton("찾기")
+        btn_search.clicked.connect(self.start_search)
+        search_row.addWidget(self.query, 1)
+        search_row.addWidget(self.chk_case)
+        search_row.addWidget(btn_search)
+        layout.addLayout(search_row)
+
+        self.status = QLabel("")
+        layout.addWidget(self.status)
+
+        self.table = QTableWidget(0, 3, self)
+        self.table.setHorizontalHeaderLabels(["탭", "일치", "미리보기"])
+        self.table.horizontalHeader().setStretchLastSection(True)
+        self.table.verticalHeader().setVisible(False)
+        self.table.setEditTriggers(QTableWidget.NoEditTriggers)
+        self.table.setSelectionBehavior(QTableWidget.SelectRows)
+        self.table.setSelectionMode(QTableWidget.SingleSelection)
+        self.table.cellDoubleClicked.connect(lambda row, _c: self.open_row(row))
+        layout.addWidget(self.table)
+
+        self.cache.textReady.connect(self._on_text_ready)
+        self.cache.progress.connect(self._on_progress)
+        if text:
+            self.start_search()
+
+    def _needle(self):
+        return self.query.text().strip()
+
+    def start_search(self):
+        self.table.setRowCount(0)
+        self._rows = {}
+        if not self._needle():
+            return
+        views = [view for _idx, view in self.browser._actual_tab_views()]
+        # 캐시된 텍스트로 즉시 결과를 보여준 뒤, 오래된 탭만 다시 추출
+        for view in views:
+            if self.cache.is_fresh(view):
+                self._update_row(view)
+        self.cache.refresh(views)
+
+    def _on_text_ready(self, view):
+        if self._needle():
+            self._update_row(view)
+
+    def _on_progress(self, done, total):
+        if total and done < total:
+            self.status.setText(f"탭 텍스트 수집 중… {done}/{total}")
+        else:
+            matches = sum(to_int(self.table.item(r, 1).text(), 0) for r in range(self.table.rowCount()))
+            self.status.setText(f"{self.table.rowCount()}개 탭에서 {matches}건 일치")
+
+    def _update_row(self, view):
+        text = self.cache.text_for(view)
+        count, snippet = self.cache.search(text or "", self._needle(), self.chk_case.isChecked())
+        row = self._rows.get(view)
+        if not count:
+            return
+        if row is None:
+            row = self.table.rowCount()
+            self.table.insertRow(row)
+            self._rows[view] = row
+        title = QTableWidgetItem(view.title() or view.url().toString())
+        title.setData(Qt.UserRole, view)
+        self.table.setItem(row, 0, title)
+        self.table.setItem(row, 1, QTableWidgetItem(str(count)))
+        self.table.setItem(row, 2, QTableWidgetItem(snippet))
+
+    def open_row(self, row):
+        item = self.table.item(row, 0)
+        view = item.data(Qt.UserRole) if item else None
+        if view is not None:
+            self.browser.find_in_tab(view, self._needle(), self.chk_case.isChecked())
+
 class SettingsDialog(QDialog):
     THEME_OPTIONS = [
         ("system", "시스템 기준"),
         ("light", "라이트"),
         ("dark", "다크"),
     ]
+    HOVER_PREFETCH_OPTIONS = [
+        ("off", "사용 안 함"),
+        ("preconnect", "미리 연결 (DNS/TLS)"),
+        ("prefetch", "미리 연결 + 문서 프리페치"),
+    ]
+
+    CACHE_TYPE_OPTIONS = [
+        ("disk", "디스크"),
+        ("memory", "메모리 (종료 시 삭제)"),
+        ("none", "사용 안 함"),
+    ]
 
     def __init__(self, browser, parent=None):
         super().__init__(parent)
@@ -604,12 +4344,23 @@ class SettingsDialog(QDialog):
 
         self.home_url = QLineEdit(browser.get_home_url())
         self.home_url.setPlaceholderText(HOME_URL)
-        form.addRow("시작페이지 URL:", self.home_url)
+        btn_newtab = QPushButton("새 탭 페이지")
+        btn_newtab.setToolTip(f"네트워크 없이 바로 열리는 {NEW_TAB_URL} 사용")
+        btn_newtab.clicked.connect(lambda: self.home_url.setText(NEW_TAB_URL))
+        home_row = QHBoxLayout()
+        home_row.setContentsMargins(0, 0, 0, 0)
+        home_row.addWidget(self.home_url, 1)
+        home_row.addWidget(btn_newtab)
+        form.addRow("시작페이지 URL:", home_row)
 
         self.show_bookmarks_toolbar = QCheckBox("즐겨찾기 툴바 표시")
         self.show_bookmarks_toolbar.setChecked(bool(browser.settings.get("show_bookmarks_toolbar", True)))
         form.addRow("즐겨찾기:", self.show_bookmarks_toolbar)
 
+        self.vertical_tabs = QCheckBox("세로 탭 목록 사용 (검색 가능)")
+        self.vertical_tabs.setChecked(bool(browser.settings.get("vertical_tabs", False)))
+        form.addRow("탭:", self.vertical_tabs)
+
         self.theme_combo = QComboBox()
         for value, label in self.THEME_OPTIONS:
             self.theme_combo.addItem(label, value)
@@ -631,20 +4382,121 @@ class SettingsDialog(QDialog):
         self.history_days.setValue(int(browser.settings.get("history_retention_days", 90)))
         form.addRow("기록 보관:", self._build_stepper(self.history_days, "보관 기간 줄이기", "보관 기간 늘리기"))
 
+        self.recent_closed_kb = QSpinBox()
+        self.recent_closed_kb.setRange(16, MAX_RECENT_CLOSED_KB)
+        self.recent_closed_kb.setSingleStep(256)
+        self.recent_closed_kb.setSuffix(" KB")
+        self.recent_closed_kb.setToolTip("닫은 탭의 뒤로/앞으로 기록까지 압축해 이 용량만큼 보관합니다.")
+        self.recent_closed_kb.setValue(int(browser.settings.get("recent_closed_kb", 1024)))
+        form.addRow("닫은 탭 보관:", self._build_stepper(self.recent_closed_kb, "보관 용량 줄이기", "보관 용량 늘리기"))
+
         layout.addWidget(general_group)
 
+        advanced_group = QGroupBox("고급")
+        advanced_form = QFormLayout(advanced_group)
+        self.perf_monitor = QCheckBox("페이지 멈춤(롱태스크)·레이아웃 이동 측정")
+        self.perf_monitor.setToolTip("각 탭에 측정 스크립트를 주입해 차단 시간을 탭 미리보기와 탭 성능 창에 표시합니다.")
+        self.perf_monitor.setChecked(bool(browser.settings.get("perf_monitor", False)))
+        advanced_form.addRow("성능 모니터:", self.perf_monitor)
+
+        self.index_page_content = QCheckBox("방문한 페이지 본문을 색인해 기록에서 검색")
+        self.index_page_content.setChecked(bool(browser.settings.get("index_page_content", False)))
+        self.content_index_status = QLabel("")
+        btn_clear_index = QPushButton("색인 삭제")
+        btn_clear_index.clicked.connect(self._clear_content_index)
+        index_row = QHBoxLayout()
+        index_row.setContentsMargins(0, 0, 0, 0)
+        index_row.addWidget(self.content_index_status, 1)
+        index_row.addWidget(btn_clear_index)
+        advanced_form.addRow("본문 색인:", self.index_page_content)
+        advanced_form.addRow("", index_row)
+        if browser.content_indexer:
+            browser.content_indexer.statsChanged.connect(self._show_content_index_stats)
+            self._show_content_index_stats(browser.content_indexer.last_stats)
+        else:
+            self.content_index_status.setText("꺼짐")
+
+        self.archive_max_mb = QSpinBox()
+        self.archive_max_mb.setRange(16, MAX_ARCHIVE_MB)
+        self.archive_max_mb.setSingleStep(128)
+        self.archive_max_mb.setSuffix(" MB")
+        self.archive_max_mb.setValue(int(browser.settings.get("archive_max_mb", 1024)))
+        advanced_form.addRow("오프라인 보관:", self._build_stepper(self.archive_max_mb, "보관 용량 줄이기", "보관 용량 늘리기"))
+        self.archive_refresh_days = QSpinBox()
+        self.archive_refresh_days.setRange(0, 3650)
+        self.archive_refresh_days.setSuffix("일마다")
+        self.archive_refresh_days.setSpecialValueText("새로 고치지 않음")
+        self.archive_refresh_days.setValue(int(browser.settings.get("archive_refresh_days", 7)))
+        advanced_form.addRow("보관본 갱신:", self._build_stepper(self.archive_refresh_days, "갱신 주기 줄이기", "갱신 주기 늘리기"))
+        advanced_form.addRow("", QLabel(browser.archiver.status_text()))
+        self.hover_prefetch = QComboBox()
+        for value, label in self.HOVER_PREFETCH_OPTIONS:
+            self.hover_prefetch.addItem(label, value)
+        self.hover_prefetch.setCurrentIndex(max(0, self.hover_prefetch.findData(browser.settings.get("hover_prefetch", "preconnect"))))
+        self.hover_prefetch.setToolTip("즐겨찾기/자동 완성 항목에 마우스를 잠시 올리면 클릭 전에 연결을 준비합니다.")
+        advanced_form.addRow("호버 시 미리 로드:", self.hover_prefetch)
+        layout.addWidget(advanced_group)
+
+        cache_group = QGroupBox("HTTP 캐시")
+        cache_form = QFormLayout(cache_group)
+        self.cache_type = QComboBox()
+        for value, label in self.CACHE_TYPE_OPTIONS:
+            self.cache_type.addItem(label, value)
+        self.cache_type.setCurrentIndex(max(0, self.cache_type.findData(browser.settings.get("http_cache_type", "disk"))))
+        cache_form.addRow("캐시 종류:", self.cache_type)
+
+        self.cache_max_mb = QSpinBox()
+        self.cache_max_mb.setRange(0, MAX_HTTP_CACHE_MB)
+        self.cache_max_mb.setSingleStep(64)
+        self.cache_max_mb.setSuffix(" MB")
+        self.cache_max_mb.setSpecialValueText("자동")
+        self.cache_max_mb.setValue(int(browser.settings.get("http_cache_max_mb", 0)))
+        cache_form.addRow("최대 크기:", self._build_stepper(self.cache_max_mb, "최대 크기 줄이기", "최대 크기 늘리기"))
+
+        self.cache_size_label = QLabel("계산 중…")
+        cache_form.addRow("현재 크기:", self.cache_size_label)
+
+        self.cache_trim_mb = QSpinBox()
+        self.cache_trim_mb.setRange(16, MAX_HTTP_CACHE_MB)
+        self.cache_trim_mb.setSingleStep(64)
+        self.cache_trim_mb.setSuffix(" MB")
+        self.cache_trim_mb.setValue(256)
+        btn_trim = QPushButton("이 크기로 줄이기")
+        btn_trim.setToolTip(
+            "전체 삭제 대신 오래 쓰지 않은 항목부터 정리해 자주 쓰는 사이트 캐시는 유지합니다.\n"
+            "한 번만 정리하며 위의 최대 크기 설정은 바뀌지 않습니다."
+        )
+        btn_trim.clicked.connect(self._trim_cache)
+        trim_row = QHBoxLayout()
+        trim_row.setContentsMargins(0, 0, 0, 0)
+        trim_row.addWidget(self.cache_trim_mb, 1)
+        trim_row.addWidget(btn_trim)
+        cache_form.addRow("캐시 줄이기:", trim_row)
+        layout.addWidget(cache_group)
+
+        self._size_task = None
+        self._size_timer = QTimer(self)
+        self._size_timer.setInterval(3000)
+        self._size_timer.timeout.connect(self._refresh_cache_size)
+        self._size_timer.start()
+        self._refresh_cache_size()
+
         privacy_group = QGroupBox("개인정보")
         privacy_row = QHBoxLayout(privacy_group)
         btn_cache = QPushButton("캐시 삭제")
         btn_cookies = QPushButton("쿠키 삭제")
+        btn_site_data = QPushButton("사이트별 삭제…")
+        btn_site_data.setToolTip("선택한 사이트의 쿠키/저장소만 지우고 다른 사이트의 로그인은 유지합니다.")
         btn_history = QPushButton("기록 삭제")
         btn_session = QPushButton("세션 삭제")
         btn_cache.clicked.connect(browser.clear_cache)
         btn_cookies.clicked.connect(browser.clear_cookies)
+        btn_site_data.clicked.connect(browser.show_site_data)
         btn_history.clicked.connect(self._clear_history)
         btn_session.clicked.connect(browser.clear_saved_session)
         privacy_row.addWidget(btn_cache)
         privacy_row.addWidget(btn_cookies)
+        privacy_row.addWidget(btn_site_data)
         privacy_row.addWidget(btn_history)
         privacy_row.addWidget(btn_session)
         layout.addWidget(privacy_group)
@@ -662,6 +4514,39 @@ class SettingsDialog(QDialog):
         if QMessageBox.question(self, "방문 기록", "방문 기록을 모두 삭제할까요?") == QMessageBox.Yes:
             self.browser.clear_history()
 
+    def _refresh_cache_size(self):
+        # 캐시 폴더가 클 수 있으므로 크기 계산은 스레드 풀에서 수행
+        if self._size_task is not None:
+            return
+        self._size_task = BackgroundTask(directory_size, self.browser.profile.cachePath())
+        self._size_task.signals.finished.connect(self._show_cache_size)
+        self._size_task.signals.failed.connect(self._on_cache_size_failed)
+        QThreadPool.globalInstance().start(self._size_task)
+
+    def _show_cache_size(self, size):
+        self._size_task = None
+        self.cache_size_label.setText(f"{size / 1048576:,.1f} MB")
+
+    def _on_cache_size_failed(self, _message):
+        self._size_task = None
+        self.cache_size_label.setText("알 수 없음")
+
+    def _trim_cache(self):
+        self.browser.trim_http_cache(self.cache_trim_mb.value())
+
+    def _show_content_index_stats(self, stats):
+        self.content_index_status.setText(
+            f"문서 {stats['documents']:,}개 · {stats['disk_bytes'] / 1048576:.1f} MB"
+            f" / {stats['max_bytes'] / 1048576:.0f} MB"
+        )
+
+    def _clear_content_index(self):
+        if self.browser.content_indexer:
+            self.browser.content_indexer.clear()
+        elif os.path.isdir(CONTENT_INDEX_DIR):
+            shutil.rmtree(CONTENT_INDEX_DIR, ignore_errors=True)
+            self.content_index_status.setText("꺼짐 · 색인 삭제됨")
+
     def _build_stepper(self, spinbox, minus_tooltip, plus_tooltip):
         spinbox.setButtonSymbols(QAbstractSpinBox.ButtonSymbols.NoButtons)
         spinbox.setAlignment(Qt.AlignCenter)
@@ -696,17 +4581,26 @@ class SettingsDialog(QDialog):
         return {
             "restore_session": self.restore_session.isChecked(),
             "show_bookmarks_toolbar": self.show_bookmarks_toolbar.isChecked(),
+            "vertical_tabs": self.vertical_tabs.isChecked(),
             "theme": self.theme_combo.currentData(),
             "home_url": self.home_url.text().strip(),
             "default_zoom": self.default_zoom.value(),
             "history_retention_days": self.history_days.value(),
+            "recent_closed_kb": self.recent_closed_kb.value(),
+            "perf_monitor": self.perf_monitor.isChecked(),
+            "index_page_content": self.index_page_content.isChecked(),
+            "http_cache_type": self.cache_type.currentData(),
+            "http_cache_max_mb": self.cache_max_mb.value(),
+            "archive_max_mb": self.archive_max_mb.value(),
+            "archive_refresh_days": self.archive_refresh_days.value(),
+            "hover_prefetch": self.hover_prefetch.currentData(),
         }
 
 # ------------------------------------------------------
 # 🧭 메인 브라우저 윈도우
 # ------------------------------------------------------
 class Browser(QMainWindow):
-    def __init__(self):
+    def __init__(self, initial_urls=None):
         super().__init__()
         self.setWindowTitle("Kyo's Browser")
         self.resize(1200, 800)
@@ -723,14 +4617,32 @@ class Browser(QMainWindow):
             pass
         self.setWindowIcon(icon or QIcon())
 
+        self._constructed_at = time.perf_counter()
+        self._window_shown = False
+        # 첫 탭에 필요한 설정/세션만 바로 읽고, 방문 기록/즐겨찾기는 창을 띄운 뒤 작업 스레드에서 읽음.
+        # 준비 전에 생긴 방문/즐겨찾기는 목록에 쌓아 두었다가 읽은 값과 합침
         self.settings = self._load_settings()
-        self.history = self._load_history()
-        self._prune_history(save=True)
+        self.history = []
+        self.bookmarks = []
+        self.history_ready = ReadyFuture()
+        self.bookmarks_ready = ReadyFuture()
+        self._store_tasks = set()
         self.saved_session = self._load_session()
-        self.recent_closed_tabs = self.saved_session.get("recent_closed", [])
+        self.recent_closed = RecentlyClosedRing(self.settings["recent_closed_kb"] * 1024, self.saved_session["recent_closed"])
         self._closing_app = False
         self._skip_next_session_save = False
         self.history_dialog = None
+        self._history_importer = None
+        self._history_import_progress = None
+        self.thumbnails = ThumbnailCache(THUMBNAIL_DIR, THUMBNAIL_CACHE_MAX_BYTES, self)
+        self._thumbnail_cost_ema_ms = 0.0
+        self._top_sites_cache = None
+        self.tab_preview = TabPreviewPopup(self)
+        self.nav_timing = NavTimingStore(NAV_TIMING_FILE, self.settings["history_retention_days"], self)
+        self.crash_stats = CrashStatsStore(CRASH_STATS_FILE, self)
+        self.tab_text = TabTextCache(self)
+        self.content_indexer = None
+        self._apply_content_indexing()
 
         # 프로필 (쿠키/캐시/저장소 경로 고정)
         storage_path = os.path.join(USER_DATA_DIR, "browser_data")
@@ -738,24 +4650,34 @@ class Browser(QMainWindow):
         os.makedirs(storage_path, exist_ok=True)
         self._cleanup_shared_dictionary_store(storage_path)
 
-        self.profile = QWebEngineProfile("KyoProfile")
-        self.profile.setPersistentCookiesPolicy(QWebEngineProfile.ForcePersistentCookies)
-        self.profile.setCachePath(os.path.join(storage_path, "cache"))
-        self.profile.setPersistentStoragePath(os.path.join(storage_path, "storage"))
-        self.profile.setHttpUserAgent(
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/126.0.0.0 Safari/537.36"
-        )
         self.interceptor = MyInterceptor()
-        self.profile.setUrlRequestInterceptor(self.interceptor)
+        self.profile = create_browser_profile(storage_path, self.interceptor)
+        self._cache_trim = None
+        self._apply_http_cache()
+        self.scheme_handler = KyoSchemeHandler(self, self)
+        self.profile.installUrlSchemeHandler(KYO_SCHEME, self.scheme_handler)
+        self.perf_monitor_script = None
+        METRICS.add_collector("tabs", self._metrics_tabs)
+        METRICS.add_collector("process", self._metrics_process)
+        METRICS.add_collector("stores", self._metrics_stores)
+        METRICS.add_collector("downloads", lambda: self.download_manager.metrics_snapshot())
+        self.hover_prefetcher = HoverPrefetcher(self.profile, self.settings["hover_prefetch"], self)
+        self.site_data = SiteDataIndex(self.profile.cookieStore(), self)
+        self.storage_cleaner = SiteStorageCleaner(self.profile, self)
+        METRICS.add_collector("prefetch", self.hover_prefetcher.metrics_snapshot)
+        METRICS.add_collector("trace", TRACE.stats)
         self.profile.downloadRequested.connect(self.on_download_requested)
 
         # 탭 위젯
-        self.tabs = QTabWidget()
+        self.tabs = BrowserTabWidget()
+        self.tab_registry = self.tabs.registry
+        self.ui_updates = UiUpdateBatcher(self._apply_tab_ui, self.tab_registry.contains, parent=self)
+        self.tab_sidebar = None
         midclose_tabbar = CloseOnMiddleClickTabBar(self.tabs)
         midclose_tabbar.middleClickClose.connect(self.close_tab)
         midclose_tabbar.plusTabClicked.connect(self._open_tab_from_plus)
+        midclose_tabbar.tabHovered.connect(self._show_tab_preview)
+        midclose_tabbar.hoverLeft.connect(self.tab_preview.hide)
         self.tabs.setTabBar(midclose_tabbar)
         self.tabs.setTabsClosable(True)
         self.tabs.setMovable(True)
@@ -763,30 +4685,49 @@ class Browser(QMainWindow):
         self.tabs.tabCloseRequested.connect(self.close_tab)
         # currentChanged는 우리가 직접 핸들(“+” 탭 포함)
         self.tabs.currentChanged.connect(self._on_tab_changed)
+        self.tabs.aboutToSwitch.connect(self._capture_leaving_thumbnail)
         self.setCentralWidget(self.tabs)
 
         # 주소창
         self.location_bar = QLineEdit(self)
         self.location_bar.setClearButtonEnabled(True)
         self.location_bar.returnPressed.connect(self.load_from_location)
+        self._omnibox_index = None
+        self._omnibox_choice = None
+        self.omnibox = OmniboxCompleter(self, self.location_bar)
+        self.omnibox.activated[QModelIndex].connect(self._on_omnibox_activated)
 
         # 상태바
         self.status_label = QLabel("")
         self.statusBar().addPermanentWidget(self.status_label)
 
         # 데이터/매니저
-        self.bookmarks = self._load_bookmarks()
+        self._bookmark_tasks = set()
+        self._backup_tasks = set()
+        self._bookmark_folder_menus = []
+        self.archive_store = ArchiveStore(ARCHIVE_DIR)
         self.download_manager = DownloadManager(self)
         self.bookmark_manager = BookmarkManager(self, self)
+        self.archiver = OfflineArchiver(self.profile, self.archive_store, self.settings["archive_max_mb"] * 1024 * 1024, self)
+        self.archiver.changed.connect(self.bookmark_manager.refresh)
+        if self.settings["archive_refresh_days"]:
+            QTimer.singleShot(ARCHIVE_REFRESH_DELAY_MS, self._refresh_stale_archives)
 
         # 가드 플래그: 탭 닫는 동안 + 탭 자동생성 방지
         self._ignore_plus_click = False
 
+        # 성능 모니터 스크립트는 첫 탭을 만들기 전에 설치
+        self._apply_perf_monitor()
+
         # 툴바/단축키/초기 탭
         self._build_toolbar()
-        if not self._restore_session():
+        restored = self._restore_session()
+        for url in initial_urls or []:
+            self.create_new_tab(url)
+        if not restored and not initial_urls:
             self.create_new_tab(self.get_home_url())   # 첫 실제 탭
         self._ensure_plus_tab()         # 항상 맨 끝에 “+” 더미 탭 유지
+        self._apply_vertical_tabs()
         self._setup_shortcuts()
         self._update_star()
         self._update_zoom_label()
@@ -810,6 +4751,15 @@ class Browser(QMainWindow):
         self.btn_next.setToolTip("다음 검색(Enter)")
         self.btn_next.clicked.connect(self._find_next)
 
+        self.find_count_label = QLabel("", self)
+        self.find_count_label.setMinimumWidth(56)
+        self.find_count_label.setAlignment(Qt.AlignCenter)
+
+        self.btn_find_all = QToolButton(self)
+        self.btn_find_all.setText("모든 탭")
+        self.btn_find_all.setToolTip("모든 탭에서 찾기 (Ctrl+Shift+F)")
+        self.btn_find_all.clicked.connect(self.show_cross_tab_find)
+
         self.btn_close_find = QToolButton(self)
         self.btn_close_find.setText("✕")
         self.btn_close_find.setToolTip("검색 닫기 (Esc)")
@@ -822,6 +4772,8 @@ class Browser(QMainWindow):
         find_tb.addWidget(self.chk_case)
         find_tb.addWidget(self.btn_prev)
         find_tb.addWidget(self.btn_next)
+        find_tb.addWidget(self.find_count_label)
+        find_tb.addWidget(self.btn_find_all)
         find_tb.addWidget(self.btn_close_find)
         self.addToolBar(Qt.BottomToolBarArea, find_tb)
         self.find_tb = find_tb
@@ -837,6 +4789,15 @@ class Browser(QMainWindow):
         settings["history_retention_days"] = max(1, to_int(settings.get("history_retention_days", 90), 90))
         settings["restore_session"] = bool(settings.get("restore_session", False))
         settings["show_bookmarks_toolbar"] = bool(settings.get("show_bookmarks_toolbar", True))
+        settings["vertical_tabs"] = bool(settings.get("vertical_tabs", False))
+        settings["recent_closed_kb"] = clamp(to_int(settings.get("recent_closed_kb", 1024), 1024), 16, MAX_RECENT_CLOSED_KB)
+        settings["perf_monitor"] = bool(settings.get("perf_monitor", False))
+        settings["index_page_content"] = bool(settings.get("index_page_content", False))
+        settings["http_cache_type"] = settings.get("http_cache_type") if settings.get("http_cache_type") in HTTP_CACHE_TYPES else "disk"
+        settings["http_cache_max_mb"] = clamp(to_int(settings.get("http_cache_max_mb", 0), 0), 0, MAX_HTTP_CACHE_MB)
+        settings["archive_max_mb"] = clamp(to_int(settings.get("archive_max_mb", 1024), 1024), 16, MAX_ARCHIVE_MB)
+        settings["archive_refresh_days"] = clamp(to_int(settings.get("archive_refresh_days", 7), 7), 0, 3650)
+        settings["hover_prefetch"] = settings.get("hover_prefetch") if settings.get("hover_prefetch") in HOVER_PREFETCH_MODES else "preconnect"
         return settings
 
     def _normalize_home_url(self, text):
@@ -860,8 +4821,109 @@ class Browser(QMainWindow):
         data["current_index"] = to_int(data.get("current_index", 0), 0)
         return data
 
-    def _load_history(self):
-        return load_json_file(HISTORY_FILE, [])
+    def _start_store_loads(self):
+        for fn, on_finished, on_failed, args in (
+            (load_bookmark_store, self._on_bookmarks_loaded, self._on_bookmarks_load_failed, (BOOKMARK_FILE,)),
+            (load_history_store, self._on_history_loaded, self._on_history_load_failed, (HISTORY_FILE, self.settings["history_retention_days"])),
+        ):
+            task = BackgroundTask(fn, *args)
+            task.signals.finished.connect(on_finished)
+            task.signals.failed.connect(on_failed)
+            self._store_tasks.add(task)
+            QThreadPool.globalInstance().start(task)
+
+    def _forget_store_task(self):
+        self._store_tasks = {t for t in self._store_tasks if t.signals is not self.sender()}
+
+    def _on_history_loaded(self, result):
+        self._forget_store_task()
+        early_visits = len(self.history)
+        # 준비 전 방문이 더 최신이므로 앞에 둠
+        self.history = self.history + result["items"]
+        self._top_sites_cache = None
+        self._omnibox_index = None
+        self.history_ready.set_result(self.history)
+        METRICS.observe("startup.history_load", result["ms"])
+        METRICS.observe("startup.history_ready", (time.perf_counter() - PROCESS_STARTED_AT) * 1000)
+        if early_visits or result["pruned"]:
+            self._save_history()
+        if self.history_dialog and self.history_dialog.isVisible():
+            self.history_dialog.refresh()
+        self._reload_new_tab_pages()
+
+    def _on_bookmarks_loaded(self, result):
+        self._forget_store_task()
+        early_bookmarks = len(self.bookmarks)
+        self.bookmarks = result["items"] + self.bookmarks
+        self._omnibox_index = None
+        self.bookmarks_ready.set_result(self.bookmarks)
+        METRICS.observe("startup.bookmarks_load", result["ms"])
+        METRICS.observe("startup.bookmarks_ready", (time.perf_counter() - PROCESS_STARTED_AT) * 1000)
+        if early_bookmarks:
+            self._save_bookmarks()
+        else:
+            self._refresh_bookmarks_toolbar()
+        self.bookmark_manager.refresh()
+        self._update_star()
+        self._reload_new_tab_pages()
+
+    def _on_history_load_failed(self, message):
+        self._forget_store_task()
+        self._on_store_load_failed(self.history_ready, "방문 기록을", message)
+        if self.history_dialog and self.history_dialog.isVisible():
+            self.history_dialog.refresh()
+
+    def _on_bookmarks_load_failed(self, message):
+        self._forget_store_task()
+        self._on_store_load_failed(self.bookmarks_ready, "즐겨찾기를", message)
+        self._update_star()
+
+    def _on_store_load_failed(self, future, what, message):
+        # 읽지 못한 저장소는 빈 목록으로 두고, 원본 파일을 덮어쓰지 않도록 이번 실행 동안 저장을 막음
+        METRICS.incr("startup.store_load_failed")
+        future.set_error(message)
+        self.status_label.setText(f"{what} 읽지 못했습니다: {future.error} (이번 실행에서는 저장하지 않습니다)")
+        QMessageBox.warning(
+            self, "데이터 읽기 실패",
+            f"{what} 읽지 못했습니다.\n{future.error}\n\n파일을 보호하기 위해 이번 실행 동안 변경 사항을 저장하지 않습니다."
+        )
+
+    def _reject_store_operation(self, message):
+        self.status_label.setText(f"방문 기록/즐겨찾기를 읽지 못해 작업을 진행하지 않았습니다: {message}")
+
+    def _reload_new_tab_pages(self):
+        # 준비 전에 열린 새 탭 페이지는 자주 가는 사이트/즐겨찾기가 비어 있으므로 다시 그림
+        for _idx, view in self._actual_tab_views():
+            if view.url().toString().startswith(NEW_TAB_URL):
+                view.reload()
+
+    def _defer_until_stores_ready(self, fn, *args):
+        # 다 읽기 전에 시작하면 중복 판정/내보내기/삭제가 빈 목록 기준이 되므로 준비 뒤로 미룸
+        if self.history_ready.is_ready() and self.bookmarks_ready.is_ready():
+            return False
+        failed = self.history_ready.error or self.bookmarks_ready.error
+        if failed:
+            self._reject_store_operation(failed)
+            return True
+        self.status_label.setText("방문 기록/즐겨찾기를 불러오는 중… 끝나면 이어서 진행합니다.")
+        self.history_ready.then(
+            lambda _h: self.bookmarks_ready.then(lambda _b: fn(*args), self._reject_store_operation),
+            self._reject_store_operation,
+        )
+        return True
+
+    def showEvent(self, event):
+        super().showEvent(event)
+        if not self._window_shown:
+            self._window_shown = True
+            # 첫 프레임을 그린 다음 이벤트 루프 차례에 측정하고, 그 뒤에 무거운 저장소를 읽기 시작
+            QTimer.singleShot(0, self._on_first_shown)
+
+    def _on_first_shown(self):
+        now = time.perf_counter()
+        METRICS.observe("startup.time_to_window", (now - PROCESS_STARTED_AT) * 1000)
+        METRICS.observe("startup.window_init", (now - self._constructed_at) * 1000)
+        self._start_store_loads()
 
     def _cleanup_shared_dictionary_store(self, storage_path):
         root = os.path.abspath(storage_path)
@@ -888,33 +4950,160 @@ class Browser(QMainWindow):
                 pass
 
     def _save_history(self):
+        self._top_sites_cache = None
+        self._omnibox_index = None
+        if not self.history_ready.is_ready():
+            return
         save_json_file(HISTORY_FILE, self.history)
 
-    def _prune_history(self, save=False):
+    def omnibox_index(self):
+        if self._omnibox_index is None:
+            self._omnibox_index = build_omnibox_index(self.history, self.bookmarks)
+        return self._omnibox_index
+
+    def top_sites(self, limit):
+        # 새 탭 페이지가 매번 전체 기록을 훑지 않도록 기록이 바뀔 때까지 캐시
+        if self._top_sites_cache is None or len(self._top_sites_cache) < limit:
+            self._top_sites_cache = frecency_top_sites(self.history, max(limit, NEW_TAB_TOP_SITES))
+        return self._top_sites_cache[:limit]
+
+    def import_chromium_history(self, path):
+        if self._defer_until_stores_ready(self.import_chromium_history, path):
+            return
+        if self._history_importer:
+            self.status_label.setText("이미 방문 기록을 가져오는 중입니다.")
+            return
+        existing = {(item.get("url"), item.get("visited_at")) for item in self.history}
         days = to_int(self.settings.get("history_retention_days", 90), 90)
-        cutoff = datetime.now() - timedelta(days=days)
-        kept = []
-        for item in self.history:
-            try:
-                visited_at = datetime.fromisoformat(item.get("visited_at", ""))
-            except Exception:
-                continue
-            if visited_at >= cutoff:
-                kept.append(item)
+        self._history_importer = ChromiumHistoryImporter(path, days, existing, self)
+        self._history_importer.progress.connect(self._on_history_import_progress)
+        self._history_importer.chunk.connect(self._on_history_import_chunk)
+        self._history_import_added = 0
+        self._history_importer.finished.connect(self._on_history_imported)
+        self._history_importer.failed.connect(self._on_history_import_failed)
+        self._history_import_progress = QProgressDialog("방문 기록을 읽는 중…", "취소", 0, 0, self)
+        self._history_import_progress.setWindowTitle("방문 기록 가져오기")
+        self._history_import_progress.setMinimumDuration(300)
+        self._history_import_progress.canceled.connect(self._history_importer.cancel)
+        self._history_importer.start()
+
+    def _on_history_import_progress(self, done, total, available):
+        if self._history_import_progress:
+            self._history_import_progress.setMaximum(max(total, 1))
+            self._history_import_progress.setValue(done)
+            label = f"방문 기록 {done:,} / {total:,}"
+            if available > total:
+                label += f"\n(보존 기간 안의 {available:,}건 중 최근 {total:,}건까지만 가져옵니다)"
+            self._history_import_progress.setLabelText(label)
+
+    def _on_history_import_chunk(self, items):
+        # 묶음마다 바로 병합 (저장/화면 갱신은 끝날 때 한 번)
+        self.history = merge_history_items(self.history, items)
+        self._history_import_added += len(items)
+
+    def _commit_imported_history(self):
+        if not self._history_import_added:
+            return
+        self._history_import_added = 0
+        self._prune_history(save=False)
+        self._save_history()
+        if self.history_dialog and self.history_dialog.isVisible():
+            self.history_dialog.refresh()
+
+    def _finish_history_import(self):
+        self._history_importer = None
+        if self._history_import_progress:
+            self._history_import_progress.close()
+            self._history_import_progress.deleteLater()
+            self._history_import_progress = None
+
+    def _on_history_imported(self, result):
+        self._finish_history_import()
+        self._commit_imported_history()
+        message = (
+            f"방문 기록 {result['imported']:,}건을 가져왔습니다 "
+            f"(읽음 {result['read']:,}, 중복 {result['duplicates']:,}, 건너뜀 {result['skipped']:,})."
+        )
+        if result["cancelled"]:
+            message = "방문 기록 가져오기를 취소했습니다. 그 전까지 " + message
+        elif result["capped"] > 0:
+            message += (
+                f"\n보존 기간 안의 {result['available']:,}건 중 최근 {HISTORY_IMPORT_MAX_VISITS:,}건까지만 가져와 "
+                f"오래된 {result['capped']:,}건은 건너뛰었습니다."
+            )
+        self.status_label.setText(message.replace("\n", " "))
+        QMessageBox.information(self, "방문 기록 가져오기", message)
+
+    def _on_history_import_failed(self, message):
+        self._finish_history_import()
+        # 실패 전까지 병합된 묶음은 올바른 항목이므로 저장
+        self._commit_imported_history()
+        QMessageBox.warning(self, "방문 기록 가져오기", f"방문 기록 파일을 읽지 못했습니다.\n{message}")
+
+    def _prune_history(self, save=False):
+        kept = prune_history_items(self.history, to_int(self.settings.get("history_retention_days", 90), 90))
         if len(kept) != len(self.history):
             self.history = kept
             if save:
                 self._save_history()
 
     # ---------------- Bookmark helpers ----------------
-    def _load_bookmarks(self):
-        return load_json_file(BOOKMARK_FILE, [])
-
     def _save_bookmarks(self):
+        self._omnibox_index = None
+        if not self.bookmarks_ready.is_ready():
+            return
         save_json_file(BOOKMARK_FILE, self.bookmarks)
         if hasattr(self, "bookmark_toolbar"):
             self._refresh_bookmarks_toolbar()
 
+    def import_bookmarks(self, path):
+        if self._defer_until_stores_ready(self.import_bookmarks, path):
+            return
+        existing = {canonical_url(bm.get("url", "")) for bm in self.bookmarks}
+        self._start_bookmark_task(import_bookmarks_file, self._on_bookmarks_imported, path, existing)
+        self.status_label.setText("즐겨찾기를 가져오는 중…")
+
+    def export_bookmarks(self, path, fmt):
+        if self._defer_until_stores_ready(self.export_bookmarks, path, fmt):
+            return
+        snapshot = [dict(bm) for bm in self.bookmarks]
+        self._start_bookmark_task(export_bookmarks_file, self._on_bookmarks_exported, path, snapshot, fmt)
+
+    def _start_bookmark_task(self, fn, on_finished, *args):
+        task = BackgroundTask(fn, *args)
+        task.signals.finished.connect(on_finished)
+        task.signals.failed.connect(self._on_bookmark_task_failed)
+        self._bookmark_tasks.add(task)
+        QThreadPool.globalInstance().start(task)
+
+    def _forget_bookmark_task(self):
+        self._bookmark_tasks = {t for t in self._bookmark_tasks if t.signals is not self.sender()}
+
+    def _on_bookmarks_imported(self, result):
+        self._forget_bookmark_task()
+        # 가져온 항목은 한 번에 붙이고 저장/툴바 갱신도 한 번만
+        items = result["items"]
+        if items:
+            self.bookmarks.extend(items)
+            self._save_bookmarks()
+            self.bookmark_manager.refresh()
+            self._update_star()
+        message = (
+            f"즐겨찾기 {len(items):,}개를 가져왔습니다 (폴더 {result['folders']:,}개, "
+            f"중복 {result['duplicates']:,}개, 건너뜀 {result['skipped']:,}개)."
+        )
+        self.status_label.setText(message)
+        QMessageBox.information(self, "즐겨찾기 가져오기", message)
+
+    def _on_bookmarks_exported(self, result):
+        self._forget_bookmark_task()
+        self.status_label.setText(f"즐겨찾기 {result['count']:,}개를 내보냈습니다: {result['path']}")
+
+    def _on_bookmark_task_failed(self, message):
+        self._forget_bookmark_task()
+        self.status_label.setText("즐겨찾기 가져오기/내보내기 실패")
+        QMessageBox.warning(self, "즐겨찾기", f"파일을 처리하지 못했습니다.\n{message}")
+
     def _is_bookmarked(self, url: str) -> bool:
         return any(bm.get("url") == url for bm in self.bookmarks)
 
@@ -922,6 +5111,7 @@ class Browser(QMainWindow):
         before = len(self.bookmarks)
         self.bookmarks = [bm for bm in self.bookmarks if bm.get("url") != url]
         if len(self.bookmarks) != before:
+            self.archive_store.remove(url)
             self._save_bookmarks()
             self.bookmark_manager.refresh()
 
@@ -962,7 +5152,9 @@ class Browser(QMainWindow):
             title = self.bookmarks[index].get("title") or self.bookmarks[index].get("url") or "선택한 항목"
             if QMessageBox.question(self, "즐겨찾기 삭제", f"'{title}' 즐겨찾기를 삭제할까요?") != QMessageBox.Yes:
                 return
-        del self.bookmarks[index]
+        url = self.bookmarks.pop(index).get("url", "")
+        if not self._is_bookmarked(url):
+            self.archive_store.remove(url)
         self._save_bookmarks()
         self.bookmark_manager.refresh()
         self._update_star()
@@ -971,28 +5163,101 @@ class Browser(QMainWindow):
         view = self.current_view()
         url = view.url().toString() if view else ""
         if hasattr(self, "star_btn"):
+            self.star_btn.setEnabled(self.bookmarks_ready.is_ready())
             if url and self._is_bookmarked(url):
                 self.star_btn.setText("★")
                 self.star_btn.setToolTip("즐겨찾기 제거")
             else:
                 self.star_btn.setText("☆")
                 self.star_btn.setToolTip("즐겨찾기 추가 (Ctrl+D)")
+            if self.bookmarks_ready.error:
+                self.star_btn.setToolTip(f"즐겨찾기를 읽지 못해 사용할 수 없습니다: {self.bookmarks_ready.error}")
 
     def _refresh_bookmarks_toolbar(self):
         if not hasattr(self, "bookmark_toolbar"):
             return
         self.bookmark_toolbar.clear()
+        for menu in self._bookmark_folder_menus:
+            menu.deleteLater()
+        self._bookmark_folder_menus = []
         self.bookmark_toolbar.setVisible(bool(self.settings.get("show_bookmarks_toolbar", True)))
+        # 최상위 폴더는 펼칠 때 채우는 메뉴로, 최상위 즐겨찾기만 버튼으로
+        top_folders = []
+        for bm in self.bookmarks:
+            folder = bm.get("folder")
+            if folder and folder[0] not in top_folders:
+                top_folders.append(folder[0])
+        for name in top_folders:
+            menu = QMenu(name[:28], self.bookmark_toolbar)
+            menu.aboutToShow.connect(lambda m=menu, p=[name]: self._populate_bookmark_folder_menu(m, p))
+            menu.hovered.connect(self._on_bookmark_menu_hovered)
+            menu.aboutToHide.connect(self.hover_prefetcher.leave)
+            self._bookmark_folder_menus.append(menu)
+            self.bookmark_toolbar.addAction(menu.menuAction())
+            button = self.bookmark_toolbar.widgetForAction(menu.menuAction())
+            if isinstance(button, QToolButton):
+                button.setPopupMode(QToolButton.InstantPopup)
         for idx, bm in enumerate(self.bookmarks):
             title = bm.get("title") or bm.get("url") or "무제"
             url = bm.get("url", "")
-            if not url:
+            if not url or bm.get("folder"):
                 continue
             action = QAction(title[:28], self)
             action.setToolTip(url)
             action.setData(idx)
-            action.triggered.connect(lambda _=False, u=url: self.create_new_tab(u))
+            action.triggered.connect(lambda _=False, u=url: self.open_intent_url(u))
             self.bookmark_toolbar.addAction(action)
+            button = self.bookmark_toolbar.widgetForAction(action)
+            if button:
+                button.setProperty("prefetch_url", url)
+                button.installEventFilter(self.hover_prefetcher)
+
+    def _populate_bookmark_folder_menu(self, menu, path):
+        menu.clear()
+        depth = len(path)
+        subfolders, items = [], []
+        for idx, bm in enumerate(self.bookmarks):
+            folder = bm.get("folder") or []
+            if folder[:depth] != path:
+                continue
+            if len(folder) > depth:
+                if folder[depth] not in subfolders:
+                    subfolders.append(folder[depth])
+            else:
+                items.append((idx, bm))
+        for name in subfolders:
+            submenu = menu.addMenu(name[:60])
+            submenu.aboutToShow.connect(lambda m=submenu, p=path + [name]: self._populate_bookmark_folder_menu(m, p))
+            submenu.hovered.connect(self._on_bookmark_menu_hovered)
+            submenu.aboutToHide.connect(self.hover_prefetcher.leave)
+        if subfolders and items:
+            menu.addSeparator()
+        for _idx, bm in items:
+            action = menu.addAction((bm.get("title") or bm.get("url", ""))[:60])
+            action.setToolTip(bm.get("url", ""))
+            action.setData(bm.get("url", ""))
+            action.triggered.connect(lambda _=False, u=bm.get("url", ""): self.open_intent_url(u))
+        menu.addSeparator()
+        act_archive = menu.addAction("이 폴더 오프라인 보관")
+        act_archive.triggered.connect(lambda _=False, p=list(path): self.archive_bookmark_folder(p))
+
+    def _on_bookmark_menu_hovered(self, action):
+        url = action.data()
+        if isinstance(url, str) and url:
+            self.hover_prefetcher.hover(url, "menu")
+        else:
+            self.hover_prefetcher.leave()
+
+    def open_intent_url(self, url):
+        # 호버로 미리 데운 링크인지 기록해 두고 첫 로드의 TTFB 를 적중/실패로 나눠 집계
+        outcome = self.hover_prefetcher.note_click(url)
+        view = self.create_new_tab(url)
+        view.prefetch_outcome = outcome
+        return view
+
+    def archive_bookmark_folder(self, path):
+        depth = len(path)
+        self.archive_bookmarks([i for i, bm in enumerate(self.bookmarks) if (bm.get("folder") or [])[:depth] == path])
 
     def _show_bookmark_context_menu(self, pos):
         action = self.bookmark_toolbar.actionAt(pos)
@@ -1002,15 +5267,56 @@ class Browser(QMainWindow):
         if not isinstance(index, int) or not (0 <= index < len(self.bookmarks)):
             return
 
+        url = self.bookmarks[index].get("url", "")
         menu = QMenu(self.bookmark_toolbar)
         act_edit = QAction("수정", self)
         act_delete = QAction("삭제", self)
+        act_archive = QAction("오프라인 보관", self)
+        act_open_archived = QAction("보관본 열기", self)
+        act_open_archived.setEnabled(self.archive_store.entry(url) is not None)
         act_edit.triggered.connect(lambda _=False, i=index: self.edit_bookmark(i))
         act_delete.triggered.connect(lambda _=False, i=index: self.delete_bookmark(i, confirm=True))
+        act_archive.triggered.connect(lambda _=False, i=index: self.archive_bookmarks([i]))
+        act_open_archived.triggered.connect(lambda _=False, u=url: self.open_archived(u))
         menu.addAction(act_edit)
         menu.addAction(act_delete)
+        menu.addSeparator()
+        menu.addAction(act_archive)
+        menu.addAction(act_open_archived)
         menu.exec(self.bookmark_toolbar.mapToGlobal(pos))
 
+    # ---------------- Offline archive ----------------
+    def archive_bookmarks(self, indices):
+        items = [
+            (self.bookmarks[i].get("url", ""), self.bookmarks[i].get("title", ""))
+            for i in indices if 0 <= i < len(self.bookmarks)
+        ]
+        added = self.archiver.enqueue(items)
+        self.status_label.setText(f"오프라인 보관 대기열에 {added}개를 추가했습니다." if added else "보관할 수 있는 http(s) 즐겨찾기가 없습니다.")
+
+    def open_archived(self, url):
+        path = self.archive_store.path_for(url)
+        if not path:
+            self.status_label.setText("보관본이 없습니다.")
+            return
+        self.create_new_tab(QUrl.fromLocalFile(path).toString())
+
+    def _refresh_stale_archives(self):
+        days = self.settings["archive_refresh_days"]
+        if not days:
+            return
+        # 한 번이라도 보관한 즐겨찾기만 주기적으로 다시 저장
+        bookmarked = {bm.get("url", ""): bm.get("title", "") for bm in self.bookmarks}
+        stale = self.archive_store.stale_urls(bookmarked, days)
+        if stale:
+            self.archiver.enqueue([(url, bookmarked[url]) for url in stale])
+
+    def _apply_archive_settings(self):
+        self.archiver.max_bytes = self.settings["archive_max_mb"] * 1024 * 1024
+        if self.archive_store.enforce(self.archiver.max_bytes):
+            self.archive_store.save()
+        self.bookmark_manager.refresh()
+
     # ---------------- Toolbar ----------------
     def _build_toolbar(self):
         tb = QToolBar("Navigation", self)
@@ -1048,9 +5354,8 @@ class Browser(QMainWindow):
         menu_button.setPopupMode(QToolButton.InstantPopup)
         menu = QMenu(menu_button)
 
-        act_restore_closed = QAction("최근 닫은 탭 다시 열기", self)
-        act_restore_closed.triggered.connect(self.restore_recent_closed_tab)
-        menu.addAction(act_restore_closed)
+        self.recent_closed_menu = menu.addMenu("최근 닫은 탭")
+        self.recent_closed_menu.aboutToShow.connect(self._populate_recent_closed_menu)
 
         act_history = QAction("방문 기록", self)
         act_history.triggered.connect(self.show_history)
@@ -1064,6 +5369,50 @@ class Browser(QMainWindow):
         act_bookmarks.triggered.connect(lambda: self.bookmark_manager.show())
         menu.addAction(act_bookmarks)
 
+        act_overview = QAction("탭 한눈에 보기", self)
+        act_overview.triggered.connect(self.show_tab_overview)
+        menu.addAction(act_overview)
+
+        act_nav_timing = QAction("사이트별 로딩 성능", self)
+        act_nav_timing.triggered.connect(lambda: NavTimingDialog(self, self).exec())
+        menu.addAction(act_nav_timing)
+
+        act_tab_perf = QAction("탭 성능", self)
+        act_tab_perf.triggered.connect(self.show_tab_perf)
+        menu.addAction(act_tab_perf)
+
+        act_site_data = QAction("사이트 데이터", self)
+        act_site_data.triggered.connect(self.show_site_data)
+        menu.addAction(act_site_data)
+
+        act_crashes = QAction("렌더러 충돌 통계", self)
+        act_crashes.triggered.connect(self.show_crash_stats)
+        menu.addAction(act_crashes)
+
+        act_perf = QAction("성능 진단", self)
+        act_perf.triggered.connect(lambda: self.create_new_tab("kyo://perf"))
+        menu.addAction(act_perf)
+
+        self.trace_action = QAction("이벤트 트레이스 기록", self)
+        self.trace_action.setCheckable(True)
+        self.trace_action.setChecked(TRACE.enabled)
+        self.trace_action.toggled.connect(self.set_tracing)
+        menu.addAction(self.trace_action)
+
+        act_trace_save = QAction("트레이스 저장…", self)
+        act_trace_save.triggered.connect(self.save_trace)
+        menu.addAction(act_trace_save)
+
+        menu.addSeparator()
+
+        act_backup = QAction("사용자 데이터 내보내기…", self)
+        act_backup.triggered.connect(self.backup_user_data)
+        menu.addAction(act_backup)
+
+        act_restore = QAction("사용자 데이터 가져오기…", self)
+        act_restore.triggered.connect(self.restore_user_data)
+        menu.addAction(act_restore)
+
         menu.addSeparator()
 
         self.zoom_status_action = QAction("확대율: 100%", self)
@@ -1136,7 +5485,7 @@ class Browser(QMainWindow):
 
         act_restore_tab = QAction(self)
         act_restore_tab.setShortcut("Ctrl+Shift+T")
-        act_restore_tab.triggered.connect(self.restore_recent_closed_tab)
+        act_restore_tab.triggered.connect(lambda _=False: self.restore_recent_closed_tab())
         self.addAction(act_restore_tab)
 
         act_zoom_in = QAction(self)
@@ -1149,11 +5498,21 @@ class Browser(QMainWindow):
         act_zoom_out.triggered.connect(self.zoom_out)
         self.addAction(act_zoom_out)
 
+        act_find_all = QAction(self)
+        act_find_all.setShortcut("Ctrl+Shift+F")
+        act_find_all.triggered.connect(self.show_cross_tab_find)
+        self.addAction(act_find_all)
+
         act_zoom_reset = QAction(self)
         act_zoom_reset.setShortcut("Ctrl+0")
         act_zoom_reset.triggered.connect(self.reset_zoom)
         self.addAction(act_zoom_reset)
 
+        act_overview = QAction(self)
+        act_overview.setShortcut("Ctrl+Shift+A")
+        act_overview.triggered.connect(self.show_tab_overview)
+        self.addAction(act_overview)
+
         # (선택) 종료 단축키를 쓰고 싶다면 주석 해제
         # act_quit = QAction(self)
         # act_quit.setShortcut("Ctrl+Q")
@@ -1162,6 +5521,8 @@ class Browser(QMainWindow):
 
     # ---------------- Downloads ----------------
     def on_download_requested(self, item: QWebEngineDownloadRequest):
+        if self.archiver.claim_download(item):
+            return
         suggested = item.suggestedFileName() or "download"
         path, _ = QFileDialog.getSaveFileName(self, "파일 저장", suggested)
         if path:
@@ -1174,10 +5535,10 @@ class Browser(QMainWindow):
 
     # ---------------- Browser Core ----------------
     def _has_plus_tab(self) -> bool:
-        return self.tabs.count() > 0 and self.tabs.tabText(self.tabs.count() - 1) == "+"
+        return self.tab_registry.index_of(self.tab_registry.plus_widget) != -1
 
     def _is_plus_index(self, index: int) -> bool:
-        return 0 <= index < self.tabs.count() and self.tabs.tabText(index) == "+"
+        return index != -1 and self.tab_registry.index_of(self.tab_registry.plus_widget) == index
 
     def _run_on_current_view(self, action):
         view = self.current_view()
@@ -1187,10 +5548,16 @@ class Browser(QMainWindow):
     def _ensure_plus_tab(self):
         # 맨 끝이 +가 아니면 추가, 맞으면 닫기 버튼 비활성 느낌으로 유지
         if not self._has_plus_tab():
-            idx = self.tabs.addTab(QWidget(), "+")
+            idx = self.tabs.addTab(self.tab_registry.plus_widget, "+")
+            self.tabs.tabBar().setTabData(idx, PLUS_TAB_MARK)
             # 닫기 버튼/아이콘 제거
             self.tabs.tabBar().setTabButton(idx, QTabBar.RightSide, None)
             self.tabs.tabBar().setTabButton(idx, QTabBar.LeftSide, None)
+        else:
+            # 드래그로 + 탭이 중간으로 옮겨졌다면 다시 끝으로
+            idx = self.tab_registry.index_of(self.tab_registry.plus_widget)
+            if idx != self.tabs.count() - 1:
+                self.tabs.tabBar().moveTab(idx, self.tabs.count() - 1)
 
     def _open_tab_from_plus(self, index: int):
         if not self._is_plus_index(index):
@@ -1199,6 +5566,12 @@ class Browser(QMainWindow):
         self.create_new_tab(self.get_home_url())
         self._ensure_plus_tab()
 
+    def _capture_leaving_thumbnail(self, _index):
+        # 전환되면 떠나는 탭은 바로 숨겨져 grab() 이 빈 화면이 되므로 바뀌기 전에 찍음
+        view = self.current_view()
+        if view:
+            self._capture_thumbnail(view)
+
     def _on_tab_changed(self, index: int):
         # + 탭 클릭 시 → 새 탭 만들고 + 유지 (단, 닫는 중엔 무시)
         if self._is_plus_index(index):
@@ -1211,60 +5584,86 @@ class Browser(QMainWindow):
         # 일반 탭이면 URL바 갱신
         self._update_urlbar_from_tab(index)
         self._update_zoom_label()
+        if self.tab_sidebar:
+            self.tab_sidebar.select_view(self.current_view())
 
-    def create_new_tab(self, url):
+    @traced("tab.create", "tabs", url=lambda _self, url, *_args, **_kwargs: normalize_url(url))
+    def create_new_tab(self, url, state=None):
         view = WebView(self.profile, self)
         view.setZoomFactor(self.settings.get("default_zoom", DEFAULT_ZOOM) / 100)
+        if self.perf_monitor_script:
+            self._attach_perf_bridge(view)
         # 항상 + 탭 바로 앞에 삽입(있다면)
-        insert_at = self.tabs.count()
-        if self._has_plus_tab():
-            insert_at -= 1
+        insert_at = self.tab_registry.index_of(self.tab_registry.plus_widget)
+        if insert_at == -1:
+            insert_at = self.tabs.count()
         i = self.tabs.insertTab(insert_at, view, "New Tab")
         self.tabs.setCurrentIndex(i)
 
-        def set_tab_title_from_view(v: QWebEngineView, title: str | None = None):
-            idx = self.tabs.indexOf(v)
-            if idx != -1:
-                self.tabs.setTabText(idx, title or v.title() or "New Tab")
-
-        def set_tab_icon_from_view(v: QWebEngineView):
-            idx = self.tabs.indexOf(v)
-            if idx != -1:
-                self.tabs.setTabIcon(idx, v.icon())
-
-        view.titleChanged.connect(lambda _t, v=view: set_tab_title_from_view(v))
-        view.iconChanged.connect(lambda _i, v=view: set_tab_icon_from_view(v))
-        view.loadStarted.connect(lambda v=view: set_tab_title_from_view(v, "Loading…"))
-        view.loadFinished.connect(lambda ok, v=view: (set_tab_title_from_view(v), self._on_view_load_finished(v, ok)))
-        view.urlChanged.connect(lambda qurl, v=view: (self._update_urlbar(qurl, v), self._update_star()))
-        view.setUrl(QUrl(url))
+        # 탭바/주소창/별 갱신은 바로 하지 않고 프레임 단위로 묶어서 반영
+        updates = self.ui_updates
+        view.titleChanged.connect(lambda _t, v=view: updates.mark(v, "title"))
+        view.iconChanged.connect(lambda _i, v=view: updates.mark(v, "icon"))
+        view.loadStarted.connect(lambda v=view: (updates.mark(v, "title", "Loading…"), self._on_view_load_started(v)))
+        view.loadFinished.connect(lambda ok, v=view: (updates.mark(v, "title"), self._on_view_load_finished(v, ok)))
+        view.urlChanged.connect(lambda _qurl, v=view: updates.mark(v, "url"))
+        view.page().findTextFinished.connect(lambda result, v=view: self._on_find_result(v, result))
+        view.page().renderProcessTerminated.connect(
+            lambda status, code, v=view: self._on_render_process_terminated(v, status, code)
+        )
+        if not (state and self._apply_tab_state(view, state)):
+            view.setUrl(QUrl(url))
 
         # 새 탭 만든 후에도 + 탭은 항상 끝에 유지
         self._ensure_plus_tab()
         self._update_zoom_label()
+        TRACE.counter("tabs", "tabs", open=len(self.tab_registry.views()))
         return view
 
+    def _apply_tab_ui(self, view, fields):
+        idx = self.tab_registry.index_of(view)
+        if "title" in fields:
+            self.tabs.setTabText(idx, fields["title"] or view.title() or "New Tab")
+        if "icon" in fields:
+            self.tabs.setTabIcon(idx, view.icon())
+        if "url" in fields:
+            self._update_urlbar(view.url(), view)
+        self.tab_registry.changed(view)
+
     def _actual_tab_views(self):
-        result = []
-        for idx in range(self.tabs.count()):
-            widget = self.tabs.widget(idx)
-            if isinstance(widget, QWebEngineView):
-                result.append((idx, widget))
-        return result
+        return [(self.tab_registry.index_of(view), view) for view in self.tab_registry.views()]
 
     def _current_actual_index(self):
-        current = self.current_view()
-        for pos, (_idx, view) in enumerate(self._actual_tab_views()):
-            if view == current:
-                return pos
-        return 0
+        return max(0, self.tab_registry.row_of(self.current_view()))
+
+    def _tab_state(self, view):
+        state = {"url": view.url().toString(), "title": view.title() or "New Tab"}
+        history = serialize_page_history(view.page())
+        if history:
+            state["history"] = history
+        scroll = view.page().scrollPosition()
+        if scroll.y() or scroll.x():
+            state["scroll"] = [int(scroll.x()), int(scroll.y())]
+        zoom = round(view.zoomFactor() * 100)
+        if zoom != self.settings.get("default_zoom", DEFAULT_ZOOM):
+            state["zoom"] = zoom
+        return state
+
+    def _apply_tab_state(self, view, state):
+        if "zoom" in state:
+            view.setZoomFactor(clamp(to_int(state["zoom"], DEFAULT_ZOOM), MIN_ZOOM, MAX_ZOOM) / 100)
+        # 저장된 뒤로/앞으로 기록을 복원하면 현재 항목이 바로 로드되므로 setUrl 이 필요 없음
+        scroll = state.get("scroll")
+        if isinstance(scroll, list) and len(scroll) == 2:
+            view.pending_scroll = scroll
+        history = state.get("history")
+        return bool(history) and restore_page_history(view.page(), history)
 
     def _session_tabs(self):
         tabs = []
         for _idx, view in self._actual_tab_views():
-            url = view.url().toString()
-            if url:
-                tabs.append({"url": url, "title": view.title() or "New Tab"})
+            if view.url().toString():
+                tabs.append(self._tab_state(view))
         return tabs
 
     def _save_session(self):
@@ -1273,7 +5672,7 @@ class Browser(QMainWindow):
         data = {
             "tabs": self._session_tabs(),
             "current_index": self._current_actual_index(),
-            "recent_closed": self.recent_closed_tabs[:MAX_RECENT_CLOSED],
+            "recent_closed": self.recent_closed.to_list(),
             "saved_at": now_iso(),
         }
         save_json_file(SESSION_FILE, data)
@@ -1286,37 +5685,295 @@ class Browser(QMainWindow):
         if not valid_tabs:
             return False
         for tab in valid_tabs:
-            self.create_new_tab(tab["url"])
+            self.create_new_tab(tab["url"], tab)
         actuals = self._actual_tab_views()
         if actuals:
             current_index = clamp(self.saved_session.get("current_index", 0), 0, len(actuals) - 1)
             self.tabs.setCurrentIndex(actuals[current_index][0])
         return True
 
-    def _push_recent_closed_tab(self, url, title):
-        if not url:
-            return
-        item = {"url": url, "title": title or url, "closed_at": now_iso()}
-        self.recent_closed_tabs = [tab for tab in self.recent_closed_tabs if tab.get("url") != url]
-        self.recent_closed_tabs.insert(0, item)
-        self.recent_closed_tabs = self.recent_closed_tabs[:MAX_RECENT_CLOSED]
+    def _push_recent_closed_tab(self, state):
+        if state.get("url") and not is_internal_url(state["url"]):
+            self.recent_closed.push(state)
 
-    def restore_recent_closed_tab(self):
-        if not self.recent_closed_tabs:
+    def restore_recent_closed_tab(self, url=None):
+        # 기록/확대율/스크롤까지 되살리므로 뒤로 가기도 닫기 전과 같음
+        state = self.recent_closed.pop(url if isinstance(url, str) else None)
+        if not state:
             self.status_label.setText("최근 닫은 탭이 없습니다.")
             return
-        item = self.recent_closed_tabs.pop(0)
-        url = item.get("url", "")
-        if url:
-            self.create_new_tab(url)
+        self.create_new_tab(state["url"], state)
+
+    def _populate_recent_closed_menu(self):
+        menu = self.recent_closed_menu
+        menu.clear()
+        act_last = QAction("마지막으로 닫은 탭 다시 열기", self)
+        act_last.setShortcut("Ctrl+Shift+T")
+        act_last.triggered.connect(lambda _=False: self.restore_recent_closed_tab())
+        act_last.setEnabled(len(self.recent_closed) > 0)
+        menu.addAction(act_last)
+        menu.addSeparator()
+        for entry in self.recent_closed.newest(RECENT_CLOSED_MENU_ITEMS):
+            title = entry.get("title") or entry["url"]
+            action = QAction(title[:60], self)
+            action.setToolTip(entry["url"])
+            action.triggered.connect(lambda _=False, u=entry["url"]: self.restore_recent_closed_tab(u))
+            menu.addAction(action)
+        if len(self.recent_closed):
+            menu.addSeparator()
+            act_clear = QAction(f"목록 비우기 ({len(self.recent_closed)}개, {self.recent_closed.total_bytes / 1024:,.0f} KB)", self)
+            act_clear.triggered.connect(self.clear_recent_closed)
+            menu.addAction(act_clear)
+
+    def clear_recent_closed(self):
+        self.recent_closed.clear()
+        self._save_session()
+
+    # ---------------- Renderer watchdog ----------------
+    def _on_render_process_terminated(self, view, status, exit_code):
+        if self._closing_app or not self.tab_registry.contains(view):
+            return
+        url = view.url().toString()
+        reason = RENDER_TERMINATION_REASONS.get(status, "unknown")
+        now = time.monotonic()
+        # 한동안 멀쩡했던 탭은 재시도 횟수를 처음부터 다시 셈
+        if now - view.last_crash_at > CRASH_RESET_AFTER_S:
+            view.crash_count = 0
+        view.crash_count += 1
+        view.last_crash_at = now
+        if is_internal_url(url):
+            self.crash_stats.record(url, reason, exit_code, view.crash_count, "ignored")
+            return
+        if view.crash_count <= CRASH_MAX_RELOADS:
+            delay_ms = CRASH_RELOAD_BASE_MS * 2 ** (view.crash_count - 1)
+            self.crash_stats.record(url, reason, exit_code, view.crash_count, "reload")
+            self.status_label.setText(f"탭 렌더러가 종료되었습니다({reason}). {delay_ms / 1000:g}초 뒤 다시 불러옵니다.")
+            QTimer.singleShot(delay_ms, lambda v=view: self._reload_after_crash(v))
+            return
+        self.crash_stats.record(url, reason, exit_code, view.crash_count, "placeholder")
+        self.status_label.setText("같은 탭이 계속 종료되어 멈춰 두었습니다.")
+        view.setUrl(QUrl(f"{KYO_SCHEME.decode()}://crashed?{urlencode({'url': url, 'reason': reason})}"))
+
+    def _reload_after_crash(self, view):
+        if self.tab_registry.contains(view):
+            view.reload()
+
+    # ---------------- Event trace ----------------
+    def set_tracing(self, enabled):
+        if enabled == TRACE.enabled:
+            return
+        if enabled:
+            TRACE.clear()
+            TRACE.start()
+            self.status_label.setText(f"이벤트 트레이스를 기록합니다 (최근 {TRACE.events.maxlen:,}개 보관).")
+        else:
+            TRACE.stop()
+            self.status_label.setText(f"이벤트 트레이스 기록을 멈췄습니다 ({len(TRACE.events):,}개). ☰ > 트레이스 저장으로 내보내세요.")
+
+    def save_trace(self):
+        default_path = os.path.join(os.path.expanduser("~"), f"kyobrowser-trace-{datetime.now():%Y%m%d-%H%M%S}.json")
+        path, _ = QFileDialog.getSaveFileName(self, "트레이스 저장", default_path, "Trace Event JSON (*.json)")
+        if not path:
+            return
+        try:
+            count = TRACE.export(path)
+        except OSError as exc:
+            QMessageBox.warning(self, "트레이스 저장", f"저장하지 못했습니다.\n{exc}")
+            return
+        self.status_label.setText(f"트레이스 이벤트 {count:,}개를 저장했습니다 (ui.perfetto.dev 에서 열기): {path}")
+
+    def show_crash_stats(self):
+        CrashStatsDialog(self, self).show()
+
+    def _on_view_load_started(self, view):
+        view.load_started_at = time.perf_counter()
+        TRACE.async_begin("navigation", f"{id(view):x}", "navigation", url=view.url().toString())
 
     def _on_view_load_finished(self, view, ok):
+        TRACE.async_end("navigation", f"{id(view):x}", "navigation", ok=bool(ok), url=view.url().toString())
+        view.load_generation += 1
+        if ok and view.pending_scroll:
+            x, y = view.pending_scroll
+            # Chromium 이 기록 복원 시 스크롤을 이미 맞췄다면 덮어쓰지 않음
+            view.page().runJavaScript(
+                f"if (!window.scrollY && !window.scrollX) {{ window.scrollTo({int(x)}, {int(y)}); }}",
+                QWebEngineScript.ApplicationWorld,
+            )
+        view.pending_scroll = None
         if ok:
             self._record_history(view.url().toString(), view.title())
+            self._record_nav_timing(view)
+            self._index_page_content(view)
+            QTimer.singleShot(THUMBNAIL_SETTLE_MS, lambda v=view: self._capture_thumbnail(v))
+        view.load_started_at = None
         self._update_zoom_label()
 
+    def _record_nav_timing(self, view):
+        # 호버 적중 여부는 그 링크의 첫 로드에만 해당
+        outcome, view.prefetch_outcome = view.prefetch_outcome, None
+        if view.load_started_at is None:
+            return
+        url = view.url()
+        host = url.host()
+        if not host or url.scheme() not in ("http", "https"):
+            return
+        total_ms = (time.perf_counter() - view.load_started_at) * 1000
+        METRICS.observe("navigation.load", total_ms)
+
+        def on_result(result, host=host, total_ms=total_ms, outcome=outcome):
+            try:
+                page_timing = json.loads(result) if isinstance(result, str) else {}
+            except ValueError:
+                page_timing = {}
+            self.nav_timing.add(host, total_ms, page_timing)
+            ttfb = page_timing.get("ttfb")
+            if outcome and isinstance(ttfb, (int, float)) and ttfb >= 0:
+                self.hover_prefetcher.record_ttfb(outcome, ttfb)
+
+        view.page().runJavaScript(NAV_TIMING_JS, QWebEngineScript.ApplicationWorld, on_result)
+
+    # ---------------- Metrics ----------------
+    def _metrics_tabs(self):
+        rows = []
+        for _idx, view in self._actual_tab_views():
+            page = view.page()
+            rows.append({
+                "title": view.title() or "New Tab",
+                "url": view.url().toString(),
+                "lifecycle": page.lifecycleState().name,
+                "pid": page.renderProcessPid() or None,
+                "rss_bytes": process_rss_bytes(page.renderProcessPid()),
+                "blocked_ms": view.perf_bridge.stats["blocked_ms"] if view.perf_bridge else None,
+            })
+        return rows
+
+    def _metrics_process(self):
+        # 같은 렌더러 프로세스를 공유하는 탭이 있으므로 PID 기준으로 한 번씩만 합산
+        renderer_pids = {view.page().renderProcessPid() for _idx, view in self._actual_tab_views()}
+        renderer_rss = [process_rss_bytes(pid) for pid in renderer_pids if pid]
+        return {
+            "pid": os.getpid(),
+            "rss_bytes": process_rss_bytes(os.getpid()),
+            "renderer_count": len([pid for pid in renderer_pids if pid]),
+            "renderer_rss_bytes": sum(v for v in renderer_rss if v) if any(renderer_rss) else None,
+        }
+
+    def _metrics_stores(self):
+        def file_bytes(path):
+            return os.path.getsize(path) if os.path.exists(path) else 0
+
+        return {
+            "history": {"items": len(self.history), "file_bytes": file_bytes(HISTORY_FILE)},
+            "bookmarks": {"items": len(self.bookmarks), "file_bytes": file_bytes(BOOKMARK_FILE)},
+            "session": {"items": len(self.recent_closed), "file_bytes": file_bytes(SESSION_FILE)},
+            "thumbnails": {"items": len(self.thumbnails), "file_bytes": self.thumbnails.total_bytes},
+            "archive": {"items": len(self.archive_store.entries), "file_bytes": self.archive_store.total_bytes()},
+            "cookies": {"items": self.site_data.cookie_count(), "file_bytes": file_bytes(os.path.join(self.storage_path, "Cookies"))},
+            "content_index": {
+                "items": self.content_indexer.last_stats["documents"] if self.content_indexer else 0,
+                "file_bytes": self.content_indexer.last_stats["disk_bytes"] if self.content_indexer else 0,
+            },
+        }
+
+    # ---------------- Page performance monitor ----------------
+    def _apply_perf_monitor(self):
+        scripts = self.profile.scripts()
+        enabled = bool(self.settings.get("perf_monitor", False))
+        if enabled and not self.perf_monitor_script:
+            self.perf_monitor_script = build_perf_monitor_script()
+            if self.perf_monitor_script:
+                scripts.insert(self.perf_monitor_script)
+                for _idx, view in self._actual_tab_views():
+                    self._attach_perf_bridge(view)
+            else:
+                self.status_label.setText("qwebchannel.js 를 불러오지 못해 성능 모니터를 사용할 수 없습니다.")
+        elif not enabled and self.perf_monitor_script:
+            for script in scripts.find(PERF_MONITOR_SCRIPT_NAME):
+                scripts.remove(script)
+            self.perf_monitor_script = None
+
+    def _attach_perf_bridge(self, view):
+        if view.perf_bridge:
+            return
+        view.perf_bridge = PerfBridge(view)
+        channel = QWebChannel(view.page())
+        channel.registerObject("kyoPerf", view.perf_bridge)
+        view.page().setWebChannel(channel, QWebEngineScript.ApplicationWorld)
+
+    def show_tab_perf(self):
+        TabPerfDialog(self, self).show()
+
+    # ---------------- Page content index ----------------
+    def _apply_content_indexing(self):
+        enabled = bool(self.settings.get("index_page_content", False))
+        if enabled and not self.content_indexer:
+            self.content_indexer = ContentIndexer(CONTENT_INDEX_DIR, CONTENT_INDEX_MAX_BYTES, self)
+            self.content_indexer.failed.connect(lambda message: self.status_label.setText(f"본문 색인 오류: {message}"))
+        elif not enabled and self.content_indexer:
+            self.content_indexer.close()
+            self.content_indexer = None
+        if self.content_indexer:
+            self.content_indexer.expire(self.settings["history_retention_days"])
+
+    def _index_page_content(self, view):
+        if not self.content_indexer:
+            return
+        url = view.url()
+        if url.scheme() not in ("http", "https"):
+            return
+        url_text, title = url.toString(), view.title()
+        indexer = self.content_indexer
+        view.page().toPlainText(lambda text: indexer.submit(url_text, title, text))
+
+    # ---------------- Thumbnails ----------------
+    def _thumbnail_interval_ms(self):
+        # 캡처 비용이 예산을 넘으면 그만큼 간격을 늘려 GUI 스레드 부담을 제한
+        ratio = self._thumbnail_cost_ema_ms / THUMBNAIL_CAPTURE_BUDGET_MS
+        return THUMBNAIL_MIN_INTERVAL_MS * max(1.0, ratio)
+
+    def _capture_thumbnail(self, view, force=False):
+        if not self.tab_registry.contains(view) or not view.isVisible():
+            return
+        url = view.url().toString()
+        if not url or url == "about:blank" or is_internal_url(url):
+            return
+        now = time.monotonic()
+        if not force and (now - view.thumbnail_captured_at) * 1000 < self._thumbnail_interval_ms():
+            return
+
+        started = time.perf_counter()
+        pixmap = view.grab()
+        if pixmap.isNull():
+            return
+        image = pixmap.scaled(
+            THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT, Qt.KeepAspectRatioByExpanding, Qt.SmoothTransformation
+        ).copy(0, 0, THUMBNAIL_WIDTH, THUMBNAIL_HEIGHT).toImage()
+        cost_ms = (time.perf_counter() - started) * 1000
+        METRICS.observe("thumbnail.capture", cost_ms)
+        self._thumbnail_cost_ema_ms = cost_ms if not self._thumbnail_cost_ema_ms else (
+            self._thumbnail_cost_ema_ms * 0.8 + cost_ms * 0.2
+        )
+        view.thumbnail_captured_at = now
+        self.thumbnails.store(url, image)
+
+    def _show_tab_preview(self, index, pos):
+        view = self.tabs.widget(index)
+        if not isinstance(view, QWebEngineView):
+            self.tab_preview.hide()
+            return
+        url = view.url().toString()
+        title = view.title() or url or "New Tab"
+        details = view.perf_bridge.summary() if view.perf_bridge else ""
+        self.tab_preview.show_preview(pos, title, self.thumbnails.path_for(url) if url else None, details)
+
+    def show_tab_overview(self):
+        view = self.current_view()
+        if view:
+            self._capture_thumbnail(view, force=True)
+        TabOverviewDialog(self, self).exec()
+
     def _record_history(self, url, title):
-        if not url or url == "about:blank":
+        if not url or url == "about:blank" or is_internal_url(url):
             return
         self.history.insert(0, {
             "url": url,
@@ -1334,8 +5991,12 @@ class Browser(QMainWindow):
             self._save_history()
 
     def clear_history(self):
+        if self._defer_until_stores_ready(self.clear_history):
+            return
         self.history = []
         self._save_history()
+        if self.content_indexer:
+            self.content_indexer.clear()
         if hasattr(self.profile, "clearAllVisitedLinks"):
             self.profile.clearAllVisitedLinks()
         if self.history_dialog and self.history_dialog.isVisible():
@@ -1352,7 +6013,7 @@ class Browser(QMainWindow):
 
         view = self.tabs.widget(index)
         if not self._closing_app and isinstance(view, QWebEngineView):
-            self._push_recent_closed_tab(view.url().toString(), view.title())
+            self._push_recent_closed_tab(self._tab_state(view))
 
         # 닫은 뒤 선택될 대상 인덱스 미리 계산
         # - 기본: 방금 닫은 탭의 왼쪽(index-1)을 우선
@@ -1363,6 +6024,9 @@ class Browser(QMainWindow):
         self._ignore_plus_click = True
         try:
             self.tabs.removeTab(index)
+            if isinstance(view, QWebEngineView):
+                # 탭에서 뗀 뷰는 부모가 남아 렌더러와 함께 살아 있으므로 직접 정리
+                view.deleteLater()
             self._ensure_plus_tab()
 
             new_count = self.tabs.count()
@@ -1387,6 +6051,7 @@ class Browser(QMainWindow):
             self._update_zoom_label()
 
         finally:
+            TRACE.counter("tabs", "tabs", open=len(self.tab_registry.views()))
             # 이벤트 루프 한 사이클 뒤 플래그 해제 (currentChanged 처리 이후)
             QTimer.singleShot(0, lambda: setattr(self, "_ignore_plus_click", False))
 
@@ -1405,11 +6070,28 @@ class Browser(QMainWindow):
             url = "http://" + text
         else:
             url = f"https://www.google.com/search?q={quote_plus(text)}"
+        choice, self._omnibox_choice = self._omnibox_choice, None
+        self.omnibox.popup().hide()
+        outcome = self.hover_prefetcher.note_click(url) if choice == url else None
         v = self.current_view()
         if v:
+            v.prefetch_outcome = outcome
             v.setUrl(QUrl(url))
         else:
-            self.create_new_tab(url)
+            self.create_new_tab(url).prefetch_outcome = outcome
+
+    def _on_omnibox_activated(self, index):
+        url = index.data(Qt.UserRole)
+        if not url:
+            return
+        self.location_bar.setText(url)
+        # Enter 로 고르면 곧이어 returnPressed 가 오고, 클릭으로 고르면 오지 않으므로 한 번만 로드되게 미룸
+        self._omnibox_choice = url
+        QTimer.singleShot(0, self._load_omnibox_choice)
+
+    def _load_omnibox_choice(self):
+        if self._omnibox_choice:
+            self.load_from_location()
 
     def _looks_like_url(self, text: str) -> bool:
         if any(ch.isspace() for ch in text):
@@ -1419,16 +6101,21 @@ class Browser(QMainWindow):
         has_port = bool(sep and host and port.isdigit())
         return lowered == "localhost" or lowered.startswith("localhost:") or has_port or "." in text or "/" in text
 
+    def _location_text(self, qurl):
+        # 새 탭 페이지에서는 주소창을 비워 바로 입력할 수 있게 함
+        text = qurl.toString()
+        return "" if text == NEW_TAB_URL else text
+
     def _update_urlbar(self, qurl, view):
         if view == self.current_view():
-            self.location_bar.setText(qurl.toString())
+            self.location_bar.setText(self._location_text(qurl))
             self.location_bar.setCursorPosition(0)
             self._update_star()
 
     def _update_urlbar_from_tab(self, index):
         view = self.tabs.widget(index)
         if isinstance(view, QWebEngineView):
-            self.location_bar.setText(view.url().toString())
+            self.location_bar.setText(self._location_text(view.url()))
             self._update_star()
 
     # ---------------- Theme / zoom / settings ----------------
@@ -1439,6 +6126,7 @@ class Browser(QMainWindow):
         color = app.palette().color(QPalette.Window)
         return color.lightness() < 128
 
+    @traced("theme.apply", "ui", theme=lambda self: self.settings.get("theme", "system"))
     def apply_theme(self):
         theme = self.settings.get("theme", "system")
         use_dark = theme == "dark" or (theme == "system" and self._system_prefers_dark())
@@ -1477,6 +6165,101 @@ class Browser(QMainWindow):
         self.history_dialog = HistoryDialog(self, self)
         self.history_dialog.show()
 
+    # ---------------- User data backup ----------------
+    def backup_user_data(self):
+        if self._defer_until_stores_ready(self.backup_user_data):
+            return
+        dialog = BackupKindsDialog(self, "사용자 데이터 내보내기")
+        if dialog.exec() != QDialog.Accepted or not dialog.kinds():
+            return
+        default_path = os.path.join(os.path.expanduser("~"), f"kyobrowser-{datetime.now():%Y%m%d}.ndjson.gz")
+        path, selected = QFileDialog.getSaveFileName(self, "사용자 데이터 내보내기", default_path, BACKUP_FILE_FILTER)
+        if not path:
+            return
+        if not path.lower().endswith((".gz", ".zst", ".zstd")):
+            path += ".ndjson.zst" if selected.startswith("zstd") else ".ndjson.gz"
+        # 목록만 복사하고 직렬화/압축은 백그라운드에서
+        snapshot = {
+            "settings": [dict(self.settings)],
+            "bookmarks": list(self.bookmarks),
+            "history": list(self.history),
+            "session": [{
+                "tabs": self._session_tabs(),
+                "current_index": self._current_actual_index(),
+                "recent_closed": self.recent_closed.to_list(),
+                "saved_at": now_iso(),
+            }],
+        }
+        self._start_backup_task(export_user_data, self._on_user_data_exported, path, {kind: snapshot[kind] for kind in dialog.kinds()})
+        self.status_label.setText("사용자 데이터를 내보내는 중…")
+
+    def restore_user_data(self):
+        if self._defer_until_stores_ready(self.restore_user_data):
+            return
+        path, _ = QFileDialog.getOpenFileName(self, "사용자 데이터 가져오기", os.path.expanduser("~"), BACKUP_FILE_FILTER)
+        if not path:
+            return
+        dialog = BackupKindsDialog(self, "가져올 항목")
+        if dialog.exec() != QDialog.Accepted or not dialog.kinds():
+            return
+        history_keys = {(item.get("url"), item.get("visited_at")) for item in self.history}
+        bookmark_keys = {canonical_url(bm.get("url", "")) for bm in self.bookmarks}
+        self._start_backup_task(read_user_data, self._on_user_data_read, path, set(dialog.kinds()), history_keys, bookmark_keys)
+        self.status_label.setText("백업 파일을 검증하는 중…")
+
+    def _start_backup_task(self, fn, on_finished, *args):
+        task = BackgroundTask(fn, *args)
+        task.signals.finished.connect(on_finished)
+        task.signals.failed.connect(self._on_backup_task_failed)
+        self._backup_tasks.add(task)
+        QThreadPool.globalInstance().start(task)
+
+    def _forget_backup_task(self):
+        self._backup_tasks = {t for t in self._backup_tasks if t.signals is not self.sender()}
+
+    def _on_user_data_exported(self, result):
+        self._forget_backup_task()
+        counts = ", ".join(f"{BACKUP_KIND_LABELS[kind]} {n:,}" for kind, n in result["counts"].items())
+        self.status_label.setText(f"내보냈습니다 ({counts}, {result['bytes'] / 1024:,.0f} KB): {result['path']}")
+
+    def _on_user_data_read(self, result):
+        self._forget_backup_task()
+        if result["settings"]:
+            # 알려진 키만 받아들이고 범위 보정은 설정 파일을 읽을 때와 같은 경로로
+            values = {key: value for key, value in result["settings"].items() if key in DEFAULT_SETTINGS}
+            save_json_file(SETTINGS_FILE, {**self.settings, **values})
+            self.settings = self._load_settings()
+            self.apply_settings({})
+        if result["bookmarks"]:
+            self.bookmarks.extend(result["bookmarks"])
+            self._save_bookmarks()
+            self.bookmark_manager.refresh()
+            self._update_star()
+        if result["history"]:
+            self.history = merge_history_items(self.history, result["history"])
+            self._prune_history(save=False)
+            self._save_history()
+            if self.history_dialog and self.history_dialog.isVisible():
+                self.history_dialog.refresh()
+        opened = 0
+        if result["session"]:
+            # 지금 열린 탭은 그대로 두고 백업의 탭을 뒤에 추가
+            for tab in result["session"].get("tabs", []):
+                if isinstance(tab, dict) and isinstance(tab.get("url"), str) and tab["url"]:
+                    self.create_new_tab(tab["url"], tab)
+                    opened += 1
+        message = (
+            f"즐겨찾기 {len(result['bookmarks']):,}개, 방문 기록 {len(result['history']):,}건, 탭 {opened:,}개를 가져왔습니다"
+            f"{' (환경설정 포함)' if result['settings'] else ''}. 중복 {result['duplicates']:,}건은 건너뛰었습니다."
+        )
+        self.status_label.setText(message)
+        QMessageBox.information(self, "사용자 데이터 가져오기", message)
+
+    def _on_backup_task_failed(self, message):
+        self._forget_backup_task()
+        self.status_label.setText("사용자 데이터 내보내기/가져오기 실패")
+        QMessageBox.warning(self, "사용자 데이터", f"백업 파일을 처리하지 못했습니다. 아무것도 바뀌지 않았습니다.\n{message}")
+
     def show_settings(self):
         dialog = SettingsDialog(self, self)
         if dialog.exec() == QDialog.Accepted:
@@ -1487,12 +6270,87 @@ class Browser(QMainWindow):
         self.settings["home_url"] = self._normalize_home_url(self.settings.get("home_url", HOME_URL))
         self.settings["default_zoom"] = clamp(int(self.settings["default_zoom"]), MIN_ZOOM, MAX_ZOOM)
         self.settings["history_retention_days"] = max(1, int(self.settings["history_retention_days"]))
+        self.settings["recent_closed_kb"] = clamp(int(self.settings["recent_closed_kb"]), 16, MAX_RECENT_CLOSED_KB)
+        self.settings["archive_max_mb"] = clamp(int(self.settings["archive_max_mb"]), 16, MAX_ARCHIVE_MB)
+        self.settings["archive_refresh_days"] = clamp(int(self.settings["archive_refresh_days"]), 0, 3650)
+        if self.settings.get("hover_prefetch") not in HOVER_PREFETCH_MODES:
+            self.settings["hover_prefetch"] = "preconnect"
         self._save_settings()
         self._refresh_bookmarks_toolbar()
         self.apply_theme()
+        self._apply_vertical_tabs()
+        self._apply_perf_monitor()
+        self._apply_content_indexing()
+        self._apply_http_cache()
+        self._apply_archive_settings()
+        self.hover_prefetcher.set_mode(self.settings["hover_prefetch"])
+        self.recent_closed.set_max_bytes(self.settings["recent_closed_kb"] * 1024)
         self._prune_history(save=True)
+        self.nav_timing.retention_days = self.settings["history_retention_days"]
+        self.nav_timing.prune()
+        self.nav_timing.flush()
         self.reset_zoom()
 
+    def _apply_vertical_tabs(self):
+        enabled = bool(self.settings.get("vertical_tabs", False))
+        if enabled and not self.tab_sidebar:
+            self.tab_sidebar = VerticalTabSidebar(self, self)
+            self.addDockWidget(Qt.LeftDockWidgetArea, self.tab_sidebar)
+            self.tab_sidebar.select_view(self.current_view())
+        if self.tab_sidebar:
+            self.tab_sidebar.setVisible(enabled)
+        self.tabs.tabBar().setVisible(not enabled)
+
+    def _apply_http_cache(self):
+        self.profile.setHttpCacheType(HTTP_CACHE_TYPES[self.settings.get("http_cache_type", "disk")])
+        # 0 이면 Chromium 이 디스크 여유 공간에 맞춰 자동으로 정함
+        max_bytes = int(self.settings.get("http_cache_max_mb", 0)) * 1024 * 1024
+        if self._cache_trim:
+            # 줄이는 중에는 목표 크기를 유지 (끝나면 설정값으로 되돌림)
+            max_bytes = self._cache_trim["target"]
+        self.profile.setHttpCacheMaximumSize(max_bytes)
+
+    def trim_http_cache(self, target_mb):
+        # Chromium 캐시는 최대 크기를 넘으면 가장 오래 쓰지 않은 항목부터 스스로 정리하므로
+        # 파일을 직접 지우는 대신 상한을 잠시 목표 크기로 낮췄다가, 그 아래로 줄면 설정한 상한으로 되돌린다
+        target = clamp(int(target_mb), 1, MAX_HTTP_CACHE_MB) * 1024 * 1024
+        if not self._cache_trim:
+            timer = QTimer(self)
+            timer.setInterval(CACHE_TRIM_POLL_MS)
+            timer.timeout.connect(self._check_cache_trim)
+            self._cache_trim = {"timer": timer, "task": None}
+        self._cache_trim.update(target=target, deadline=time.monotonic() + CACHE_TRIM_MAX_S)
+        self._apply_http_cache()
+        self._cache_trim["timer"].start()
+        self.status_label.setText(f"캐시를 {target_mb} MB로 줄이는 중… 오래 쓰지 않은 항목부터 정리됩니다.")
+
+    def _check_cache_trim(self):
+        if not self._cache_trim or self._cache_trim["task"] is not None:
+            return
+        task = BackgroundTask(directory_size, self.profile.cachePath())
+        task.signals.finished.connect(self._on_cache_trim_size)
+        task.signals.failed.connect(lambda _message: self._finish_cache_trim(None))
+        self._cache_trim["task"] = task
+        QThreadPool.globalInstance().start(task)
+
+    def _on_cache_trim_size(self, size):
+        if not self._cache_trim:
+            return
+        self._cache_trim["task"] = None
+        # Chromium 은 새 항목을 쓸 때 정리하므로 바로 줄지 않을 수 있음. 제한 시간이 지나면 그대로 되돌림
+        if size <= self._cache_trim["target"] or time.monotonic() >= self._cache_trim["deadline"]:
+            self._finish_cache_trim(size)
+
+    def _finish_cache_trim(self, size):
+        self._cache_trim["timer"].stop()
+        self._cache_trim["timer"].deleteLater()
+        self._cache_trim = None
+        self._apply_http_cache()
+        limit_mb = int(self.settings.get("http_cache_max_mb", 0))
+        limit = f"{limit_mb} MB" if limit_mb else "자동"
+        current = f"{size / 1048576:,.0f} MB" if size is not None else "알 수 없음"
+        self.status_label.setText(f"캐시 정리를 마쳤습니다 (현재 {current}). 최대 크기는 설정값({limit})으로 되돌렸습니다.")
+
     def clear_cache(self):
         self.profile.clearHttpCache()
         self._cleanup_shared_dictionary_store(self.storage_path)
@@ -1501,11 +6359,41 @@ class Browser(QMainWindow):
 
     def clear_cookies(self):
         self.profile.cookieStore().deleteAllCookies()
+        self.site_data.clear()
         self.status_label.setText("쿠키를 삭제했습니다.")
         QMessageBox.information(self, "쿠키 삭제", "쿠키를 삭제했습니다.")
 
+    def show_site_data(self):
+        SiteDataDialog(self, self).show()
+
+    def clear_site_data(self, sites, include_storage):
+        # 선택한 도메인의 쿠키와 (선택 시) 그 도메인 origin 들의 저장소만 지우고 나머지는 그대로
+        removed = sum(self.site_data.delete_site(site) for site in sites)
+        origins = self._origins_for_sites(sites) if include_storage else []
+        if origins:
+            self.storage_cleaner.enqueue(origins)
+        METRICS.incr("site_data.cleared_sites", len(sites))
+        message = f"사이트 {len(sites)}곳의 쿠키 {removed:,}개를 삭제했습니다"
+        if origins:
+            message += f", 저장소 {len(origins)}개 origin 정리 중"
+        self.status_label.setText(message + ".")
+
+    def _origins_for_sites(self, sites):
+        # 쿠키 도메인과 그 하위 호스트 중 방문 기록에 있는 origin (+ https://도메인)
+        sites = set(sites)
+        origins = {f"https://{site}" for site in sites}
+        for item in self.history:
+            origin = url_origin(item.get("url", ""))
+            if not origin:
+                continue
+            host = urlsplit(origin).hostname or ""
+            parts = host.split(".")
+            if any(".".join(parts[i:]) in sites for i in range(len(parts))):
+                origins.add(origin)
+        return sorted(origins)
+
     def clear_saved_session(self):
-        self.recent_closed_tabs = []
+        self.recent_closed.clear()
         self._skip_next_session_save = True
         try:
             if os.path.exists(SESSION_FILE):
@@ -1561,8 +6449,33 @@ class Browser(QMainWindow):
         if view:
             view.findText("")  # 하이라이트 초기화
         self.find_bar.clear()
+        self.find_count_label.clear()
         self.find_tb.hide()
 
+    def _on_find_result(self, view, result):
+        if view != self.current_view() or not hasattr(self, "find_count_label"):
+            return
+        if not self.find_bar.text().strip():
+            self.find_count_label.clear()
+        elif result.numberOfMatches():
+            self.find_count_label.setText(f"{result.activeMatch()}/{result.numberOfMatches()}")
+        else:
+            self.find_count_label.setText("0/0")
+
+    def show_cross_tab_find(self):
+        dialog = CrossTabFindDialog(self, self.find_bar.text().strip(), self.chk_case.isChecked(), self)
+        dialog.show()
+
+    def find_in_tab(self, view, text, case_sensitive):
+        index = self.tab_registry.index_of(view)
+        if index == -1:
+            return
+        self.tabs.setCurrentIndex(index)
+        self.show_find_bar()
+        self.find_bar.setText(text)
+        self.chk_case.setChecked(case_sensitive)
+        self._find_next()
+
     def eventFilter(self, source, event):
         if source == self.find_bar and event.type() == QEvent.KeyPress and event.key() == Qt.Key_Escape:
             self._close_find()
@@ -1608,7 +6521,7 @@ class Browser(QMainWindow):
 
     def toggle_bookmark_current(self):
         view = self.current_view()
-        if not view:
+        if not view or not self.bookmarks_ready.is_ready():
             return
         url = view.url().toString()
         if self._is_bookmarked(url):
@@ -1622,21 +6535,751 @@ class Browser(QMainWindow):
     def show_shortcuts(self):
         ShortcutsDialog(self).exec()
 
+    def open_external_urls(self, urls):
+        # 다른 실행(링크 핸들러 등)에서 넘어온 URL 을 새 탭으로 열고 창을 앞으로 가져옴
+        for url in urls or [self.get_home_url()]:
+            self.create_new_tab(url)
+        if self.isMinimized():
+            self.showNormal()
+        self.raise_()
+        self.activateWindow()
+
     def closeEvent(self, event):
         self._closing_app = True
         self._save_session()
+        self.thumbnails.flush()
+        self.nav_timing.flush()
+        self.crash_stats.flush()
+        if self.content_indexer:
+            self.content_indexer.close()
         super().closeEvent(event)
 
+# ------------------------------------------------------
+# 🔁 단일 인스턴스 (QLocalServer / QLocalSocket)
+# ------------------------------------------------------
+def single_instance_name():
+    # 같은 사용자 데이터 폴더를 쓰는 실행끼리만 하나로 묶음
+    key = f"{os.environ.get('USERNAME') or os.environ.get('USER') or ''}|{os.path.abspath(USER_DATA_DIR)}"
+    return "KyoBrowser-" + hashlib.sha1(key.encode("utf-8")).hexdigest()[:12]
+
+def url_from_argument(text):
+    return QUrl.fromUserInput(text, os.getcwd(), QUrl.UserInputResolutionOption.AssumeLocalFile).toString()
+
+def send_to_running_instance(urls, timeout_ms=500):
+    socket = QLocalSocket()
+    socket.connectToServer(single_instance_name())
+    if not socket.waitForConnected(timeout_ms):
+        return False
+    socket.write((json.dumps({"urls": urls}) + "\n").encode("utf-8"))
+    socket.flush()
+    socket.waitForBytesWritten(timeout_ms)
+    # 상대가 받았다는 응답까지 확인해야 요청이 유실되지 않음
+    acknowledged = socket.waitForReadyRead(timeout_ms) and bytes(socket.readAll()).startswith(b"ok")
+    socket.disconnectFromServer()
+    return acknowledged
+
+def probe_instance_socket(timeout_ms=200):
+    # "running": 다른 인스턴스가 연결을 받음, "stale": 소켓 파일만 남아 연결 거부, "unknown": 그 밖(없음/시간 초과 등)
+    socket = QLocalSocket()
+    socket.connectToServer(single_instance_name())
+    if socket.waitForConnected(timeout_ms):
+        socket.disconnectFromServer()
+        return "running"
+    if socket.error() == QLocalSocket.LocalSocketError.ConnectionRefusedError:
+        return "stale"
+    return "unknown"
+
+class SingleInstanceServer(QObject):
+    urlsReceived = Signal(list)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.server = QLocalServer(self)
+        self.server.newConnection.connect(self._on_new_connection)
+        self.peer_state = None
+
+    def listen(self):
+        name = single_instance_name()
+        if self.server.listen(name):
+            return True
+        # 비정상 종료로 남은 소켓 파일(유닉스)일 때만 지우고 다시 시도.
+        # 동시에 시작했거나 응답이 늦은 인스턴스의 소켓을 지우면 두 프로세스가 같은 파일에 쓰게 됨
+        self.peer_state = probe_instance_socket()
+        if self.peer_state != "stale":
+            return False
+        QLocalServer.removeServer(name)
+        return self.server.listen(name)
+
+    def _on_new_connection(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            socket.setProperty("buffer", b"")
+            socket.readyRead.connect(lambda s=socket: self._on_ready_read(s))
+            socket.disconnected.connect(socket.deleteLater)
+
+    def _on_ready_read(self, socket):
+        buffer = (socket.property("buffer") or b"") + bytes(socket.readAll())
+        if b"\n" not in buffer:
+            socket.setProperty("buffer", buffer)
+            return
+        line = buffer.split(b"\n", 1)[0]
+        try:
+            urls = [str(u) for u in json.loads(line.decode("utf-8")).get("urls", [])]
+        except (ValueError, AttributeError):
+            socket.disconnectFromServer()
+            return
+        socket.write(b"ok\n")
+        socket.flush()
+        self.urlsReceived.emit(urls)
+
+# ------------------------------------------------------
+# ⏱️ 벤치마크 (오프스크린, 로컬 HTTP 서버)
+# ------------------------------------------------------
+def summarize_timings(values):
+    if not values:
+        return {"count": 0}
+    return {
+        "count": len(values),
+        "mean": round(sum(values) / len(values), 3),
+        "p50": round(percentile(values, 50), 3),
+        "p90": round(percentile(values, 90), 3),
+        "p99": round(percentile(values, 99), 3),
+        "max": round(max(values), 3),
+    }
+
+def wait_for_signal(signal, timeout_ms):
+    loop = QEventLoop()
+    timer = QTimer()
+    timer.setSingleShot(True)
+    timer.timeout.connect(loop.quit)
+    received = []
+
+    def on_signal(*args):
+        received.append(args)
+        loop.quit()
+
+    signal.connect(on_signal)
+    timer.start(timeout_ms)
+    loop.exec()
+    timer.stop()
+    signal.disconnect(on_signal)
+    return received[0] if received else None
+
+def synthetic_page(index):
+    # 페이지마다 크기와 구조를 달리해 텍스트/레이아웃/서브리소스 비용이 섞이도록 함
+    paragraphs = 20 + (index % 7) * 40
+    body = "".join(
+        f"<p id='p{i}'>가나다라마바사 Kyo benchmark paragraph {i} "
+        f"{'lorem ipsum dolor sit amet ' * (1 + i % 5)}</p>"
+        for i in range(paragraphs)
+    )
+    images = "".join(f"<img src='/img/{index}-{i}.svg' width='64' height='64'>" for i in range(index % 4 * 3))
+    return (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'>"
+        f"<title>Bench page {index}</title><link rel='stylesheet' href='/style.css'></head>"
+        f"<body><h1>Bench page {index}</h1>{images}{body}</body></html>"
+    ).encode("utf-8")
+
+class _BenchRequestHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        path = self.path.split("?", 1)[0]
+        if path.startswith("/page/"):
+            body, mime = synthetic_page(to_int(path.rsplit("/", 1)[-1], 0)), "text/html; charset=utf-8"
+        elif path == "/style.css":
+            body, mime = b"body{font:14px sans-serif;max-width:960px;margin:auto}p{line-height:1.5}", "text/css"
+        elif path.startswith("/img/"):
+            body = b"<svg xmlns='http://www.w3.org/2000/svg' width='64' height='64'><rect width='64' height='64' fill='#4f7cff'/></svg>"
+            mime = "image/svg+xml"
+        elif path == "/blank":
+            body, mime = b"<!DOCTYPE html><title>blank</title>", "text/html"
+        else:
+            self.send_error(404)
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", mime)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *_args):
+        pass
+
+def start_benchmark_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _BenchRequestHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def _sample_total_rss(browser):
+    pids = {os.getpid()} | {view.page().renderProcessPid() for _idx, view in browser._actual_tab_views()}
+    return sum(process_rss_bytes(pid) or 0 for pid in pids if pid)
+
+def _start_benchmark_browser(qt_args, home_url, seed_history=0, timeout_s=30):
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    data_dir = tempfile.mkdtemp(prefix="kyobench-")
+    use_user_data_dir(data_dir)
+    # 첫 탭도 로컬 주소를 보도록 해 외부 네트워크를 전혀 쓰지 않음
+    save_json_file(SETTINGS_FILE, dict(DEFAULT_SETTINGS, home_url=home_url))
+    if seed_history:
+        # 실제 사용자처럼 큰 방문 기록이 있을 때 창이 뜨는 시간을 재기 위함
+        save_json_file(HISTORY_FILE, bench_history_dataset(seed_history))
+
+    configure_chromium_flags()
+    register_kyo_scheme()
+    app = QApplication([sys.argv[0]] + qt_args)
+    started = time.perf_counter()
+    browser = Browser()
+    browser.show()
+    app.processEvents()
+    time_to_window_ms = (time.perf_counter() - started) * 1000
+    # 방문 기록/즐겨찾기는 창을 띄운 뒤 읽으므로 측정 전에 준비될 때까지 기다림
+    deadline = time.perf_counter() + timeout_s
+    while not (browser.history_ready.is_done() and browser.bookmarks_ready.is_done()) and time.perf_counter() < deadline:
+        app.processEvents(QEventLoop.AllEvents, 20)
+    stores_ready_ms = (time.perf_counter() - started) * 1000
+    return app, browser, data_dir, time_to_window_ms, stores_ready_ms
+
+def run_pageload_benchmark(args, qt_args):
+    server = start_benchmark_server()
+    base = f"http://127.0.0.1:{server.server_address[1]}"
+    app, browser, data_dir, time_to_window_ms, stores_ready_ms = _start_benchmark_browser(
+        qt_args, base + "/blank", args.bench_seed_history, args.bench_timeout
+    )
+    first = browser.current_view()
+    if first:
+        wait_for_signal(first.loadFinished, args.bench_timeout * 1000)
+
+    create_ms, load_ms, close_ms = [], [], []
+    failures = 0
+    peak_rss = _sample_total_rss(browser)
+    for cycle in range(args.bench_warmup + args.bench_cycles):
+        url = f"{base}/page/{cycle % args.bench_pages}"
+        t0 = time.perf_counter()
+        view = browser.create_new_tab(url)
+        t1 = time.perf_counter()
+        result = wait_for_signal(view.loadFinished, args.bench_timeout * 1000)
+        t2 = time.perf_counter()
+        peak_rss = max(peak_rss, _sample_total_rss(browser))
+        browser.close_tab(browser.tab_registry.index_of(view))
+        app.processEvents()
+        t3 = time.perf_counter()
+        if cycle < args.bench_warmup:
+            continue
+        if not result or not result[0]:
+            failures += 1
+            continue
+        create_ms.append((t1 - t0) * 1000)
+        load_ms.append((t2 - t0) * 1000)
+        close_ms.append((t3 - t2) * 1000)
+
+    report = {
+        "benchmark": "pageload",
+        "timestamp": now_iso(),
+        "app_version": APP_VERSION,
+        "python": sys.version.split()[0],
+        "cycles": args.bench_cycles,
+        "warmup": args.bench_warmup,
+        "pages": args.bench_pages,
+        "failures": failures,
+        "seed_history": args.bench_seed_history,
+        "time_to_window_ms": round(time_to_window_ms, 3),
+        "stores_ready_ms": round(stores_ready_ms, 3),
+        "tab_create_ms": summarize_timings(create_ms),
+        "load_finished_ms": summarize_timings(load_ms),
+        "tab_close_ms": summarize_timings(close_ms),
+        "peak_rss_bytes": peak_rss,
+    }
+
+    browser.close()
+    server.shutdown()
+    app.processEvents()
+    shutil.rmtree(data_dir, ignore_errors=True)
+    return report
+
+# 저장/조회 계층 마이크로벤치마크용 합성 데이터
+_BENCH_HANGUL_WORDS = [
+    "뉴스", "날씨", "검색", "쇼핑", "메일", "지도", "블로그", "카페", "사전", "번역",
+    "주식", "증권", "예약", "공지사항", "게시판", "회의록", "보고서", "일정", "결재", "인사",
+]
+_BENCH_HOSTS = [f"site{i}.example.com" for i in range(300)] + ["intranet.kyo.local", "www.naver.com", "www.daum.net"]
+
+def bench_history_dataset(size, seed=7):
+    rng = random.Random(seed)
+    now = datetime.now()
+    items = []
+    for i in range(size):
+        host = rng.choice(_BENCH_HOSTS)
+        title = " ".join(rng.choice(_BENCH_HANGUL_WORDS) for _ in range(rng.randint(2, 6)))
+        # 보관 기간(90일)을 넘는 항목이 일부 섞이도록 120일에 걸쳐 분포
+        visited = now - timedelta(seconds=int(i * 120 * 86400 / max(1, size)) + rng.randint(0, 60))
+        items.append({
+            "url": f"https://{host}/articles/{rng.randint(1, 10 ** 6)}?ref=kyo",
+            "title": f"{title} - {host}",
+            "visited_at": visited.isoformat(timespec="seconds"),
+        })
+    return items
+
+def bench_bookmark_dataset(size, seed=11):
+    rng = random.Random(seed)
+    return [
+        {
+            "title": " ".join(rng.choice(_BENCH_HANGUL_WORDS) for _ in range(rng.randint(1, 4))),
+            "url": f"https://{rng.choice(_BENCH_HOSTS)}/bookmark/{i}",
+        }
+        for i in range(size)
+    ]
+
+def time_operation(fn, setup=None, min_rounds=3, max_rounds=500, budget_s=1.5):
+    timings = []
+    deadline = time.perf_counter() + budget_s
+    while len(timings) < max_rounds and (len(timings) < min_rounds or time.perf_counter() < deadline):
+        if setup:
+            setup()
+        started = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - started) * 1000)
+    return timings
+
+def peak_memory_bytes(fn, setup=None):
+    if setup:
+        setup()
+    tracemalloc.start()
+    try:
+        fn()
+        _current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return peak
+
+def run_storage_benchmark(args, qt_args):
+    app, browser, data_dir, _time_to_window_ms, _stores_ready_ms = _start_benchmark_browser(qt_args, NEW_TAB_URL)
+    results = {}
+
+    def measure(group, name, fn, setup=None):
+        summary = summarize_timings(time_operation(fn, setup))
+        summary["peak_memory_bytes"] = peak_memory_bytes(fn, setup)
+        results.setdefault(group, {})[name] = summary
+        print(f"{group:>16} {name:<24} p50={summary['p50']:.3f}ms p90={summary['p90']:.3f}ms")
+
+    for size in args.bench_history_sizes:
+        dataset = bench_history_dataset(size)
+        group = f"history_{size}"
+        path = os.path.join(data_dir, f"bench_history_{size}.json")
+
+        def reset_history():
+            browser.history = list(dataset)
+
+        measure(group, "save_json_file", lambda: save_json_file(path, dataset))
+        measure(group, "load_json_file", lambda: load_json_file(path, []))
+        measure(group, "record_history", lambda: browser._record_history("https://bench.kyo.local/", "벤치마크"),
+                setup=reset_history)
+        measure(group, "prune_history", lambda: browser._prune_history(save=False), setup=reset_history)
+
+    for size in args.bench_bookmark_sizes:
+        dataset = bench_bookmark_dataset(size)
+        group = f"bookmarks_{size}"
+        browser.bookmarks = dataset
+        path = os.path.join(data_dir, f"bench_bookmarks_{size}.json")
+        missing_url = "https://not-bookmarked.kyo.local/"
+        measure(group, "save_json_file", lambda: save_json_file(path, dataset))
+        measure(group, "load_json_file", lambda: load_json_file(path, []))
+        measure(group, "is_bookmarked_miss", lambda: browser._is_bookmarked(missing_url))
+        measure(group, "is_bookmarked_hit", lambda: browser._is_bookmarked(dataset[-1]["url"]))
+
+    recent = bench_history_dataset(RECENT_CLOSED_MENU_ITEMS)
+    measure("session", "push_recent_closed_tab",
+            lambda: browser._push_recent_closed_tab({"url": recent[0]["url"], "title": recent[0]["title"]}),
+            setup=lambda: setattr(browser, "recent_closed", RecentlyClosedRing(1024 * 1024, recent)))
+    measure("session", "save_session", browser._save_session)
+
+    report = {
+        "benchmark": "storage",
+        "timestamp": now_iso(),
+        "app_version": APP_VERSION,
+        "python": sys.version.split()[0],
+        "results": results,
+    }
+    browser.close()
+    app.processEvents()
+    shutil.rmtree(data_dir, ignore_errors=True)
+    return report
+
+def compare_reports(report, baseline, tolerance, prefix=""):
+    regressions = []
+    for key, value in report.items():
+        base = baseline.get(key) if isinstance(baseline, dict) else None
+        if not isinstance(value, dict) or not isinstance(base, dict):
+            continue
+        if "p50" not in value:
+            regressions += compare_reports(value, base, tolerance, f"{prefix}{key}.")
+            continue
+        for stat in ("p50", "p90"):
+            new, old = value.get(stat), base.get(stat)
+            if new is not None and old:
+                change = (new - old) / old
+                print(f"{prefix}{key}.{stat}: {old:.3f} -> {new:.3f} ({change:+.1%})")
+                if change > tolerance:
+                    regressions.append(f"{prefix}{key}.{stat}")
+    return regressions
+
+def last_benchmark_run(history_path, benchmark):
+    # 추적 파일(JSON Lines)에서 같은 종류의 직전 실행 결과를 찾음
+    previous = None
+    if history_path and os.path.exists(history_path):
+        with open(history_path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if entry.get("benchmark") == benchmark:
+                    previous = entry
+    return previous
+
+def write_benchmark_report(report, out_path, baseline_path=None, tolerance=0.10, history_path=None):
+    save_json_file(out_path, report)
+    print(json.dumps(report, ensure_ascii=False, indent=2))
+    baseline = load_json_file(baseline_path, {}) if baseline_path else last_benchmark_run(history_path, report["benchmark"])
+    if history_path:
+        with open(history_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(report, ensure_ascii=False) + "\n")
+    if not baseline:
+        return 0
+    regressions = compare_reports(report, baseline, tolerance)
+    if regressions:
+        print("성능 저하: " + ", ".join(regressions))
+        return 1
+    return 0
+
+# ------------------------------------------------------
+# 🖨️ 일괄 렌더링 (오프스크린 스크린샷 / PDF)
+# ------------------------------------------------------
+def read_render_urls(path):
+    # 한 줄에 URL 하나, 빈 줄과 # 주석은 무시 ("-" 는 표준 입력)
+    if path == "-":
+        lines = sys.stdin.read().splitlines()
+    else:
+        with open(path, "r", encoding="utf-8") as f:
+            lines = f.read().splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.strip().startswith("#")]
+
+def render_file_stem(index, url):
+    host = re.sub(r"[^A-Za-z0-9.-]+", "_", urlsplit(url).hostname or "page")[:60]
+    return f"{index:05d}-{host}-{hashlib.sha1(url.encode('utf-8')).hexdigest()[:10]}"
+
+def _size_arg(text):
+    width, _sep, height = str(text).lower().partition("x")
+    return QSize(int(width), int(height))
+
+class RenderWorker(QObject):
+    # 재사용하는 오프스크린 뷰 하나: 로드 → 안정화 대기 → PNG(grab) → PDF(printToPdf)
+    jobFinished = Signal(object)
+
+    def __init__(self, profile, options, parent=None):
+        super().__init__(parent)
+        self.profile = profile
+        self.options = options
+        self.view = None
+        self.job = None
+        self.state = "idle"
+        self.jobs_done = 0
+        self.timeout_timer = QTimer(self)
+        self.timeout_timer.setSingleShot(True)
+        self.timeout_timer.timeout.connect(self._on_timeout)
+        self.settle_timer = QTimer(self)
+        self.settle_timer.setSingleShot(True)
+        self.settle_timer.timeout.connect(self._capture)
+        self._create_view()
+
+    def _create_view(self):
+        if self.view:
+            # 멈춘 페이지가 늦게 보내는 신호가 다음 작업에 섞이지 않도록 먼저 끊음
+            old_page = self.view.page()
+            old_page.loadFinished.disconnect(self._on_load_finished)
+            old_page.pdfPrintingFinished.disconnect(self._on_pdf_finished)
+            old_page.renderProcessTerminated.disconnect(self._on_render_process_terminated)
+            self.view.deleteLater()
+        self.view = QWebEngineView()
+        page = QWebEnginePage(self.profile, self.view)
+        self.view.setPage(page)
+        self.view.resize(self.options["size"])
+        page.loadFinished.connect(self._on_load_finished)
+        page.pdfPrintingFinished.connect(self._on_pdf_finished)
+        page.renderProcessTerminated.connect(self._on_render_process_terminated)
+        self.view.show()
+
+    def start(self, index, url):
+        self.job = {"index": index, "url": url, "started": time.perf_counter(), "load_ms": None, "capture_ms": None}
+        self.state = "loading"
+        self.timeout_timer.start(self.options["timeout_s"] * 1000)
+        self.view.setUrl(QUrl(url))
+
+    def _elapsed_ms(self):
+        return round((time.perf_counter() - self.job["started"]) * 1000, 1)
+
+    def _on_load_finished(self, ok):
+        if self.state != "loading":
+            return
+        if not ok:
+            self._finish("load_failed")
+            return
+        self.job["load_ms"] = self._elapsed_ms()
+        self.state = "settling"
+        self.settle_timer.start(self.options["delay_ms"])
+
+    def _capture(self):
+        if self.state != "settling":
+            return
+        stem = os.path.join(self.options["out_dir"], render_file_stem(self.job["index"], self.job["url"]))
+        if "png" in self.options["formats"]:
+            pixmap = self.view.grab()
+            if pixmap.isNull() or not pixmap.save(stem + ".png", "PNG"):
+                self._finish("png_failed")
+                return
+            self.job["png"] = stem + ".png"
+        if "pdf" in self.options["formats"]:
+            self.state = "printing"
+            self.view.page().printToPdf(stem + ".pdf")
+            return
+        self._finish()
+
+    def _on_pdf_finished(self, path, success):
+        if self.state != "printing":
+            return
+        if not success:
+            self._finish("pdf_failed")
+            return
+        self.job["pdf"] = path
+        self._finish()
+
+    def _on_render_process_terminated(self, _status, exit_code):
+        if self.job:
+            self._finish(f"renderer_terminated:{exit_code}")
+
+    def _on_timeout(self):
+        if self.job:
+            self.view.stop()
+            self._finish(f"timeout:{self.state}")
+
+    def _finish(self, error=None):
+        self.timeout_timer.stop()
+        self.settle_timer.stop()
+        job, self.job, self.state = self.job, None, "idle"
+        total_ms = round((time.perf_counter() - job.pop("started")) * 1000, 1)
+        if job["load_ms"] is not None and not error:
+            job["capture_ms"] = round(total_ms - job["load_ms"], 1)
+        job.update(ok=error is None, error=error, total_ms=total_ms)
+        self.jobs_done += 1
+        # 렌더러 메모리가 계속 불어나지 않도록 일정 횟수마다 뷰를 새로 만듦
+        recycle = self.options["recycle"]
+        if error or (recycle and self.jobs_done % recycle == 0):
+            self._create_view()
+        self.jobFinished.emit(job)
+
+class BatchRenderer(QObject):
+    finished = Signal()
+
+    def __init__(self, profile, urls, options, parent=None):
+        super().__init__(parent)
+        self.urls = urls
+        self.next_index = 0
+        self.results = []
+        self.workers = [RenderWorker(profile, options, self) for _ in range(max(1, min(options["workers"], len(urls))))]
+        for worker in self.workers:
+            worker.jobFinished.connect(self._on_job_finished)
+
+    def start(self):
+        if not self.urls:
+            QTimer.singleShot(0, self.finished.emit)
+            return
+        for worker in self.workers:
+            self._dispatch(worker)
+
+    def _dispatch(self, worker):
+        if self.next_index >= len(self.urls):
+            return False
+        worker.start(self.next_index, self.urls[self.next_index])
+        self.next_index += 1
+        return True
+
+    def _on_job_finished(self, result):
+        self.results.append(result)
+        status = "ok" if result["ok"] else result["error"]
+        print(f"[{len(self.results)}/{len(self.urls)}] {status} {result['total_ms']}ms {result['url']}", file=sys.stderr)
+        self._dispatch(self.sender())
+        if len(self.results) == len(self.urls):
+            self.finished.emit()
+
+def run_render_batch(args, qt_args):
+    urls = [url_from_argument(url) for url in read_render_urls(args.render)]
+    out_dir = os.path.abspath(args.render_out)
+    os.makedirs(out_dir, exist_ok=True)
+    options = {
+        "out_dir": out_dir,
+        "formats": {part.strip().lower() for part in args.render_format.split(",") if part.strip()},
+        "workers": args.render_workers,
+        "timeout_s": args.render_timeout,
+        "delay_ms": args.render_delay,
+        "size": args.render_size,
+        "recycle": args.render_recycle,
+    }
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    configure_chromium_flags()
+    register_kyo_scheme()
+    app = QApplication([sys.argv[0]] + qt_args)
+    temp_profile = args.render_temp_profile
+    if not temp_profile and _instance_running():
+        # 실행 중인 브라우저와 같은 프로필 폴더를 두 프로세스가 열면 잠금 실패/프로필 손상 위험이 있음
+        print("실행 중인 Kyo Browser 가 프로필을 쓰고 있어 임시(off-the-record) 프로필로 렌더링합니다. 로그인 쿠키는 적용되지 않습니다.")
+        temp_profile = True
+    storage_path = os.path.join(USER_DATA_DIR, "browser_data")
+    os.makedirs(storage_path, exist_ok=True)
+    interceptor = MyInterceptor()
+    profile = create_browser_profile(storage_path, interceptor, off_the_record=temp_profile)
+
+    started_at = now_iso()
+    started = time.perf_counter()
+    renderer = BatchRenderer(profile, urls, options)
+    renderer.finished.connect(app.quit)
+    renderer.start()
+    app.exec()
+
+    results = sorted(renderer.results, key=lambda r: r["index"])
+    failures = [r for r in results if not r["ok"]]
+    errors = {}
+    for r in failures:
+        kind = r["error"].split(":", 1)[0]
+        errors[kind] = errors.get(kind, 0) + 1
+    manifest = {
+        "started": started_at,
+        "finished": now_iso(),
+        "app_version": APP_VERSION,
+        "source": args.render,
+        "profile": "temporary" if temp_profile else "user",
+        "out_dir": out_dir,
+        "formats": sorted(options["formats"]),
+        "workers": len(renderer.workers),
+        "timeout_s": options["timeout_s"],
+        "wall_ms": round((time.perf_counter() - started) * 1000, 1),
+        "total": len(results),
+        "succeeded": len(results) - len(failures),
+        "failed": len(failures),
+        "errors": errors,
+        "load_ms": summarize_timings([r["load_ms"] for r in results if r["load_ms"] is not None]),
+        "total_ms": summarize_timings([r["total_ms"] for r in results if r["ok"]]),
+        "results": results,
+    }
+    manifest_path = args.render_manifest or os.path.join(out_dir, "manifest.json")
+    save_json_file(manifest_path, manifest)
+    print(f"{manifest['succeeded']}/{manifest['total']} 성공, 결과 목록: {manifest_path}")
+
+    renderer.deleteLater()
+    app.processEvents()
+    return 1 if failures else 0
+
 # ------------------------------------------------------
 # 🚀 메인
 # ------------------------------------------------------
+def parse_args(argv):
+    parser = argparse.ArgumentParser(prog="kyobrowser")
+    parser.add_argument("urls", nargs="*", help="새 탭으로 열 URL 또는 파일 경로")
+    parser.add_argument("--new-instance", action="store_true", help="실행 중인 창으로 넘기지 않고 새로 실행")
+    parser.add_argument("--trace", metavar="FILE", help="시작부터 이벤트 트레이스를 기록하고 종료할 때 Trace Event JSON 으로 저장")
+    render = parser.add_argument_group("batch render")
+    render.add_argument("--render", metavar="FILE", help="URL 목록 파일(\"-\" 는 표준 입력)을 오프스크린으로 렌더링해 저장")
+    render.add_argument("--render-out", default="render_out", help="PNG/PDF 와 manifest.json 을 저장할 폴더")
+    render.add_argument("--render-format", default="png", help="png, pdf 또는 png,pdf")
+    render.add_argument("--render-workers", type=int, default=4, help="동시에 렌더링할 페이지 수")
+    render.add_argument("--render-timeout", type=int, default=30, help="URL 당 제한 시간(초, 로드+저장)")
+    render.add_argument("--render-delay", type=int, default=500, help="로드 완료 후 캡처 전 대기(ms)")
+    render.add_argument("--render-size", type=_size_arg, default=QSize(1280, 800), help="뷰 크기 (예: 1280x800)")
+    render.add_argument("--render-recycle", type=int, default=100, help="이 횟수마다 페이지를 새로 만듦 (0 은 끄기)")
+    render.add_argument("--render-manifest", help="결과 목록 JSON 경로 (기본: 출력 폴더/manifest.json)")
+    render.add_argument("--render-temp-profile", action="store_true",
+                        help="사용자 프로필 대신 임시(off-the-record) 프로필 사용")
+    data = parser.add_argument_group("user data backup")
+    data.add_argument("--export-data", metavar="FILE", help="사용자 데이터를 압축 NDJSON 으로 내보내기 (.ndjson.gz 또는 .ndjson.zst)")
+    data.add_argument("--import-data", metavar="FILE", help="백업 파일을 검증한 뒤 가져오기 (브라우저를 닫은 상태에서)")
+    data.add_argument("--data-kinds", type=_data_kinds_arg, default=list(BACKUP_KINDS),
+                      help="대상 종류 (쉼표 구분: settings,bookmarks,history,session)")
+    data.add_argument("--data-dir", help="기본 대신 사용할 사용자 데이터 폴더")
+    bench = parser.add_argument_group("benchmark")
+    bench.add_argument("--bench-pageload", action="store_true", help="오프스크린 페이지 로드 벤치마크 실행")
+    bench.add_argument("--bench-cycles", type=int, default=50, help="측정할 탭 생성/로드/닫기 횟수")
+    bench.add_argument("--bench-warmup", type=int, default=3, help="측정에서 제외할 준비 횟수")
+    bench.add_argument("--bench-pages", type=int, default=12, help="합성 페이지 종류 수")
+    bench.add_argument("--bench-timeout", type=int, default=30, help="페이지당 로드 제한 시간(초)")
+    bench.add_argument("--bench-out", default="bench_pageload.json", help="페이지 로드 결과 JSON 경로")
+    bench.add_argument("--bench-seed-history", type=int, default=0,
+                       help="시작 전에 채워 둘 합성 방문 기록 수 (큰 기록에서 창이 뜨는 시간 측정)")
+    bench.add_argument("--bench-baseline", help="비교할 이전 결과 JSON (p50/p90 10%% 초과 저하 시 종료 코드 1)")
+    bench.add_argument("--bench-storage", action="store_true", help="저장/조회 계층 마이크로벤치마크 실행")
+    bench.add_argument("--bench-storage-out", default="bench_storage.json", help="저장/조회 결과 JSON 경로")
+    bench.add_argument("--bench-history-sizes", type=_int_list, default=[1000, 10000, 100000],
+                       help="방문 기록 데이터 크기 (쉼표 구분)")
+    bench.add_argument("--bench-bookmark-sizes", type=_int_list, default=[100, 5000, 20000],
+                       help="즐겨찾기 데이터 크기 (쉼표 구분)")
+    bench.add_argument("--bench-history", default=None,
+                       help="실행 결과를 누적할 JSON Lines 파일 (기준 결과가 없으면 직전 실행과 비교)")
+    args, rest = parser.parse_known_args(argv)
+    if args.bench_pageload and args.bench_storage:
+        # 기준 결과(--bench-baseline)는 한 종류에만 맞으므로 한 번에 하나씩 실행
+        parser.error("--bench-pageload 와 --bench-storage 는 따로 실행하세요")
+    return args, rest
+
+def _int_list(text):
+    return [int(part) for part in str(text).split(",") if part.strip()]
+
 def main():
+    args, qt_args = parse_args(sys.argv[1:])
+    if args.bench_pageload or args.bench_storage:
+        report = run_pageload_benchmark(args, qt_args) if args.bench_pageload else run_storage_benchmark(args, qt_args)
+        out_path = args.bench_out if args.bench_pageload else args.bench_storage_out
+        sys.exit(write_benchmark_report(report, out_path, args.bench_baseline, history_path=args.bench_history))
+    if args.render:
+        sys.exit(run_render_batch(args, qt_args))
+    if args.export_data or args.import_data:
+        sys.exit(run_data_command(args))
+
+    if args.trace:
+        TRACE.start()
     configure_chromium_flags()
-    app = QApplication(sys.argv)
+    register_kyo_scheme()
+    app = QApplication([sys.argv[0]] + qt_args)
+    urls = [url_from_argument(arg) for arg in args.urls]
+    instance_server = None
+    if not args.new_instance:
+        # 이미 실행 중이면 URL 만 넘기고 프로필/웹엔진을 띄우기 전에 바로 종료
+        if send_to_running_instance(urls):
+            sys.exit(0)
+        instance_server = SingleInstanceServer()
+        if not instance_server.listen():
+            if instance_server.peer_state == "running":
+                # 막 시작한 인스턴스는 창을 띄운 뒤에야 응답하므로 더 길게 기다려 넘김
+                if send_to_running_instance(urls, INSTANCE_FORWARD_TIMEOUT_MS):
+                    sys.exit(0)
+                # 아이콘/콘솔 없이 실행되는 경우가 많으므로 print 만으로는 조용히 꺼진 것처럼 보임
+                QMessageBox.warning(
+                    None, "Kyo Browser",
+                    "이미 실행 중인 Kyo Browser 가 응답하지 않습니다.\n같은 데이터 폴더를 함께 쓰지 않도록 종료합니다.",
+                )
+                sys.exit(1)
+            QMessageBox.warning(
+                None, "Kyo Browser",
+                f"단일 인스턴스 서버를 열지 못했습니다: {instance_server.server.errorString()}\n"
+                "다른 창에서 연 링크가 이 창으로 전달되지 않습니다.",
+            )
+
     app.setWindowIcon(QIcon(resource_path("kyobrowser.ico")))
-    browser = Browser()
+    browser = Browser(urls)
+    if instance_server:
+        instance_server.urlsReceived.connect(browser.open_external_urls)
     browser.show()
-    sys.exit(app.exec())
+    code = app.exec()
+    if args.trace:
+        TRACE.export(args.trace)
+    sys.exit(code)
 
 if __name__ == "__main__":
     main()